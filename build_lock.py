@@ -0,0 +1,443 @@
+#!/usr/bin/env python3
+"""
+PySide6 Build Lock
+빌드 루트마다 하나의 빌드만 실행되도록 하는 협력형 잠금 도구
+
+잠금 파일(.build.lock)은 소유자 정보를 다 쓴 임시 파일을 hardlink해서 만들고 (빈 잠금 파일이 보이지 않음) 소유자 정보(host, pid, user, 시작 시각, 현재 단계, 진행 상태)와
+heartbeat 시각을 담음. 두 번째 빌드는 실행 중인 빌드를 종료하지 않고 진행 상태를 보여주며 기다렸다가,
+같은 버전/타겟으로 성공한 결과(.build.result.json)가 있으면 다시 빌드하지 않고 재사용함
+
+잠금이 오래된 것으로 보는 경우: heartbeat가 PYSIDE6_BUILD_LOCK_STALE 초 이상 갱신되지 않았거나
+같은 호스트의 소유자 프로세스가 더 이상 없을 때
+
+잠금 파일을 읽고 나서 바꾸거나 지우는 작업(heartbeat, 해제, 오래된 잠금 제거)은 guard 파일(.build.lock.guard)의
+fcntl 잠금 안에서 소유자 id를 다시 확인한 뒤 수행함. 잠금을 다른 빌드에 빼앗기면 빌드를 중단함
+
+Usage: build_lock.py status <build_root>
+       build_lock.py acquire <build_root> [--pid PID] [--policy wait|reuse|fail] [--version V] [--target T ...]
+       build_lock.py heartbeat <build_root> --pid PID
+       build_lock.py release <build_root> [--pid PID] [--status success|failed]
+       build_lock.py break <build_root>
+
+acquire 종료 코드: 0 잠금 획득, 3 완료된 빌드 재사용, 1 실패/시간 초과
+"""
+
+import fcntl
+import getpass
+import json
+import os
+import signal
+import socket
+import sys
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import datetime
+from threading import Event, Lock, Thread
+
+LOCK_NAME = ".build.lock"
+GUARD_NAME = ".build.lock.guard"
+RESULT_NAME = ".build.result.json"
+
+HEARTBEAT_INTERVAL = float(os.environ.get("PYSIDE6_BUILD_LOCK_HEARTBEAT", "15"))
+STALE_SECONDS = float(os.environ.get("PYSIDE6_BUILD_LOCK_STALE", "180"))
+
+# wait: 끝날 때까지 기다린 뒤 빌드, reuse: 기다린 뒤 같은 빌드가 성공했으면 재사용, fail: 바로 실패
+POLICY = os.environ.get("PYSIDE6_BUILD_LOCK_POLICY", "reuse")
+
+# 최대 대기 시간 (초, 0 = 제한 없음)
+WAIT_TIMEOUT = float(os.environ.get("PYSIDE6_BUILD_LOCK_TIMEOUT", "0"))
+
+# 대기 중 실행 중인 빌드의 진행 상태를 보여주는 간격 (초)
+ATTACH_INTERVAL = float(os.environ.get("PYSIDE6_BUILD_LOCK_ATTACH_INTERVAL", "60"))
+
+POLL_INTERVAL = 2.0
+
+def lock_path(build_root):
+    return os.path.join(build_root, LOCK_NAME)
+
+def result_path(build_root):
+    return os.path.join(build_root, RESULT_NAME)
+
+class BuildLockLost(RuntimeError):
+    """잠금을 다른 빌드가 가져감 (이 빌드는 더 이상 빌드 루트를 쓰면 안 됨)"""
+
+@contextmanager
+def lock_guard(build_root):
+    """잠금 파일 확인 + 변경을 다른 프로세스와 겹치지 않게 하는 guard (guard 파일은 지우지 않음)"""
+    os.makedirs(build_root, exist_ok=True)
+    fd = os.open(os.path.join(build_root, GUARD_NAME), os.O_CREAT | os.O_RDWR, 0o644)
+    try:
+        fcntl.lockf(fd, fcntl.LOCK_EX)
+        yield
+    finally:
+        os.close(fd)
+
+def _read_json(path):
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return None
+
+def _write_json(path, data):
+    tmp = f"{path}.tmp-{os.getpid()}"
+    with open(tmp, "w") as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp, path)
+
+def read_owner(build_root):
+    return _read_json(lock_path(build_root))
+
+def read_result(build_root):
+    return _read_json(result_path(build_root))
+
+def pid_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+def stale_reason(build_root, owner):
+    """잠금이 오래되었으면 이유 문자열, 유효하면 None"""
+    path = lock_path(build_root)
+    if owner is None:
+        # 잠금 파일은 항상 내용을 다 쓴 뒤에 생기므로 깨진 파일 (오래되었을 때만 제거)
+        try:
+            age = time.time() - os.path.getmtime(path)
+        except FileNotFoundError:
+            return None
+        return f"unreadable lock file ({age:.0f}s old)" if age > STALE_SECONDS else None
+
+    if owner.get("host") == socket.gethostname() and owner.get("pid") and not pid_alive(owner["pid"]):
+        return f"owner process {owner['pid']} is gone"
+    age = time.time() - owner.get("heartbeat", 0)
+    if age > STALE_SECONDS:
+        return f"no heartbeat for {age:.0f}s"
+    return None
+
+def break_lock(build_root, expected_id=None):
+    """오래된 잠금 제거 - 지금 잠금의 소유자 id가 expected_id일 때만 (None은 내용을 읽을 수 없는 잠금)
+
+    그 사이 다른 프로세스가 새로 잡은 잠금은 id가 달라서 건드리지 않음
+    """
+    with lock_guard(build_root):
+        if (read_owner(build_root) or {}).get("id") != expected_id:
+            return False
+        try:
+            os.remove(lock_path(build_root))
+        except FileNotFoundError:
+            return False
+    return True
+
+def child_pids(pid):
+    """pid의 모든 하위 프로세스 (/proc 기준)"""
+    parents = {}
+    for name in os.listdir("/proc"):
+        if not name.isdigit():
+            continue
+        try:
+            with open(f"/proc/{name}/stat", "r") as f:
+                # comm에 공백/괄호가 있을 수 있으므로 마지막 ')' 뒤에서 ppid 읽기
+                ppid = int(f.read().rsplit(")", 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        parents.setdefault(ppid, []).append(int(name))
+
+    children = []
+    pending = [pid]
+    while pending:
+        for child in parents.get(pending.pop(), []):
+            children.append(child)
+            pending.append(child)
+    return children
+
+def terminate_process_tree(pid, include_self=True):
+    """pid와 하위 프로세스 모두에 SIGTERM (현재 프로세스는 제외)
+
+    하위 프로세스 목록은 먼저 구하고 (부모가 끝나면 init으로 넘어감), 부모가 다음 명령을 실행하지 않도록 부모부터 종료
+    """
+    pids = ([pid] if include_self else []) + child_pids(pid)
+    for target in pids:
+        if target == os.getpid():
+            continue
+        try:
+            os.kill(target, signal.SIGTERM)
+        except ProcessLookupError:
+            pass
+
+def describe_owner(owner):
+    if not owner:
+        return "unknown owner"
+    started = owner.get("started", "?")
+    return f"{owner.get('user', '?')}@{owner.get('host', '?')} pid {owner.get('pid', '?')} (started {started})"
+
+class BuildLock:
+    """빌드 루트 하나에 대한 잠금
+
+    acquire()는 ("acquired" | "reused" | "busy" | "timeout", 정보) 반환
+    획득한 뒤에는 heartbeat 스레드가 소유자 정보와 진행 상태를 주기적으로 갱신하고,
+    잠금을 빼앗기면 on_lost를 호출 (이후 update()/check()는 BuildLockLost 발생)
+    """
+
+    def __init__(self, build_root, version=None, targets=(), log=print, log_file=None, progress=None, pid=None,
+                 on_lost=None):
+        self.build_root = build_root
+        self.version = version
+        self.targets = sorted(targets)
+        self.log = log
+        self.progress = progress
+        self.on_lost = on_lost
+        self.owner = {
+            "id": uuid.uuid4().hex,
+            "host": socket.gethostname(),
+            "pid": pid or os.getpid(),
+            "user": getpass.getuser(),
+            "started": datetime.now().isoformat(timespec="seconds"),
+            "heartbeat": time.time(),
+            "version": version,
+            "targets": self.targets,
+            "log_file": log_file,
+            "stage": "starting",
+            "progress": None,
+        }
+        self.held = False
+        self.lost = Event()
+        self._lock = Lock()
+        self._stop = Event()
+        self._thread = None
+
+    def _try_create(self):
+        """소유자 정보를 임시 파일에 쓴 뒤 잠금 경로로 hardlink (이미 있으면 실패)
+
+        O_EXCL로 만든 뒤 내용을 쓰면 그 사이 빈 잠금 파일을 다른 프로세스가 깨진 잠금으로 보고 지울 수 있음
+        """
+        os.makedirs(self.build_root, exist_ok=True)
+        tmp = f"{lock_path(self.build_root)}.tmp-{os.getpid()}-{self.owner['id']}"
+        with open(tmp, "w") as f:
+            json.dump(self.owner, f, indent=2)
+        try:
+            os.link(tmp, lock_path(self.build_root))
+        except FileExistsError:
+            return False
+        finally:
+            os.remove(tmp)
+        self.held = True
+        return True
+
+    def reusable_result(self, since):
+        """since 이후 끝난 같은 버전의 성공한 빌드 중 우리 타겟을 모두 포함하는 결과"""
+        result = read_result(self.build_root)
+        if not result or result.get("status") != "success" or result.get("version") != self.version:
+            return None
+        if result.get("finished_at", 0) < since or not set(self.targets) <= set(result.get("targets", [])):
+            return None
+        return result
+
+    def acquire(self, policy=None, timeout=None, heartbeat=True):
+        policy = policy or POLICY
+        timeout = WAIT_TIMEOUT if timeout is None else timeout
+        wait_start = time.time()
+        waited = False
+        last_attach = 0.0
+        last_stage = None
+
+        while True:
+            if self._try_create():
+                if waited and policy == "reuse":
+                    result = self.reusable_result(wait_start)
+                    if result:
+                        self.release(write_result=False)
+                        return "reused", result
+                if heartbeat:
+                    self.start_heartbeat()
+                return "acquired", self.owner
+
+            owner = read_owner(self.build_root)
+            reason = stale_reason(self.build_root, owner)
+            if reason:
+                self.log(f"🧹 Removing stale build lock held by {describe_owner(owner)}: {reason}")
+                break_lock(self.build_root, (owner or {}).get("id"))
+                continue
+
+            if policy == "fail":
+                return "busy", owner
+
+            now = time.time()
+            if not waited:
+                waited = True
+                self.log(f"⏳ Build root {self.build_root} is in use by {describe_owner(owner)}, waiting...")
+                if owner and owner.get("log_file"):
+                    self.log(f"   Log: {owner['log_file']}")
+
+            # 실행 중인 빌드의 진행 상태 표시 (단계가 바뀌거나 ATTACH_INTERVAL마다)
+            if owner and (owner.get("stage") != last_stage or now - last_attach >= ATTACH_INTERVAL):
+                progress = f" - {owner['progress']}" if owner.get("progress") else ""
+                self.log(f"👀 Running build: {owner.get('stage', '?')}{progress}")
+                last_stage, last_attach = owner.get("stage"), now
+
+            if timeout and now - wait_start >= timeout:
+                return "timeout", owner
+            time.sleep(POLL_INTERVAL)
+
+    def check(self):
+        """잠금을 빼앗겼으면 BuildLockLost"""
+        if self.lost.is_set():
+            raise BuildLockLost(f"build lock {lock_path(self.build_root)} was taken over by another build")
+
+    def update(self, stage=None):
+        """현재 단계 기록 (다음 heartbeat를 기다리지 않고 바로 반영), 잠금을 빼앗겼으면 BuildLockLost"""
+        with self._lock:
+            if stage:
+                self.owner["stage"] = stage
+        self.heartbeat()
+        self.check()
+
+    def _mark_lost(self, current):
+        self.held = False
+        self.lost.set()
+        self.log(f"❌ Build lock was taken over by {describe_owner(current)}, aborting this build")
+        if self.on_lost:
+            self.on_lost()
+
+    def heartbeat(self):
+        """소유자 정보 갱신, 다른 프로세스가 잠금을 가져갔으면 on_lost 호출 후 False"""
+        if not self.held:
+            return False
+        with self._lock:
+            with lock_guard(self.build_root):
+                current = read_owner(self.build_root)
+                owned = current is not None and current.get("id") == self.owner["id"]
+                if owned:
+                    self.owner["heartbeat"] = time.time()
+                    if self.progress:
+                        try:
+                            self.owner["progress"] = self.progress()
+                        except Exception:
+                            pass
+                    _write_json(lock_path(self.build_root), self.owner)
+        if not owned:
+            self._mark_lost(current)
+        return owned
+
+    def _heartbeat_loop(self):
+        while not self._stop.wait(HEARTBEAT_INTERVAL):
+            if not self.heartbeat():
+                break
+
+    def start_heartbeat(self):
+        self._thread = Thread(target=self._heartbeat_loop, name="build-lock-heartbeat", daemon=True)
+        self._thread.start()
+
+    def release(self, status="success", write_result=True, **details):
+        """결과를 기록하고 잠금 해제 (우리 잠금일 때만 삭제)"""
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+        self._thread = None
+        if not self.held:
+            return
+
+        if write_result:
+            result = {"status": status, "version": self.version, "targets": self.targets,
+                      "finished": datetime.now().isoformat(timespec="seconds"), "finished_at": time.time(),
+                      "owner": describe_owner(self.owner), "log_file": self.owner.get("log_file")}
+            result.update(details)
+            _write_json(result_path(self.build_root), result)
+
+        with lock_guard(self.build_root):
+            current = read_owner(self.build_root)
+            if current and current.get("id") == self.owner["id"]:
+                os.remove(lock_path(self.build_root))
+        self.held = False
+
+def main():
+    args = sys.argv[1:]
+    if len(args) < 2:
+        print(__doc__.strip())
+        return 1
+
+    command, build_root = args[0], os.path.abspath(args[1])
+    rest = args[2:]
+    options = {"pid": None, "policy": None, "version": None, "status": "success"}
+    targets = []
+    while rest:
+        item = rest.pop(0)
+        if item == "--target" and rest:
+            targets.append(rest.pop(0))
+        elif item.startswith("--") and item[2:] in options and rest:
+            options[item[2:]] = rest.pop(0)
+    pid = int(options["pid"]) if options["pid"] else None
+
+    if command == "status":
+        owner = read_owner(build_root)
+        if owner is None and not os.path.exists(lock_path(build_root)):
+            print("🔓 Not locked")
+        else:
+            reason = stale_reason(build_root, owner)
+            print(f"🔒 Locked by {describe_owner(owner)}" + (f" (stale: {reason})" if reason else ""))
+            if owner:
+                print(json.dumps(owner, indent=2))
+        result = read_result(build_root)
+        if result:
+            print(f"📄 Last result: {result['status']} {result.get('version')} {result.get('finished')}")
+        return 0
+
+    if command == "acquire":
+        # 셸 스크립트용: 잠금은 --pid 프로세스 소유로 기록하고 heartbeat는 'heartbeat' 명령이 담당
+        lock = BuildLock(build_root, options["version"], targets, pid=pid or os.getppid())
+        state, info = lock.acquire(options["policy"], heartbeat=False)
+        if state == "acquired":
+            return 0
+        if state == "reused":
+            print(f"♻️  Reusing build finished at {info.get('finished')} by {info.get('owner')}")
+            return 3
+        print(f"❌ Build lock {state}: {describe_owner(info)}")
+        return 1
+
+    if command == "heartbeat":
+        owner = read_owner(build_root)
+        if not owner or not pid or owner.get("pid") != pid:
+            return 1
+        # --pid 프로세스가 살아있고 잠금이 그 프로세스 것인 동안 heartbeat 갱신
+        owner_id = owner.get("id")
+        while pid_alive(pid):
+            with lock_guard(build_root):
+                current = read_owner(build_root)
+                if current and current.get("id") == owner_id:
+                    current["heartbeat"] = time.time()
+                    _write_json(lock_path(build_root), current)
+            if current is None or current.get("id") != owner_id:
+                # 잠금이 없어졌거나(오래된 잠금으로 제거됨) 빼앗겼으면 빌드 스크립트와 실행 중인 명령 모두 중단
+                # (정상 종료 시에는 빌드 스크립트가 해제 전에 이 프로세스를 먼저 종료함)
+                print(f"❌ Build lock was taken over by {describe_owner(current)}, aborting build {pid}", file=sys.stderr)
+                terminate_process_tree(pid)
+                return 1
+            time.sleep(HEARTBEAT_INTERVAL)
+        return 0
+
+    if command == "release":
+        owner = read_owner(build_root)
+        if not owner or (pid and owner.get("pid") != pid):
+            return 1
+        lock = BuildLock(build_root, owner.get("version"), owner.get("targets", []), pid=owner.get("pid"))
+        lock.owner = owner
+        lock.held = True
+        lock.release(options["status"])
+        return 0
+
+    if command == "break":
+        owner = read_owner(build_root)
+        if break_lock(build_root, (owner or {}).get("id")):
+            print(f"🧹 Removed build lock held by {describe_owner(owner)}")
+        return 0
+
+    print(f"Unknown command: {command}")
+    print(__doc__.strip())
+    return 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,340 @@
+#!/usr/bin/env python3
+"""
+PySide6 Build Metrics
+Python 버전별 빌드 단계 소요 시간을 SQLite에 기록하고 실행 간 추이와 가장 느린 단계를 보고하는 도구
+
+Usage: build_metrics.py report [--db PATH] [--runs N]
+       build_metrics.py slowest [--db PATH] [--runs N] [--limit N]
+       build_metrics.py show [--db PATH] [run_id]
+"""
+
+import os
+import re
+import socket
+import sqlite3
+import statistics
+import sys
+import time
+from contextlib import closing, contextmanager
+from datetime import datetime
+from threading import Lock
+
+DB_PATH = os.environ.get("PYSIDE6_BUILD_METRICS_DB", os.path.expanduser("~/.cache/pyside6-build/metrics.db"))
+
+# 보고서 출력 순서 (목록에 없는 단계는 뒤에 이름순)
+PHASES = ["environment", "wrappers", "configure", "shiboken", "compile", "link", "install",
+          "post_install", "relink", "precompile", "tests", "benchmark"]
+
+# 여러 Python 버전에 공통인 단계의 python_version 값
+ALL_VERSIONS = "all"
+
+# ETA 모듈 이력에 사용하는 최근 실행 수 (증분 빌드는 다시 빌드한 edge만 기록하므로 모듈별 최댓값 사용)
+MODULE_HISTORY_RUNS = int(os.environ.get("PYSIDE6_MODULE_HISTORY_RUNS", "10"))
+
+# 추이 보고에서 이 비율 이상 느려진 단계 표시
+TREND_PERCENT = float(os.environ.get("PYSIDE6_METRICS_TREND_PERCENT", "15"))
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    started TEXT NOT NULL,
+    host TEXT,
+    version TEXT,
+    status TEXT,
+    duration REAL
+);
+CREATE TABLE IF NOT EXISTS phases (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    python_version TEXT NOT NULL,
+    phase TEXT NOT NULL,
+    offset REAL NOT NULL,
+    duration REAL NOT NULL,
+    status TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS phases_run ON phases(run_id);
+CREATE TABLE IF NOT EXISTS modules (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    python_version TEXT NOT NULL,
+    module TEXT NOT NULL,
+    seconds REAL NOT NULL,
+    edges INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS modules_version ON modules(python_version, run_id);
+"""
+
+def format_duration(seconds):
+    """3725 → '1h 02m 05s'"""
+    seconds = int(round(seconds))
+    hours, rest = divmod(seconds, 3600)
+    minutes, seconds = divmod(rest, 60)
+    if hours:
+        return f"{hours}h {minutes:02d}m {seconds:02d}s"
+    if minutes:
+        return f"{minutes}m {seconds:02d}s"
+    return f"{seconds}s"
+
+def phase_order(phase):
+    return (PHASES.index(phase), "") if phase in PHASES else (len(PHASES), phase)
+
+class BuildMetrics:
+    """한 번의 빌드 실행 동안 (python_version, phase) 소요 시간을 모았다가 save()에서 한 번에 기록
+
+    빌드 스레드 여러 개에서 동시에 기록할 수 있음 (SQLite 연결은 save()에서만 사용)
+    """
+
+    def __init__(self, version=None, db_path=None):
+        self.version = version
+        self.db_path = db_path or DB_PATH
+        self.started = datetime.now()
+        self._start = time.monotonic()
+        self._records = []
+        self._modules = {}
+        self._lock = Lock()
+
+    def elapsed(self):
+        return time.monotonic() - self._start
+
+    def add(self, python_version, phase, duration, offset=None, status="ok"):
+        record = {"python_version": python_version, "phase": phase, "duration": duration,
+                  "offset": self.elapsed() - duration if offset is None else offset, "status": status}
+        with self._lock:
+            self._records.append(record)
+        return record
+
+    def add_modules(self, python_version, modules):
+        """ninja 로그 분석 결과의 모듈별 {seconds, edges} 합계 기록 (진행률 ETA 계산용 이력)"""
+        with self._lock:
+            totals = self._modules.setdefault(python_version, {})
+            for name, stats in modules.items():
+                total = totals.setdefault(name, {"seconds": 0.0, "edges": 0})
+                total["seconds"] += stats["seconds"]
+                total["edges"] += stats["edges"]
+
+    @contextmanager
+    def phase(self, python_version, phase):
+        """with metrics.phase("3.13.2", "install") as record: ... (record["status"] = "failed" 로 실패 표시)"""
+        record = {"status": "ok"}
+        offset = self.elapsed()
+        start = time.monotonic()
+        try:
+            yield record
+        except BaseException:
+            record["status"] = "failed"
+            raise
+        finally:
+            self.add(python_version, phase, time.monotonic() - start, offset, record["status"])
+
+    def totals(self, python_version=None):
+        """{phase: seconds} (python_version을 지정하면 해당 버전만)"""
+        totals = {}
+        with self._lock:
+            for record in self._records:
+                if python_version is None or record["python_version"] == python_version:
+                    totals[record["phase"]] = totals.get(record["phase"], 0.0) + record["duration"]
+        return totals
+
+    def version_totals(self):
+        """{python_version: seconds} (공통 단계 제외)"""
+        totals = {}
+        with self._lock:
+            for record in self._records:
+                if record["python_version"] != ALL_VERSIONS:
+                    totals[record["python_version"]] = totals.get(record["python_version"], 0.0) + record["duration"]
+        return totals
+
+    def save(self, status):
+        """실행 결과를 DB에 기록하고 run id 반환"""
+        os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
+        with self._lock:
+            records = list(self._records)
+            modules = [(python_version, name, round(stats["seconds"], 3), stats["edges"])
+                       for python_version, totals in self._modules.items() for name, stats in totals.items()]
+        with closing(connect(self.db_path)) as db, db:
+            cursor = db.execute("INSERT INTO runs (started, host, version, status, duration) VALUES (?, ?, ?, ?, ?)",
+                                (self.started.isoformat(timespec="seconds"), socket.gethostname(), self.version,
+                                 status, round(self.elapsed(), 3)))
+            run_id = cursor.lastrowid
+            db.executemany("INSERT INTO phases (run_id, python_version, phase, offset, duration, status) "
+                           "VALUES (?, ?, ?, ?, ?, ?)",
+                           [(run_id, r["python_version"], r["phase"], round(r["offset"], 3), round(r["duration"], 3),
+                             r["status"]) for r in records])
+            db.executemany("INSERT INTO modules (run_id, python_version, module, seconds, edges) VALUES (?, ?, ?, ?, ?)",
+                           [(run_id,) + module for module in modules])
+        return run_id
+
+# setup.py build 출력 한 줄 → 단계 (--verbose-build 기준, 매칭되지 않는 줄은 현재 단계 유지)
+_OUTPUT_PHASE_RULES = [
+    ("shiboken", re.compile(r"Running generator for|Generating \S+ (?:wrapper|binding)s?|\bshiboken6(?:\.exe)?\s+--")),
+    ("link", re.compile(r"Linking CXX|\s-shared\s(?:.*\s)?-o\s")),
+    ("compile", re.compile(r"Building CXX object|\s-c\s+\S+\.(?:cpp|cxx|cc|c)\b")),
+    ("configure", re.compile(r"^-- |CMake (?:Warning|Error)|^Configuring |cmake\s+-[GS]")),
+]
+
+def classify_output_line(line):
+    for phase, pattern in _OUTPUT_PHASE_RULES:
+        if pattern.search(line):
+            return phase
+    return None
+
+class OutputPhaseTimer:
+    """스트리밍 출력에서 configure/shiboken/compile/link 구간을 나눠 metrics에 기록
+
+    ninja는 여러 단계를 동시에 실행하므로 마지막으로 분류된 줄의 단계에 경과 시간을 붙이는 근사치
+    """
+
+    def __init__(self, metrics, python_version, initial_phase="configure"):
+        self.metrics = metrics
+        self.python_version = python_version
+        self.current = initial_phase
+        self.totals = {}
+        self._offset = metrics.elapsed() if metrics else 0.0
+        self._mark = time.monotonic()
+
+    def feed(self, line):
+        phase = classify_output_line(line)
+        if phase and phase != self.current:
+            now = time.monotonic()
+            self.totals[self.current] = self.totals.get(self.current, 0.0) + now - self._mark
+            self.current, self._mark = phase, now
+
+    def close(self, status="ok"):
+        now = time.monotonic()
+        self.totals[self.current] = self.totals.get(self.current, 0.0) + now - self._mark
+        self._mark = now
+        if self.metrics:
+            for phase, duration in self.totals.items():
+                self.metrics.add(self.python_version, phase, duration, self._offset, status)
+        return self.totals
+
+def connect(db_path=None):
+    db = sqlite3.connect(db_path or DB_PATH, timeout=30)
+    db.executescript(_SCHEMA)
+    return db
+
+def load_module_history(python_version, db_path=None, runs=None):
+    """최근 runs개 실행에서 기록된 python_version의 모듈별 최댓값 {module: {seconds, edges}} (없으면 빈 딕셔너리)
+
+    증분 빌드 기록에는 다시 빌드한 edge만 있으므로 가장 최근 실행 대신 최댓값으로 전체 빌드 비용을 추정
+    """
+    db_path = db_path or DB_PATH
+    if not os.path.exists(db_path):
+        return {}
+    try:
+        with closing(connect(db_path)) as db:
+            rows = db.execute("SELECT module, MAX(seconds), MAX(edges) FROM modules WHERE python_version = ? AND run_id IN "
+                              "(SELECT DISTINCT run_id FROM modules WHERE python_version = ? ORDER BY run_id DESC LIMIT ?) "
+                              "GROUP BY module",
+                              (python_version, python_version, runs or MODULE_HISTORY_RUNS)).fetchall()
+    except sqlite3.Error:
+        return {}
+    return {module: {"seconds": seconds, "edges": edges} for module, seconds, edges in rows}
+
+def recent_runs(db, runs):
+    return db.execute("SELECT id, started, version, status, duration FROM runs ORDER BY id DESC LIMIT ?",
+                      (runs,)).fetchall()[::-1]
+
+def phase_history(db, run_ids):
+    """{(python_version, phase): [seconds per run, run 순서]} (한 실행 안의 같은 단계는 합산)"""
+    history = {}
+    if not run_ids:
+        return history
+    placeholders = ",".join("?" * len(run_ids))
+    rows = db.execute(f"SELECT run_id, python_version, phase, SUM(duration) FROM phases "
+                      f"WHERE run_id IN ({placeholders}) GROUP BY run_id, python_version, phase ORDER BY run_id",
+                      run_ids).fetchall()
+    for run_id, python_version, phase, duration in rows:
+        history.setdefault((python_version, phase), []).append(duration)
+    return history
+
+def print_trends(db, runs):
+    rows = recent_runs(db, runs)
+    if not rows:
+        print("No build metrics recorded yet")
+        return 1
+
+    print(f"📈 Last {len(rows)} build(s):")
+    for run_id, started, version, status, duration in rows:
+        print(f"   #{run_id:<5} {started}  {version or '?':<8} {status or '?':<8} {format_duration(duration or 0)}")
+
+    history = phase_history(db, [row[0] for row in rows])
+    print(f"\n{'python':<8} {'phase':<14} {'last':>10} {'median':>10} {'trend':>8}")
+    for (python_version, phase), durations in sorted(history.items(), key=lambda i: (i[0][0], phase_order(i[0][1]))):
+        last = durations[-1]
+        previous = durations[:-1]
+        trend = ""
+        if previous and statistics.median(previous) > 0:
+            percent = (last - statistics.median(previous)) * 100.0 / statistics.median(previous)
+            trend = f"{percent:+.0f}%" + (" ⚠️" if percent >= TREND_PERCENT else "")
+        print(f"{python_version:<8} {phase:<14} {format_duration(last):>10} "
+              f"{format_duration(statistics.median(durations)):>10} {trend:>8}")
+    return 0
+
+def print_slowest(db, runs, limit):
+    rows = recent_runs(db, runs)
+    history = phase_history(db, [row[0] for row in rows])
+    if not history:
+        print("No build metrics recorded yet")
+        return 1
+
+    ranked = sorted(history.items(), key=lambda item: statistics.mean(item[1]), reverse=True)[:limit]
+    total = sum(statistics.mean(durations) for durations in history.values())
+    print(f"🐢 Slowest phases over the last {len(rows)} build(s):")
+    for (python_version, phase), durations in ranked:
+        mean = statistics.mean(durations)
+        print(f"   {python_version:<8} {phase:<14} mean {format_duration(mean):>10} "
+              f"max {format_duration(max(durations)):>10} ({mean * 100.0 / total:4.1f}% of build time)")
+    return 0
+
+def print_run(db, run_id=None):
+    row = db.execute("SELECT id, started, version, status, duration FROM runs WHERE id = ?" if run_id else
+                     "SELECT id, started, version, status, duration FROM runs ORDER BY id DESC LIMIT 1",
+                     (run_id,) if run_id else ()).fetchone()
+    if not row:
+        print("Build run not found")
+        return 1
+
+    print(f"🏗️  Build #{row[0]} {row[1]} {row[2] or '?'} {row[3] or '?'} ({format_duration(row[4] or 0)})")
+    phases = db.execute("SELECT python_version, phase, offset, duration, status FROM phases WHERE run_id = ? "
+                        "ORDER BY offset", (row[0],)).fetchall()
+    for python_version, phase, offset, duration, status in phases:
+        marker = "" if status == "ok" else f" ({status})"
+        print(f"   +{format_duration(offset):>10}  {python_version:<8} {phase:<14} {format_duration(duration):>10}{marker}")
+    return 0
+
+def main():
+    args = sys.argv[1:]
+    if not args:
+        print(__doc__.strip())
+        return 1
+
+    command = args.pop(0)
+    db_path, runs, limit, run_id = None, 10, 10, None
+    while args:
+        item = args.pop(0)
+        if item == "--db" and args:
+            db_path = args.pop(0)
+        elif item == "--runs" and args:
+            runs = int(args.pop(0))
+        elif item == "--limit" and args:
+            limit = int(args.pop(0))
+        elif item.isdigit():
+            run_id = int(item)
+
+    if not os.path.exists(db_path or DB_PATH):
+        print(f"No build metrics database: {db_path or DB_PATH}")
+        return 1
+
+    with closing(connect(db_path)) as db:
+        if command == "report":
+            return print_trends(db, runs)
+        if command == "slowest":
+            return print_slowest(db, runs, limit)
+        if command == "show":
+            return print_run(db, run_id)
+
+    print(f"Unknown command: {command}")
+    print(__doc__.strip())
+    return 1
+
+if __name__ == "__main__":
+    sys.exit(main())
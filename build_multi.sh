@@ -84,29 +84,27 @@ format_duration() {
     fi
 }
 
-# Enhanced error detection and cleanup
-detect_and_terminate_builds() {
-    stage "Checking for running build processes..."
-    
-    local terminated_count=0
-    local pids=$(ps aux | grep -E "(rez-build|setup\.py|cmake|ninja)" | grep -v grep | grep -i pyside | awk '{print $2}' || true)
-    
-    if [ -n "$pids" ]; then
-        warning "Found running build processes, terminating..."
-        for pid in $pids; do
-            if kill -TERM "$pid" 2>/dev/null; then
-                sleep 5
-                if kill -0 "$pid" 2>/dev/null; then
-                    kill -KILL "$pid" 2>/dev/null || true
-                fi
-                terminated_count=$((terminated_count + 1))
-            fi
-        done
-        success "Terminated $terminated_count running build process(es)"
-        sleep 3
-    else
-        success "No conflicting build processes found"
+# Coordinate with other builds of the same build root through build_lock.py
+# (wait for a running build instead of killing it, reuse its result if it already succeeded)
+acquire_build_lock() {
+    stage "Acquiring build lock..."
+    
+    local lock_status=0
+    python3 "$BASE_DIR/build_lock.py" acquire "$BUILD_BASE_DIR" --pid $$ --version "$PYSIDE_VERSION" || lock_status=$?
+    if [ $lock_status -eq 3 ]; then
+        success "Another build already finished PySide6 $PYSIDE_VERSION, nothing to do"
+        exit 0
+    elif [ $lock_status -ne 0 ]; then
+        error "Could not acquire build lock: $BUILD_BASE_DIR"
+        exit 1
     fi
+    
+    # heartbeat keeps the lock fresh while this script runs, release records the result on exit
+    # (stop the heartbeat first: it treats a lock that disappears under it as a takeover)
+    python3 "$BASE_DIR/build_lock.py" heartbeat "$BUILD_BASE_DIR" --pid $$ &
+    lock_heartbeat_pid=$!
+    trap 'lock_exit=$?; kill $lock_heartbeat_pid 2>/dev/null; wait $lock_heartbeat_pid 2>/dev/null; python3 "$BASE_DIR/build_lock.py" release "$BUILD_BASE_DIR" --pid $$ --status "$([ $lock_exit -eq 0 ] && echo success || echo failed)"' EXIT
+    success "Build lock acquired: $BUILD_BASE_DIR/.build.lock"
 }
 
 # Find specific rez Python version
@@ -228,6 +226,9 @@ setup_build_environment() {
     export QMAKE="$QT_DIR/bin/qmake"
     export QT_QMAKE_EXECUTABLE="$QT_DIR/bin/qmake"
     
+    # Compiler cache (ccache) in front of CC/CXX when available
+    eval "$(python3 "$BASE_DIR/compiler_cache.py" env "$SOURCE_DIR")"
+    
     success "Build environment configured for Python $python_version"
 }
 
@@ -257,7 +258,7 @@ build_pyside6_for_version() {
     # build.sh에서 성공한 setup.py 명령어
     if "$python_exe" setup.py build \
         --qmake "$QT_DIR/bin/qmake" \
-        --jobs $(nproc) \
+        --jobs "$(python3 "$BASE_DIR/job_throttle.py" jobs 2>/dev/null || nproc)" \
         --verbose-build; then
         
         success "Build completed successfully for Python $python_version"
@@ -580,6 +581,7 @@ show_build_summary() {
     echo -e "${WHITE}📊 Multi-Python PySide6 Build Summary${NC}"
     echo "═══════════════════════════════════════════════════════════════"
     echo -e "Duration: ${CYAN}$duration_str${NC}"
+    python3 "$BASE_DIR/compiler_cache.py" stats
     echo -e "Total Python versions: ${BLUE}${#PYTHON_VERSIONS[@]}${NC}"
     echo -e "Successful builds: ${GREEN}${#SUCCESSFUL_BUILDS[@]}${NC}"
     echo -e "Failed builds: ${RED}${#FAILED_BUILDS[@]}${NC}"
@@ -627,7 +629,8 @@ main() {
     log "🎯 Total versions to build: ${#PYTHON_VERSIONS[@]}"
     
     # Preliminary checks
-    detect_and_terminate_builds
+    acquire_build_lock
+    python3 "$BASE_DIR/compiler_cache.py" zero
     
     # Verify source directory
     if [ ! -d "$SOURCE_DIR" ]; then
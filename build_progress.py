@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+PySide6 Build Progress
+동시에 실행되는 Python 버전별 빌드 출력에서 NINJA_STATUS "[finished/total] " prefix를 읽어
+버전마다 한 줄짜리 진행 상태와 남은 시간 추정치를 만드는 모듈
+
+ETA는 이전 빌드의 모듈별 CPU 시간 (build_metrics.py 모듈 이력)을 기준으로 계산하고,
+이력이 없으면 현재 ninja 실행의 edge 처리 속도로 추정
+"""
+
+import os
+import re
+import time
+from threading import Lock
+
+from build_metrics import format_duration
+from ninja_log_analyzer import target_module
+
+# 진행 상태 출력 간격 (초)
+REPORT_INTERVAL = float(os.environ.get("PYSIDE6_PROGRESS_INTERVAL", "30"))
+
+NINJA_STATUS_PATTERN = re.compile(r"^\[(\d+)/(\d+)\] ")
+
+class BuildProgress:
+    """한 Python 버전 빌드의 진행 상태
+
+    setup.py는 하위 프로젝트마다 ninja를 따로 실행하므로 total이 바뀌거나 finished가 줄면
+    새 ninja 실행으로 보고 이전 실행의 완료 edge 수를 누적
+    """
+
+    def __init__(self, python_version, history=None):
+        self.python_version = python_version
+        self.history = history or {}
+        self.restart()
+
+    def restart(self):
+        """새 빌드 시도 시작 (이전 시도의 edge 수/모듈 진행률/경과 시간은 ETA에서 제외)"""
+        self.finished = 0
+        self.total = 0
+        self.previous_edges = 0
+        self.module = None
+        self.module_edges = {}
+        self.started = None
+        self.state = "waiting"
+        self.duration = None
+
+    def feed(self, line):
+        """출력 한 줄 처리, NINJA_STATUS 줄이면 True"""
+        match = NINJA_STATUS_PATTERN.match(line)
+        if not match:
+            return False
+
+        finished, total = int(match.group(1)), int(match.group(2))
+        if total != self.total or finished < self.finished:
+            self.previous_edges += self.finished
+        self.finished, self.total = finished, total
+
+        if self.started is None:
+            self.started = time.monotonic()
+        self.state = "building"
+
+        module = target_module(line)
+        if module:
+            self.module = module
+            self.module_edges[module] = self.module_edges.get(module, 0) + 1
+        return True
+
+    def close(self, ok=True):
+        self.state = "done" if ok else "failed"
+        if self.started is not None:
+            self.duration = time.monotonic() - self.started
+
+    def elapsed(self):
+        return time.monotonic() - self.started if self.started is not None else 0.0
+
+    def eta(self):
+        """(남은 초, 추정 방식) 또는 (None, None)"""
+        elapsed = self.elapsed()
+        if self.state != "building" or elapsed <= 0:
+            return None, None
+
+        # 모듈별 이력: 완료 비율만큼 CPU 시간을 처리했다고 보고 지금까지의 처리 속도로 나머지를 계산
+        # (출력에서 모듈을 알 수 없는 edge가 있는 모듈은 전체 edge 진행률 사용)
+        if self.history:
+            total_seconds = sum(stats["seconds"] for stats in self.history.values())
+            total_edges = sum(stats["edges"] for stats in self.history.values())
+            overall = min(1.0, (self.previous_edges + self.finished) / total_edges) if total_edges else 0.0
+            done_seconds = 0.0
+            for name, stats in self.history.items():
+                if name in self.module_edges and stats["edges"]:
+                    done_seconds += stats["seconds"] * min(1.0, self.module_edges[name] / stats["edges"])
+                else:
+                    done_seconds += stats["seconds"] * overall
+            if done_seconds > 0:
+                return max(0.0, total_seconds - done_seconds) * elapsed / done_seconds, "history"
+
+        # 이력이 없으면 현재 ninja 실행의 edge 처리 속도 기준 (이후 하위 프로젝트는 포함 안 됨)
+        if self.finished:
+            return elapsed * (self.total - self.finished) / self.finished, "rate"
+        return None, None
+
+    def status_line(self):
+        if self.state == "waiting":
+            return f"{self.python_version} waiting"
+        if self.state in ("done", "failed"):
+            icon = "✅" if self.state == "done" else "❌"
+            return f"{self.python_version} {icon} {self.state} in {format_duration(self.duration or 0)}"
+
+        percent = self.finished * 100 // self.total if self.total else 0
+        text = f"{self.python_version} [{self.finished}/{self.total}] {percent}%"
+        if self.module:
+            text += f" {self.module}"
+        remaining, method = self.eta()
+        if remaining is not None:
+            text += f" ETA {'~' if method == 'rate' else ''}{format_duration(remaining)}"
+        return text
+
+class ProgressBoard:
+    """모든 버전의 진행 상태를 모아 REPORT_INTERVAL마다 한 줄로 출력"""
+
+    def __init__(self, log=print, interval=None, history_loader=None):
+        self.log = log
+        self.interval = REPORT_INTERVAL if interval is None else interval
+        self.history_loader = history_loader
+        self.trackers = {}
+        self._last_report = 0.0
+        self._lock = Lock()
+
+    def tracker(self, python_version):
+        """python_version 진행 상태 (재시도 시 같은 객체 재사용)"""
+        with self._lock:
+            if python_version not in self.trackers:
+                history = self.history_loader(python_version) if self.history_loader else None
+                self.trackers[python_version] = BuildProgress(python_version, history)
+            return self.trackers[python_version]
+
+    def register(self, python_versions):
+        """빌드할 버전을 미리 등록 (출력이 나오기 전까지 waiting으로 표시)"""
+        for python_version in python_versions:
+            self.tracker(python_version)
+
+    def restart(self, python_version):
+        self.tracker(python_version).restart()
+
+    def feed(self, python_version, line):
+        if self.tracker(python_version).feed(line):
+            self.report()
+
+    def close(self, python_version, ok=True):
+        self.tracker(python_version).close(ok)
+        self.report(force=True)
+
+    def status_line(self):
+        with self._lock:
+            trackers = list(self.trackers.values())
+        return " | ".join(tracker.status_line() for tracker in trackers)
+
+    def report(self, force=False):
+        now = time.monotonic()
+        with self._lock:
+            if not force and now - self._last_report < self.interval:
+                return
+            self._last_report = now
+        self.log(f"📈 {self.status_line()}")
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+PySide6 Compiler Cache
+빌드 스크립트들이 공유하는 ccache 기반 컴파일러 캐시 설정 도구
+"""
+
+import os
+import re
+import shutil
+import subprocess
+import sys
+
+# 기본 캐시 설정
+CACHE_DIR = os.environ.get("PYSIDE6_COMPILER_CACHE_DIR", os.path.expanduser("~/.cache/pyside6-ccache"))
+CACHE_MAX_SIZE = os.environ.get("PYSIDE6_COMPILER_CACHE_SIZE", "50G")
+
+# ccache -s 출력(3.x)과 --print-stats 키(4.x) 매핑
+_STATS_KEYS = {
+    "hits": ("direct_cache_hit", "preprocessed_cache_hit"),
+    "misses": ("cache_miss",),
+}
+_LEGACY_STATS_PATTERNS = {
+    "hits": re.compile(r"^cache hit \((?:direct|preprocessed)\)\s+(\d+)", re.MULTILINE),
+    "misses": re.compile(r"^cache miss\s+(\d+)", re.MULTILINE),
+}
+
+def find_ccache():
+    """PATH에서 ccache 실행 파일 찾기 (비활성화 시 None)"""
+    if os.environ.get("PYSIDE6_COMPILER_CACHE", "1") != "1":
+        return None
+    return shutil.which("ccache")
+
+def compiler_cache_base_dir(source_dir):
+    """소스 트리와 setup.py 빌드 트리(source_dir/../build/qfp-py3.X-*)를 모두 포함하는 공통 상위 디렉토리"""
+    source_dir = os.path.realpath(source_dir)
+    build_dir = os.path.realpath(os.path.join(source_dir, "..", "build"))
+    return os.path.commonpath([source_dir, build_dir])
+
+def compiler_cache_environment(source_dir):
+    """CMake가 컴파일러 앞에 ccache를 두도록 하는 환경 변수 (source_dir: pyside-setup 소스 디렉토리)"""
+    ccache = find_ccache()
+    if not ccache:
+        return {}
+
+    os.makedirs(CACHE_DIR, exist_ok=True)
+
+    return {
+        # CMake 3.17+ 는 환경 변수를 기본 compiler launcher로 사용
+        "CMAKE_C_COMPILER_LAUNCHER": ccache,
+        "CMAKE_CXX_COMPILER_LAUNCHER": ccache,
+        "CCACHE_DIR": CACHE_DIR,
+        "CCACHE_MAXSIZE": CACHE_MAX_SIZE,
+        # py3.X 빌드 디렉토리끼리 캐시를 공유하도록 절대 경로를 BASEDIR 기준 상대 경로로 변환
+        # ccache는 BASEDIR 아래 경로만 다시 쓰는데 setup.py는 소스 밖(src/../build/qfp-py3.X-*)에서 컴파일하므로
+        # 소스 디렉토리가 아니라 두 트리의 공통 상위 디렉토리를 사용 (그래야 -I/-o 의 빌드 경로도 상대 경로가 됨)
+        "CCACHE_BASEDIR": compiler_cache_base_dir(source_dir),
+        "CCACHE_NOHASHDIR": "1",
+        # 같은 경로의 다른 컴파일러(gcc-toolset-13 / rez gcc)를 구분
+        "CCACHE_COMPILERCHECK": "content",
+        # C_INCLUDE_PATH/CPLUS_INCLUDE_PATH는 ccache가 해시에 포함하므로 헤더 경로 조합별로 분리됨
+    }
+
+def reset_compiler_cache_stats():
+    """빌드 시작 시 hit/miss 통계 초기화"""
+    ccache = find_ccache()
+    if not ccache:
+        return False
+
+    env = dict(os.environ, CCACHE_DIR=CACHE_DIR)
+    result = subprocess.run([ccache, "--zero-stats"], env=env, capture_output=True, text=True)
+    return result.returncode == 0
+
+def compiler_cache_stats():
+    """현재 캐시 통계 (hits, misses, hit_rate) 또는 None"""
+    ccache = find_ccache()
+    if not ccache:
+        return None
+
+    env = dict(os.environ, CCACHE_DIR=CACHE_DIR)
+    stats = {"hits": 0, "misses": 0}
+
+    result = subprocess.run([ccache, "--print-stats"], env=env, capture_output=True, text=True)
+    if result.returncode == 0:
+        values = {}
+        for line in result.stdout.splitlines():
+            parts = line.split("\t")
+            if len(parts) == 2 and parts[1].isdigit():
+                values[parts[0]] = int(parts[1])
+        for stat, keys in _STATS_KEYS.items():
+            stats[stat] = sum(values.get(key, 0) for key in keys)
+    else:
+        # ccache 3.x 는 --print-stats 미지원
+        result = subprocess.run([ccache, "-s"], env=env, capture_output=True, text=True)
+        for stat, pattern in _LEGACY_STATS_PATTERNS.items():
+            stats[stat] = sum(int(value) for value in pattern.findall(result.stdout))
+
+    total = stats["hits"] + stats["misses"]
+    stats["hit_rate"] = (stats["hits"] * 100.0 / total) if total else 0.0
+    return stats
+
+def format_compiler_cache_stats(stats):
+    if stats is None:
+        return "disabled (ccache not found)"
+    return f"{stats['hits']} hits / {stats['misses']} misses ({stats['hit_rate']:.1f}% hit rate)"
+
+def main():
+    command = sys.argv[1] if len(sys.argv) > 1 else "stats"
+
+    if command == "stats":
+        print(f"🗄️  Compiler cache: {format_compiler_cache_stats(compiler_cache_stats())}")
+    elif command == "zero":
+        reset_compiler_cache_stats()
+    elif command == "env":
+        # 셸 스크립트용: eval "$(python3 compiler_cache.py env <source_dir>)"
+        source_dir = sys.argv[2] if len(sys.argv) > 2 else os.getcwd()
+        for key, value in compiler_cache_environment(source_dir).items():
+            print(f'export {key}="{value}"')
+    else:
+        print(f"Unknown command: {command}")
+        print("Usage: python3 compiler_cache.py [stats|zero|env <source_dir>]")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -8,6 +8,8 @@ import sys
 import shutil
 from pathlib import Path
 
+from compiler_cache import compiler_cache_environment, reset_compiler_cache_stats, compiler_cache_stats, format_compiler_cache_stats
+
 def main():
     print("🛠️  Complete PySide6 Build (using build.sh proven approach)")
     print("=" * 70)
@@ -137,6 +139,10 @@ exec {shiboken_dir}/bin/shiboken6 $EXTRA_ARGS "$@"
     env["PYSIDE_BUILD_DIR"] = str(build_dir)
     env["PYSIDE_INSTALL_DIR"] = str(install_dir)
     
+    # Put ccache in front of the compilers when available
+    env.update(compiler_cache_environment(str(source_dir)))
+    reset_compiler_cache_stats()
+    
     print("🔧 Starting PySide6 build with all modules...")
     
     try:
@@ -156,6 +162,7 @@ exec {shiboken_dir}/bin/shiboken6 $EXTRA_ARGS "$@"
             return 1
             
         print("✅ Build completed successfully")
+        print(f"🗄️  Compiler cache: {format_compiler_cache_stats(compiler_cache_stats())}")
         
     except Exception as e:
         print(f"❌ Build failed: {e}")
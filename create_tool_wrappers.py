@@ -4,14 +4,151 @@ PySide6 Tool Wrappers Creator
 _pyside6 스타일의 사용자 친화적 래퍼 스크립트들을 생성하는 도구
 """
 
+import glob
 import os
+import shlex
+import shutil
 import stat
+import subprocess
+import sys
+import tempfile
 from pathlib import Path
 
+from install_manifest import InstallManifest, format_manifest_stats
+
 # 기본 경로 설정
 PYSIDE6_ROOT = "/core/Linux/APPZ/packages/pyside6/6.9.1"
 BIN_DIR = f"{PYSIDE6_ROOT}/bin"
-PYTHON3_13_SITE_PACKAGES = f"{PYSIDE6_ROOT}/lib/python3.13/site-packages"
+
+# 실행 권한 (rwxr-xr-x)
+EXECUTABLE_MODE = stat.S_IRWXU | stat.S_IRGRP | stat.S_IXGRP | stat.S_IROTH | stat.S_IXOTH
+
+# Python 스크립트 도구들이 공유하는 native launcher (argv[0] 이름으로 스크립트 선택)
+LAUNCHER_NAME = ".pyside6-launcher"
+DEFAULT_PYTHON_VERSION = "3.13"
+
+def built_site_packages(install_root):
+    """(Python 버전, site-packages) - 실제로 PySide6가 설치된 버전 중 기본 버전 우선, 없으면 가장 높은 버전"""
+    versions = {}
+    for path in glob.glob(f"{install_root}/lib/python3.*/site-packages/PySide6"):
+        version = os.path.basename(os.path.dirname(os.path.dirname(path)))[len("python"):]
+        versions[version] = os.path.dirname(path)
+    if DEFAULT_PYTHON_VERSION in versions or not versions:
+        return DEFAULT_PYTHON_VERSION, f"{install_root}/lib/python{DEFAULT_PYTHON_VERSION}/site-packages"
+    version = max(versions, key=lambda v: tuple(int(part) for part in v.split(".")))
+    return version, versions[version]
+
+# 도구 링크/스크립트가 가리키는 site-packages (빌드된 버전에서 선택)
+PYTHON_VERSION, SITE_PACKAGES = built_site_packages(PYSIDE6_ROOT)
+
+# 실행 중인 launcher 위치에서 설치 루트를, rez 환경 변수에서 인터프리터/버전을 찾아 바로 exec
+# (bash, PATH의 python3 검색, 버전 감지용 추가 프로세스 없음)
+LAUNCHER_SOURCE = r'''
+#define _GNU_SOURCE
+#include <libgen.h>
+#include <limits.h>
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <unistd.h>
+
+static const char *scripts[][2] = {
+@SCRIPTS@
+    {NULL, NULL}
+};
+
+static const char *python_version(char *buf, size_t size)
+{
+    const char *version = getenv("PYSIDE6_PYTHON_VERSION");
+    const char *major = getenv("REZ_PYTHON_MAJOR_VERSION");
+    const char *minor = getenv("REZ_PYTHON_MINOR_VERSION");
+    if (version && *version)
+        return version;
+    if (major && *major && minor && *minor) {
+        snprintf(buf, size, "%s.%s", major, minor);
+        return buf;
+    }
+    return "@DEFAULT_VERSION@";
+}
+
+int main(int argc, char **argv)
+{
+    char name_buf[PATH_MAX], exe[PATH_MAX], version_buf[32];
+    char site[PATH_MAX], script[PATH_MAX], python[PATH_MAX], pythonpath[PATH_MAX * 4];
+    const char *relative = NULL;
+
+    strncpy(name_buf, argv[0], sizeof(name_buf) - 1);
+    name_buf[sizeof(name_buf) - 1] = 0;
+    const char *name = basename(name_buf);
+    for (int i = 0; scripts[i][0]; i++) {
+        if (strcmp(scripts[i][0], name) == 0) {
+            relative = scripts[i][1];
+            break;
+        }
+    }
+    if (!relative) {
+        fprintf(stderr, "pyside6 launcher: unknown tool '%s'\n", name);
+        return 127;
+    }
+
+    /* <root>/bin/<launcher> */
+    ssize_t len = readlink("/proc/self/exe", exe, sizeof(exe) - 1);
+    if (len < 0) {
+        perror("pyside6 launcher: /proc/self/exe");
+        return 127;
+    }
+    exe[len] = 0;
+    const char *root = dirname(dirname(exe));
+    const char *version = python_version(version_buf, sizeof(version_buf));
+
+    snprintf(site, sizeof(site), "%s/lib/python%s/site-packages", root, version);
+    snprintf(script, sizeof(script), "%s/%s", site, relative);
+
+    const char *old_path = getenv("PYTHONPATH");
+    if (old_path && *old_path)
+        snprintf(pythonpath, sizeof(pythonpath), "%s:%s", site, old_path);
+    else
+        snprintf(pythonpath, sizeof(pythonpath), "%s", site);
+    setenv("PYTHONPATH", pythonpath, 1);
+
+    /* python -s <script> args... (-s: user site-packages 검색 생략, PYTHONPATH는 유지) */
+    char **args = calloc(argc + 3, sizeof(char *));
+    args[1] = "-s";
+    args[2] = script;
+    memcpy(&args[3], &argv[1], (argc - 1) * sizeof(char *));
+
+    const char *python_root = getenv("REZ_PYTHON_ROOT");
+    if (python_root && *python_root) {
+        args[0] = python;
+        snprintf(python, sizeof(python), "%s/bin/python%s", python_root, version);
+        execv(python, args);
+        snprintf(python, sizeof(python), "%s/bin/python3", python_root);
+        execv(python, args);
+    }
+    args[0] = "python3";
+    execvp("python3", args);
+    perror("pyside6 launcher: python3");
+    return 127;
+}
+'''
+
+# 이 도구가 설치한 파일 기록 (변경된 파일만 쓰고 더 이상 만들지 않는 파일은 삭제)
+_manifest = None
+
+def get_manifest():
+    """현재 설치 루트의 manifest (모듈을 import해서 함수만 호출해도 동작하도록 처음 사용할 때 생성)"""
+    global _manifest
+    if _manifest is None:
+        _manifest = InstallManifest(PYSIDE6_ROOT, "tool-wrappers")
+    return _manifest
+
+def set_install_root(install_root):
+    """설치 루트 변경 (rezbuild.py가 스테이징 release 디렉토리에 설치할 때 사용)"""
+    global _manifest, PYSIDE6_ROOT, BIN_DIR, PYTHON_VERSION, SITE_PACKAGES
+    PYSIDE6_ROOT = install_root
+    _manifest = None
+    BIN_DIR = f"{PYSIDE6_ROOT}/bin"
+    PYTHON_VERSION, SITE_PACKAGES = built_site_packages(PYSIDE6_ROOT)
 
 def create_directory():
     """bin 디렉토리 생성"""
@@ -33,59 +170,129 @@ exec python3 "{target_path}" "$@"
 exec "{target_path}" "$@"
 '''
     
-    with open(wrapper_path, 'w') as f:
-        f.write(wrapper_content)
+    # 실행 권한과 함께 설치 (내용이 같으면 건너뜀)
+    result = get_manifest().write_file(wrapper_path, wrapper_content, mode=EXECUTABLE_MODE)
+    if result != "unchanged":
+        print(f"✅ Created wrapper: {tool_name} -> {target_path}")
+
+def create_tool_link(tool_name, target_path):
+    """바이너리 도구는 래퍼 없이 실행 파일로 바로 연결되는 상대 심볼릭 링크로 설치"""
+    link_path = f"{BIN_DIR}/{tool_name}"
+    result = get_manifest().install_symlink(os.path.relpath(target_path, BIN_DIR), link_path)
+    if result != "unchanged":
+        print(f"✅ Linked tool: {tool_name} -> {target_path}")
+
+def find_c_compiler():
+    """컴파일러 명령 (CC는 "ccache gcc"처럼 인자를 포함할 수 있으므로 분리), 없으면 None"""
+    if os.environ.get("CC"):
+        return shlex.split(os.environ["CC"])
+    compiler = shutil.which("cc") or shutil.which("gcc")
+    return [compiler] if compiler else None
+
+def build_launcher(python_scripts):
+    """Python 스크립트 도구용 native launcher 컴파일 후 설치, 실패 시 False"""
+    compiler = find_c_compiler()
+    if not compiler:
+        print("⚠️  No C compiler found, falling back to bash wrappers")
+        return False
+    
+    # 스크립트 경로는 site-packages 기준 상대 경로로 (실행 시 활성 Python 버전의 site-packages에서 찾음)
+    table = "\n".join(
+        f'    {{"{tool_name}", "{os.path.relpath(target_path, SITE_PACKAGES)}"}},'
+        for tool_name, target_path in sorted(python_scripts.items())
+    )
+    source = LAUNCHER_SOURCE.replace("@SCRIPTS@", table).replace("@DEFAULT_VERSION@", PYTHON_VERSION)
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        source_path = os.path.join(tmp_dir, "launcher.c")
+        binary_path = os.path.join(tmp_dir, "launcher")
+        with open(source_path, "w") as f:
+            f.write(source)
+        
+        try:
+            result = subprocess.run(compiler + ["-O2", "-std=c99", "-o", binary_path, source_path],
+                                    capture_output=True, text=True)
+        except OSError as e:
+            print(f"⚠️  Cannot run C compiler {' '.join(compiler)}, falling back to bash wrappers: {e}")
+            return False
+        if result.returncode != 0:
+            print(f"⚠️  Launcher build failed, falling back to bash wrappers: {result.stderr.strip()}")
+            return False
+        
+        get_manifest().install_file(binary_path, f"{BIN_DIR}/{LAUNCHER_NAME}", mode=EXECUTABLE_MODE)
     
-    # 실행 권한 부여
-    os.chmod(wrapper_path, stat.S_IRWXU | stat.S_IRGRP | stat.S_IXGRP | stat.S_IROTH | stat.S_IXOTH)
-    print(f"✅ Created wrapper: {tool_name} -> {target_path}")
+    print(f"✅ Built native launcher: {BIN_DIR}/{LAUNCHER_NAME}")
+    return True
+
+def create_python_tools(python_scripts):
+    """Python 스크립트 도구 설치 (native launcher 링크, 불가능하면 bash 래퍼)"""
+    available = {}
+    for tool_name, target_path in python_scripts.items():
+        if os.path.exists(target_path):
+            available[tool_name] = target_path
+        else:
+            print(f"⚠️  Missing: {target_path}")
+    
+    if available and build_launcher(available):
+        for tool_name in available:
+            if get_manifest().install_symlink(LAUNCHER_NAME, f"{BIN_DIR}/{tool_name}") != "unchanged":
+                print(f"✅ Linked launcher: {tool_name}")
+        return
+    
+    for tool_name, target_path in available.items():
+        create_wrapper_script(tool_name, target_path, "python")
 
 def copy_support_files():
     """지원 파일들과 라이브러리들 복사"""
-    import shutil
-    
     print(f"\n🔧 Copying support files and libraries...")
     
     # Python 스크립트 파일들 직접 복사
     script_files = [
-        ("android_deploy.py", f"{PYTHON3_13_SITE_PACKAGES}/PySide6/scripts/android_deploy.py"),
-        ("deploy.py", f"{PYTHON3_13_SITE_PACKAGES}/PySide6/scripts/deploy.py"),
-        ("metaobjectdump.py", f"{PYTHON3_13_SITE_PACKAGES}/PySide6/scripts/metaobjectdump.py"),
-        ("project.py", f"{PYTHON3_13_SITE_PACKAGES}/PySide6/scripts/project.py"),
-        ("qml.py", f"{PYTHON3_13_SITE_PACKAGES}/PySide6/scripts/qml.py"),
-        ("qtpy2cpp.py", f"{PYTHON3_13_SITE_PACKAGES}/PySide6/scripts/qtpy2cpp.py"),
-        ("pyside_tool.py", f"{PYTHON3_13_SITE_PACKAGES}/PySide6/scripts/pyside_tool.py"),
-        ("shiboken_tool.py", f"{PYTHON3_13_SITE_PACKAGES}/shiboken6_generator/shiboken6"),  # 실제로는 실행파일
-        ("requirements-android.txt", f"{PYTHON3_13_SITE_PACKAGES}/PySide6/scripts/requirements-android.txt"),
+        ("android_deploy.py", f"{SITE_PACKAGES}/PySide6/scripts/android_deploy.py"),
+        ("deploy.py", f"{SITE_PACKAGES}/PySide6/scripts/deploy.py"),
+        ("metaobjectdump.py", f"{SITE_PACKAGES}/PySide6/scripts/metaobjectdump.py"),
+        ("project.py", f"{SITE_PACKAGES}/PySide6/scripts/project.py"),
+        ("qml.py", f"{SITE_PACKAGES}/PySide6/scripts/qml.py"),
+        ("qtpy2cpp.py", f"{SITE_PACKAGES}/PySide6/scripts/qtpy2cpp.py"),
+        ("pyside_tool.py", f"{SITE_PACKAGES}/PySide6/scripts/pyside_tool.py"),
+        ("shiboken_tool.py", f"{SITE_PACKAGES}/shiboken6_generator/shiboken6"),  # 실제로는 실행파일
+        ("requirements-android.txt", f"{SITE_PACKAGES}/PySide6/scripts/requirements-android.txt"),
     ]
     
     for dest_name, source_path in script_files:
         dest_path = f"{BIN_DIR}/{dest_name}"
         if os.path.exists(source_path):
             if dest_name.endswith('.py') or dest_name.endswith('.txt'):
-                shutil.copy2(source_path, dest_path)
-                if dest_name.endswith('.py'):
-                    os.chmod(dest_path, stat.S_IRWXU | stat.S_IRGRP | stat.S_IXGRP | stat.S_IROTH | stat.S_IXOTH)
-                print(f"✅ Copied: {dest_name}")
+                mode = EXECUTABLE_MODE if dest_name.endswith('.py') else None
+                if get_manifest().install_file(source_path, dest_path, mode=mode) != "unchanged":
+                    print(f"✅ Copied: {dest_name}")
             else:
-                # shiboken_tool.py는 실제로는 바이너리이므로 래퍼로 생성
-                create_wrapper_script("shiboken_tool.py", source_path, "binary")
+                # shiboken_tool.py는 실제로는 바이너리이므로 링크로 생성
+                create_tool_link("shiboken_tool.py", source_path)
         else:
             print(f"⚠️  Missing: {source_path}")
     
+    # uic/rcc 배치 front-end (캐시 + 병렬 처리, serve 모드)
+    batch_source = os.path.join(os.path.dirname(os.path.abspath(__file__)), "qt_tool_batch.py")
+    if os.path.exists(batch_source):
+        if get_manifest().install_file(batch_source, f"{BIN_DIR}/pyside6-qt-batch", mode=EXECUTABLE_MODE) != "unchanged":
+            print(f"✅ Copied: pyside6-qt-batch")
+    else:
+        print(f"⚠️  Missing: {batch_source}")
+    
     # 라이브러리 디렉토리들 복사
     lib_dirs = [
-        ("deploy_lib", f"{PYTHON3_13_SITE_PACKAGES}/PySide6/scripts/../deploy_lib"),  # 실제로는 site-packages 내부에 없을 수 있음
-        ("project_lib", f"{PYTHON3_13_SITE_PACKAGES}/PySide6/scripts/../project_lib"),
-        ("qtpy2cpp_lib", f"{PYTHON3_13_SITE_PACKAGES}/PySide6/scripts/../qtpy2cpp_lib"),
+        ("deploy_lib", f"{SITE_PACKAGES}/PySide6/scripts/../deploy_lib"),  # 실제로는 site-packages 내부에 없을 수 있음
+        ("project_lib", f"{SITE_PACKAGES}/PySide6/scripts/../project_lib"),
+        ("qtpy2cpp_lib", f"{SITE_PACKAGES}/PySide6/scripts/../qtpy2cpp_lib"),
     ]
     
     # 실제 경로 찾기
     for lib_name, expected_path in lib_dirs:
         # PySide6 내부에서 라이브러리 찾기
         possible_paths = [
-            f"{PYTHON3_13_SITE_PACKAGES}/PySide6/{lib_name}",
-            f"{PYTHON3_13_SITE_PACKAGES}/PySide6/scripts/{lib_name}",
+            f"{SITE_PACKAGES}/PySide6/{lib_name}",
+            f"{SITE_PACKAGES}/PySide6/scripts/{lib_name}",
         ]
         
         source_found = None
@@ -96,114 +303,117 @@ def copy_support_files():
         
         if source_found:
             dest_path = f"{BIN_DIR}/{lib_name}"
-            if os.path.exists(dest_path):
-                shutil.rmtree(dest_path)
-            shutil.copytree(source_found, dest_path)
-            print(f"✅ Copied library: {lib_name}")
+            get_manifest().install_tree(source_found, dest_path)
+            print(f"✅ Synced library: {lib_name}")
         else:
             print(f"⚠️  Library not found: {lib_name}")
 
-def main():
+def main(install_root=None, seed_root=None):
+    global _manifest
+    if install_root:
+        set_install_root(install_root)
     print("🔧 Creating PySide6 Tool Wrappers...")
     
+    _manifest = InstallManifest(PYSIDE6_ROOT, "tool-wrappers", seed_root=seed_root)
+    
     # bin 디렉토리 생성
     create_directory()
     
     # Qt libexec 도구들 (바이너리) - pyside6- 접두사 버전과 기본 버전 둘 다
     qt_tools = {
-        "pyside6-uic": f"{PYTHON3_13_SITE_PACKAGES}/PySide6/Qt/libexec/uic",
-        "uic": f"{PYTHON3_13_SITE_PACKAGES}/PySide6/Qt/libexec/uic",
-        "pyside6-rcc": f"{PYTHON3_13_SITE_PACKAGES}/PySide6/Qt/libexec/rcc", 
-        "rcc": f"{PYTHON3_13_SITE_PACKAGES}/PySide6/Qt/libexec/rcc",
-        "pyside6-qmlcachegen": f"{PYTHON3_13_SITE_PACKAGES}/PySide6/Qt/libexec/qmlcachegen",
-        "qmlcachegen": f"{PYTHON3_13_SITE_PACKAGES}/PySide6/Qt/libexec/qmlcachegen",
-        "pyside6-qmlimportscanner": f"{PYTHON3_13_SITE_PACKAGES}/PySide6/Qt/libexec/qmlimportscanner",
-        "qmlimportscanner": f"{PYTHON3_13_SITE_PACKAGES}/PySide6/Qt/libexec/qmlimportscanner",
-        "pyside6-qmltyperegistrar": f"{PYTHON3_13_SITE_PACKAGES}/PySide6/Qt/libexec/qmltyperegistrar",
-        "qmltyperegistrar": f"{PYTHON3_13_SITE_PACKAGES}/PySide6/Qt/libexec/qmltyperegistrar",
+        "pyside6-uic": f"{SITE_PACKAGES}/PySide6/Qt/libexec/uic",
+        "uic": f"{SITE_PACKAGES}/PySide6/Qt/libexec/uic",
+        "pyside6-rcc": f"{SITE_PACKAGES}/PySide6/Qt/libexec/rcc", 
+        "rcc": f"{SITE_PACKAGES}/PySide6/Qt/libexec/rcc",
+        "pyside6-qmlcachegen": f"{SITE_PACKAGES}/PySide6/Qt/libexec/qmlcachegen",
+        "qmlcachegen": f"{SITE_PACKAGES}/PySide6/Qt/libexec/qmlcachegen",
+        "pyside6-qmlimportscanner": f"{SITE_PACKAGES}/PySide6/Qt/libexec/qmlimportscanner",
+        "qmlimportscanner": f"{SITE_PACKAGES}/PySide6/Qt/libexec/qmlimportscanner",
+        "pyside6-qmltyperegistrar": f"{SITE_PACKAGES}/PySide6/Qt/libexec/qmltyperegistrar",
+        "qmltyperegistrar": f"{SITE_PACKAGES}/PySide6/Qt/libexec/qmltyperegistrar",
     }
     
     # PySide6 실행 파일들 (바이너리) - pyside6- 접두사 버전과 기본 버전 둘 다
     pyside_tools = {
-        "pyside6-assistant": f"{PYTHON3_13_SITE_PACKAGES}/PySide6/assistant",
-        "assistant": f"{PYTHON3_13_SITE_PACKAGES}/PySide6/assistant",
-        "pyside6-designer": f"{PYTHON3_13_SITE_PACKAGES}/PySide6/designer",
-        "designer": f"{PYTHON3_13_SITE_PACKAGES}/PySide6/designer",
-        "pyside6-linguist": f"{PYTHON3_13_SITE_PACKAGES}/PySide6/linguist",
-        "linguist": f"{PYTHON3_13_SITE_PACKAGES}/PySide6/linguist",
-        "pyside6-lrelease": f"{PYTHON3_13_SITE_PACKAGES}/PySide6/lrelease",
-        "lrelease": f"{PYTHON3_13_SITE_PACKAGES}/PySide6/lrelease",
-        "pyside6-lupdate": f"{PYTHON3_13_SITE_PACKAGES}/PySide6/lupdate",
-        "lupdate": f"{PYTHON3_13_SITE_PACKAGES}/PySide6/lupdate",
-        "pyside6-balsam": f"{PYTHON3_13_SITE_PACKAGES}/PySide6/balsam",
-        "balsam": f"{PYTHON3_13_SITE_PACKAGES}/PySide6/balsam",
-        "pyside6-balsamui": f"{PYTHON3_13_SITE_PACKAGES}/PySide6/balsamui",
-        "balsamui": f"{PYTHON3_13_SITE_PACKAGES}/PySide6/balsamui",
-        "pyside6-qmlformat": f"{PYTHON3_13_SITE_PACKAGES}/PySide6/qmlformat",
-        "qmlformat": f"{PYTHON3_13_SITE_PACKAGES}/PySide6/qmlformat",
-        "pyside6-qmllint": f"{PYTHON3_13_SITE_PACKAGES}/PySide6/qmllint",
-        "qmllint": f"{PYTHON3_13_SITE_PACKAGES}/PySide6/qmllint",
-        "pyside6-qmlls": f"{PYTHON3_13_SITE_PACKAGES}/PySide6/qmlls",
-        "qmlls": f"{PYTHON3_13_SITE_PACKAGES}/PySide6/qmlls",
-        "pyside6-qsb": f"{PYTHON3_13_SITE_PACKAGES}/PySide6/qsb",
-        "qsb": f"{PYTHON3_13_SITE_PACKAGES}/PySide6/qsb",
-        "pyside6-svgtoqml": f"{PYTHON3_13_SITE_PACKAGES}/PySide6/svgtoqml",
-        "svgtoqml": f"{PYTHON3_13_SITE_PACKAGES}/PySide6/svgtoqml",
+        "pyside6-assistant": f"{SITE_PACKAGES}/PySide6/assistant",
+        "assistant": f"{SITE_PACKAGES}/PySide6/assistant",
+        "pyside6-designer": f"{SITE_PACKAGES}/PySide6/designer",
+        "designer": f"{SITE_PACKAGES}/PySide6/designer",
+        "pyside6-linguist": f"{SITE_PACKAGES}/PySide6/linguist",
+        "linguist": f"{SITE_PACKAGES}/PySide6/linguist",
+        "pyside6-lrelease": f"{SITE_PACKAGES}/PySide6/lrelease",
+        "lrelease": f"{SITE_PACKAGES}/PySide6/lrelease",
+        "pyside6-lupdate": f"{SITE_PACKAGES}/PySide6/lupdate",
+        "lupdate": f"{SITE_PACKAGES}/PySide6/lupdate",
+        "pyside6-balsam": f"{SITE_PACKAGES}/PySide6/balsam",
+        "balsam": f"{SITE_PACKAGES}/PySide6/balsam",
+        "pyside6-balsamui": f"{SITE_PACKAGES}/PySide6/balsamui",
+        "balsamui": f"{SITE_PACKAGES}/PySide6/balsamui",
+        "pyside6-qmlformat": f"{SITE_PACKAGES}/PySide6/qmlformat",
+        "qmlformat": f"{SITE_PACKAGES}/PySide6/qmlformat",
+        "pyside6-qmllint": f"{SITE_PACKAGES}/PySide6/qmllint",
+        "qmllint": f"{SITE_PACKAGES}/PySide6/qmllint",
+        "pyside6-qmlls": f"{SITE_PACKAGES}/PySide6/qmlls",
+        "qmlls": f"{SITE_PACKAGES}/PySide6/qmlls",
+        "pyside6-qsb": f"{SITE_PACKAGES}/PySide6/qsb",
+        "qsb": f"{SITE_PACKAGES}/PySide6/qsb",
+        "pyside6-svgtoqml": f"{SITE_PACKAGES}/PySide6/svgtoqml",
+        "svgtoqml": f"{SITE_PACKAGES}/PySide6/svgtoqml",
     }
     
     # Python 스크립트들
     python_scripts = {
-        "pyside6-android-deploy": f"{PYTHON3_13_SITE_PACKAGES}/PySide6/scripts/android_deploy.py",
-        "pyside6-deploy": f"{PYTHON3_13_SITE_PACKAGES}/PySide6/scripts/deploy.py",
-        "pyside6-metaobjectdump": f"{PYTHON3_13_SITE_PACKAGES}/PySide6/scripts/metaobjectdump.py",
-        "pyside6-project": f"{PYTHON3_13_SITE_PACKAGES}/PySide6/scripts/project.py",
-        "pyside6-qml": f"{PYTHON3_13_SITE_PACKAGES}/PySide6/scripts/qml.py",
-        "pyside6-qtpy2cpp": f"{PYTHON3_13_SITE_PACKAGES}/PySide6/scripts/qtpy2cpp.py",
-        "pyside6-genpyi": f"{PYTHON3_13_SITE_PACKAGES}/PySide6/support/generate_pyi.py",
+        "pyside6-android-deploy": f"{SITE_PACKAGES}/PySide6/scripts/android_deploy.py",
+        "pyside6-deploy": f"{SITE_PACKAGES}/PySide6/scripts/deploy.py",
+        "pyside6-metaobjectdump": f"{SITE_PACKAGES}/PySide6/scripts/metaobjectdump.py",
+        "pyside6-project": f"{SITE_PACKAGES}/PySide6/scripts/project.py",
+        "pyside6-qml": f"{SITE_PACKAGES}/PySide6/scripts/qml.py",
+        "pyside6-qtpy2cpp": f"{SITE_PACKAGES}/PySide6/scripts/qtpy2cpp.py",
+        "pyside6-genpyi": f"{SITE_PACKAGES}/PySide6/support/generate_pyi.py",
     }
     
     # Shiboken6 도구들
     shiboken_tools = {
-        "shiboken6": f"{PYTHON3_13_SITE_PACKAGES}/shiboken6_generator/shiboken6",
-        "shiboken6-genpyi": f"{PYTHON3_13_SITE_PACKAGES}/shiboken6_generator/shiboken6",  # 같은 실행파일
+        "shiboken6": f"{SITE_PACKAGES}/shiboken6_generator/shiboken6",
+        "shiboken6-genpyi": f"{SITE_PACKAGES}/shiboken6_generator/shiboken6",  # 같은 실행파일
     }
     
     print(f"\n🔧 Creating Qt libexec tool wrappers...")
     for tool_name, target_path in qt_tools.items():
         if os.path.exists(target_path):
-            create_wrapper_script(tool_name, target_path, "binary")
+            create_tool_link(tool_name, target_path)
         else:
             print(f"⚠️  Missing: {target_path}")
     
     print(f"\n🔧 Creating PySide6 tool wrappers...")
     for tool_name, target_path in pyside_tools.items():
         if os.path.exists(target_path):
-            create_wrapper_script(tool_name, target_path, "binary")
+            create_tool_link(tool_name, target_path)
         else:
             print(f"⚠️  Missing: {target_path}")
     
-    print(f"\n🔧 Creating Python script wrappers...")
-    for tool_name, target_path in python_scripts.items():
-        if os.path.exists(target_path):
-            create_wrapper_script(tool_name, target_path, "python")
-        else:
-            print(f"⚠️  Missing: {target_path}")
+    print(f"\n🔧 Creating Python script launchers...")
+    create_python_tools(python_scripts)
     
     print(f"\n🔧 Creating Shiboken6 tool wrappers...")
     for tool_name, target_path in shiboken_tools.items():
         if os.path.exists(target_path):
-            create_wrapper_script(tool_name, target_path, "binary")
+            create_tool_link(tool_name, target_path)
         else:
             print(f"⚠️  Missing: {target_path}")
     
     # 지원 파일들과 라이브러리 복사
     copy_support_files()
     
+    # manifest 저장 (이번에 만들지 않은 이전 래퍼/지원 파일은 삭제)
+    stats = get_manifest().commit()
+    print(f"\n📋 Install manifest: {format_manifest_stats(stats)}")
+    
     print(f"\n🎉 Wrapper script creation completed!")
     print(f"📁 All tools available in: {BIN_DIR}")
     
     # 생성된 도구 목록 출력
-    created_tools = [f for f in os.listdir(BIN_DIR) if os.path.isfile(os.path.join(BIN_DIR, f))]
+    created_tools = [f for f in os.listdir(BIN_DIR) if os.path.isfile(os.path.join(BIN_DIR, f)) and f != LAUNCHER_NAME]
     created_dirs = [f for f in os.listdir(BIN_DIR) if os.path.isdir(os.path.join(BIN_DIR, f))]
     
     print(f"📊 Created {len(created_tools)} tool wrappers and {len(created_dirs)} support directories:")
@@ -216,4 +426,5 @@ def main():
             print(f"   - {dir_name}/")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    # Usage: create_tool_wrappers.py [install_root]
+    main(*sys.argv[1:2])
\ No newline at end of file
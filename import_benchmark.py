@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+PySide6 Import Benchmark
+빌드된 각 Python 인터프리터에서 PySide6 서브모듈의 cold/warm import 시간을 측정하고
+이전 설치본 결과와 비교해서 회귀를 표시하는 도구
+
+Usage: import_benchmark.py run <install_root> <python_version>=<python_exe> [...] [--baseline <root>]
+       import_benchmark.py show <install_root>
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+# DCC 시작 시 주로 import 되는 서브모듈
+SUBMODULES = ["QtCore", "QtGui", "QtWidgets", "QtNetwork", "QtQml", "QtQuick", "QtSvg", "QtOpenGL"]
+
+RESULTS_NAME = ".import_benchmark.json"
+
+# 모듈당 실행 횟수 (첫 실행 = cold, 나머지 = warm)
+RUNS = int(os.environ.get("PYSIDE6_IMPORT_BENCHMARK_RUNS", "5"))
+
+# warm median 이 이 비율 이상 느려지면 회귀로 표시
+REGRESSION_PERCENT = float(os.environ.get("PYSIDE6_IMPORT_REGRESSION_PERCENT", "20"))
+
+# 측정 노이즈 하한 (ms) - 이보다 작은 차이는 회귀로 보지 않음
+REGRESSION_MIN_MS = float(os.environ.get("PYSIDE6_IMPORT_REGRESSION_MIN_MS", "5"))
+
+def parse_importtime(stderr, module):
+    """-X importtime 출력에서 {module: cumulative_us} 와 대상 모듈 누적 시간(us)"""
+    cumulative = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[1].strip().isdigit():
+            continue
+        cumulative[parts[2].strip()] = int(parts[1])
+    return cumulative, cumulative.get(module)
+
+def measure_import(python_exe, site_packages, module):
+    """새 인터프리터에서 한 번 import 하고 (wall_ms, importtime_ms, 에러) 반환"""
+    env = os.environ.copy()
+    env["PYTHONPATH"] = f"{site_packages}:{env.get('PYTHONPATH', '')}"
+    env["QT_QPA_PLATFORM"] = "offscreen"
+
+    start = time.perf_counter()
+    result = subprocess.run([python_exe, "-X", "importtime", "-c", f"import {module}"],
+                            env=env, capture_output=True, text=True, timeout=120)
+    wall_ms = (time.perf_counter() - start) * 1000
+
+    if result.returncode != 0:
+        return wall_ms, None, result.stderr.strip().splitlines()[-1] if result.stderr.strip() else "failed"
+
+    _, module_us = parse_importtime(result.stderr, module)
+    return wall_ms, (module_us / 1000.0 if module_us is not None else None), None
+
+def summarize(samples):
+    if not samples:
+        return None
+    return {
+        "min": round(min(samples), 2),
+        "median": round(statistics.median(samples), 2),
+        "mean": round(statistics.mean(samples), 2),
+        "stdev": round(statistics.stdev(samples), 2) if len(samples) > 1 else 0.0,
+    }
+
+def benchmark_interpreter(python_exe, site_packages, runs=None, modules=None):
+    """{module: {cold_ms, warm: stats, wall: stats} 또는 {error}}"""
+    runs = max(2, runs or RUNS)
+    results = {}
+    for name in modules or SUBMODULES:
+        module = f"PySide6.{name}"
+        import_ms = []
+        wall_ms = []
+        error = None
+        for _ in range(runs):
+            wall, imported, error = measure_import(python_exe, site_packages, module)
+            if error:
+                break
+            wall_ms.append(wall)
+            import_ms.append(imported if imported is not None else wall)
+
+        if error:
+            results[name] = {"error": error}
+            continue
+
+        results[name] = {
+            "cold_ms": round(import_ms[0], 2),
+            "warm": summarize(import_ms[1:]),
+            "wall": summarize(wall_ms[1:]),
+        }
+    return results
+
+def results_path(install_root):
+    return os.path.join(install_root, RESULTS_NAME)
+
+def load_results(install_root):
+    try:
+        with open(results_path(install_root), "r") as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return None
+
+def save_results(install_root, results):
+    path = results_path(install_root)
+    tmp = f"{path}.tmp-{os.getpid()}"
+    with open(tmp, "w") as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+    os.replace(tmp, path)
+
+def find_regressions(current, baseline):
+    """[(python_version, module, baseline_ms, current_ms, percent)] - warm median 기준"""
+    regressions = []
+    if not baseline:
+        return regressions
+    for python_version, modules in current.get("interpreters", {}).items():
+        previous_modules = baseline.get("interpreters", {}).get(python_version, {})
+        for name, result in modules.items():
+            previous = previous_modules.get(name, {})
+            if "warm" not in result or not previous.get("warm"):
+                continue
+            before = previous["warm"]["median"]
+            after = result["warm"]["median"]
+            if before > 0 and after - before >= REGRESSION_MIN_MS and (after - before) * 100.0 / before >= REGRESSION_PERCENT:
+                regressions.append((python_version, name, before, after, (after - before) * 100.0 / before))
+    return regressions
+
+def run_benchmarks(install_root, interpreters, baseline_root=None, runs=None, log=print):
+    """interpreters: [(python_version, python_exe, site_packages)] → (results, regressions)"""
+    results = {"timestamp": datetime.now().isoformat(timespec="seconds"), "runs": max(2, runs or RUNS),
+               "interpreters": {}}
+
+    # 같은 경로에 다시 설치하는 경우를 위해 저장 전에 이전 결과를 읽어둠
+    baseline = load_results(baseline_root) if baseline_root else None
+
+    # 측정끼리 CPU/IO 경쟁하지 않도록 순차 실행
+    for python_version, python_exe, site_packages in interpreters:
+        log(f"⏱️  Benchmarking PySide6 imports with Python {python_version}...")
+        modules = benchmark_interpreter(python_exe, site_packages, runs)
+        results["interpreters"][python_version] = modules
+        for name, result in modules.items():
+            if "error" in result:
+                log(f"   {name:<10} ❌ {result['error']}")
+            else:
+                log(f"   {name:<10} cold {result['cold_ms']:8.1f} ms | warm median {result['warm']['median']:8.1f} ms "
+                    f"(± {result['warm']['stdev']:.1f})")
+
+    save_results(install_root, results)
+
+    regressions = find_regressions(results, baseline)
+    if baseline_root and baseline is None:
+        log("ℹ️  No previous import benchmark to compare against")
+    for python_version, name, before, after, percent in regressions:
+        log(f"⚠️  Import regression: Python {python_version} PySide6.{name} {before:.1f} → {after:.1f} ms (+{percent:.0f}%)")
+    return results, regressions
+
+def main():
+    args = sys.argv[1:]
+    if len(args) < 2:
+        print(__doc__.strip())
+        return 1
+
+    command, install_root = args[0], args[1]
+
+    if command == "show":
+        results = load_results(install_root)
+        if not results:
+            print(f"No import benchmark found in {install_root}")
+            return 1
+        print(json.dumps(results, indent=2, sort_keys=True))
+        return 0
+
+    if command != "run":
+        print(f"Unknown command: {command}")
+        print(__doc__.strip())
+        return 1
+
+    # 기본은 같은 설치 루트에 남아있는 이전 결과와 비교
+    baseline_root = install_root
+    interpreters = []
+    rest = args[2:]
+    while rest:
+        item = rest.pop(0)
+        if item == "--baseline" and rest:
+            baseline_root = rest.pop(0)
+        elif "=" in item:
+            python_version, python_exe = item.split("=", 1)
+            major_minor = ".".join(python_version.split(".")[:2])
+            interpreters.append((python_version, python_exe,
+                                 os.path.join(install_root, "lib", f"python{major_minor}", "site-packages")))
+
+    _, regressions = run_benchmarks(install_root, interpreters, baseline_root)
+    return 1 if regressions else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
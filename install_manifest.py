@@ -0,0 +1,337 @@
+#!/usr/bin/env python3
+"""
+PySide6 Install Manifest
+설치 루트에 쓴 파일들의 path/size/mode/hash 인덱스를 관리해서
+변경된 파일만 쓰고, 더 이상 설치되지 않는 파일은 삭제하고, 인터프리터 없이 트리를 검증하는 도구
+
+Usage: install_manifest.py verify <install_root> [--full]
+       install_manifest.py list <install_root> [component]
+"""
+
+import fcntl
+import hashlib
+import json
+import os
+import shutil
+import stat
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock, get_ident
+
+from parallel_install import MAX_WORKERS, file_hash
+
+MANIFEST_NAME = ".install_manifest.json"
+MANIFEST_VERSION = 1
+
+# 엔트리 형식: relpath -> [size, mode, mtime_ns, sha256, component]
+# 심볼릭 링크는 [0, 0, 0, "symlink:<target>", component]
+SIZE, MODE, MTIME, HASH, COMPONENT = range(5)
+SYMLINK_PREFIX = "symlink:"
+
+def manifest_path(install_root):
+    return os.path.join(install_root, MANIFEST_NAME)
+
+def load_manifest(install_root):
+    """relpath -> entry 딕셔너리 (manifest가 없거나 형식이 다르면 빈 딕셔너리)"""
+    try:
+        with open(manifest_path(install_root), "r") as f:
+            data = json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+    if data.get("version") != MANIFEST_VERSION:
+        return {}
+    return data.get("files", {})
+
+def _write_manifest(install_root, entries):
+    path = manifest_path(install_root)
+    tmp = f"{path}.tmp-{os.getpid()}"
+    with open(tmp, "w") as f:
+        json.dump({"version": MANIFEST_VERSION, "files": entries}, f, separators=(",", ":"), sort_keys=True)
+    os.replace(tmp, path)
+
+def _tmp_path(dst):
+    # 여러 설치 단계가 스레드로 동시에 실행되므로 스레드별로 구분
+    return f"{dst}.tmp-{os.getpid()}-{get_ident()}"
+
+def _stat_matches(st, entry):
+    return (st.st_size == entry[SIZE] and stat.S_IMODE(st.st_mode) == entry[MODE]
+            and st.st_mtime_ns == entry[MTIME])
+
+class InstallManifest:
+    """하나의 설치 단계(component)에서 쓴 파일들을 기록하는 writer
+
+    파일은 항상 tmp + rename으로 교체되므로 기존 inode를 수정하지 않음
+    (seed_root의 동일한 파일을 hardlink로 재사용해도 안전)
+    """
+
+    def __init__(self, install_root, component, seed_root=None):
+        self.install_root = install_root
+        self.component = component
+        self.entries = load_manifest(install_root)
+        self.seed_root = seed_root
+        self.seed_entries = load_manifest(seed_root) if seed_root else {}
+        self.touched = set()
+        self.updated = {}
+        self.stats = {"written": 0, "linked": 0, "unchanged": 0, "removed": 0}
+        self._lock = Lock()
+
+    def _rel(self, dst):
+        return os.path.relpath(dst, self.install_root)
+
+    def _is_current(self, rel, dst, digest, mode):
+        entry = self.entries.get(rel)
+        if not entry or entry[HASH] != digest or (mode is not None and entry[MODE] != mode):
+            return False
+        try:
+            return _stat_matches(os.stat(dst), entry)
+        except FileNotFoundError:
+            return False
+
+    def _record(self, rel, dst, digest, result):
+        st = os.stat(dst)
+        entry = [st.st_size, stat.S_IMODE(st.st_mode), st.st_mtime_ns, digest, self.component]
+        with self._lock:
+            self.entries[rel] = entry
+            self.updated[rel] = entry
+            self.touched.add(rel)
+            self.stats[result] += 1
+
+    def _skip(self, rel):
+        with self._lock:
+            self.touched.add(rel)
+            self.stats["unchanged"] += 1
+
+    def _link_from_seed(self, rel, dst, digest, mode):
+        """이전 release의 같은 파일을 hardlink (성공 시 True)"""
+        entry = self.seed_entries.get(rel)
+        if not entry or entry[HASH] != digest or (mode is not None and entry[MODE] != mode):
+            return False
+        seed_path = os.path.join(self.seed_root, rel)
+        try:
+            if not _stat_matches(os.stat(seed_path), entry):
+                return False
+            tmp = _tmp_path(dst)
+            if os.path.lexists(tmp):
+                os.remove(tmp)
+            os.link(seed_path, tmp)
+            os.replace(tmp, dst)
+            return True
+        except OSError:
+            return False
+
+    def _link_source(self, src, dst):
+        tmp = _tmp_path(dst)
+        try:
+            if os.path.lexists(tmp):
+                os.remove(tmp)
+            os.link(src, tmp)
+            os.replace(tmp, dst)
+            return True
+        except OSError:
+            return False
+
+    def install_file(self, src, dst, mode=None, link_source=False):
+        """src를 dst로 설치 (내용/모드가 같으면 건너뜀), 결과 문자열 반환
+
+        link_source: src가 같은 설치 루트의 파일이면 복사 대신 hardlink (빌드 트리에는 사용 금지)
+        """
+        rel = self._rel(dst)
+        digest = file_hash(src)
+        if self._is_current(rel, dst, digest, mode):
+            self._skip(rel)
+            return "unchanged"
+
+        os.makedirs(os.path.dirname(dst), exist_ok=True)
+        if self._link_from_seed(rel, dst, digest, mode):
+            result = "linked"
+        elif link_source and mode is None and self._link_source(src, dst):
+            result = "linked"
+        else:
+            tmp = _tmp_path(dst)
+            shutil.copy2(src, tmp)
+            if mode is not None:
+                os.chmod(tmp, mode)
+            os.replace(tmp, dst)
+            result = "written"
+
+        self._record(rel, dst, digest, result)
+        return result
+
+    def write_file(self, dst, content, mode=0o644):
+        """문자열/바이트 내용을 dst에 설치 (내용/모드가 같으면 건너뜀)"""
+        rel = self._rel(dst)
+        data = content.encode() if isinstance(content, str) else content
+        digest = hashlib.sha256(data).hexdigest()
+        if self._is_current(rel, dst, digest, mode):
+            self._skip(rel)
+            return "unchanged"
+
+        os.makedirs(os.path.dirname(dst), exist_ok=True)
+        if self._link_from_seed(rel, dst, digest, mode):
+            result = "linked"
+        else:
+            tmp = _tmp_path(dst)
+            with open(tmp, "wb") as f:
+                f.write(data)
+            os.chmod(tmp, mode)
+            os.replace(tmp, dst)
+            result = "written"
+
+        self._record(rel, dst, digest, result)
+        return result
+
+    def install_symlink(self, target, dst):
+        """dst를 target을 가리키는 심볼릭 링크로 설치"""
+        rel = self._rel(dst)
+        digest = SYMLINK_PREFIX + target
+        entry = self.entries.get(rel)
+        if entry and entry[HASH] == digest and os.path.islink(dst) and os.readlink(dst) == target:
+            self._skip(rel)
+            return "unchanged"
+
+        os.makedirs(os.path.dirname(dst), exist_ok=True)
+        tmp = _tmp_path(dst)
+        if os.path.lexists(tmp):
+            os.remove(tmp)
+        os.symlink(target, tmp)
+        os.replace(tmp, dst)
+
+        with self._lock:
+            entry = [0, 0, 0, digest, self.component]
+            self.entries[rel] = entry
+            self.updated[rel] = entry
+            self.touched.add(rel)
+            self.stats["written"] += 1
+        return "written"
+
+    def install_tree(self, src_dir, dst_dir, workers=None, link_sources=False):
+        """디렉토리 트리를 병렬로 설치 (심볼릭 링크는 링크로 유지)"""
+        pairs = []
+        for root, dirs, files in os.walk(src_dir):
+            for name in files + [d for d in dirs if os.path.islink(os.path.join(root, d))]:
+                src = os.path.join(root, name)
+                pairs.append((src, os.path.join(dst_dir, os.path.relpath(src, src_dir))))
+
+        def install(pair):
+            src, dst = pair
+            if os.path.islink(src):
+                return self.install_symlink(os.readlink(src), dst)
+            return self.install_file(src, dst, link_source=link_sources)
+
+        with ThreadPoolExecutor(max_workers=workers or MAX_WORKERS) as executor:
+            list(executor.map(install, pairs))
+        return len(pairs)
+
+    def commit(self, remove_stale=True):
+        """변경분을 디스크의 최신 manifest에 병합해서 저장 (병렬 설치 단계끼리 잠금)
+
+        remove_stale: 이 component가 이전에 설치했지만 이번에는 쓰지 않은 파일 삭제
+        """
+        os.makedirs(self.install_root, exist_ok=True)
+        with open(f"{manifest_path(self.install_root)}.lock", "w") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            entries = load_manifest(self.install_root)
+            entries.update(self.updated)
+
+            if remove_stale:
+                for rel, entry in list(entries.items()):
+                    if entry[COMPONENT] != self.component or rel in self.touched:
+                        continue
+                    try:
+                        os.remove(os.path.join(self.install_root, rel))
+                    except FileNotFoundError:
+                        pass
+                    del entries[rel]
+                    self.stats["removed"] += 1
+
+            _write_manifest(self.install_root, entries)
+        self.entries = entries
+        self.updated = {}
+        return self.stats
+
+def refresh_manifest_entries(install_root, paths):
+    """설치 후 수정된 파일(예: RUNPATH 재작성)의 manifest 엔트리를 component 유지한 채 갱신"""
+    manifest_file = manifest_path(install_root)
+    if not os.path.exists(manifest_file):
+        return 0
+
+    refreshed = 0
+    with open(f"{manifest_file}.lock", "w") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        entries = load_manifest(install_root)
+        for path in paths:
+            rel = os.path.relpath(path, install_root)
+            if rel not in entries:
+                continue
+            st = os.stat(path)
+            entries[rel] = [st.st_size, stat.S_IMODE(st.st_mode), st.st_mtime_ns, file_hash(path), entries[rel][COMPONENT]]
+            refreshed += 1
+        _write_manifest(install_root, entries)
+    return refreshed
+
+def format_manifest_stats(stats):
+    return (f"{stats['written']} written, {stats['linked']} linked from previous release, "
+            f"{stats['unchanged']} unchanged, {stats['removed']} stale removed")
+
+def verify_manifest(install_root, full=False, workers=None):
+    """manifest 기준으로 설치 트리 검증, 문제 목록 [(relpath, reason)] 반환
+
+    기본은 stat 비교 후 mtime이 다른 파일만 해시, full=True면 모든 파일 해시
+    """
+    entries = load_manifest(install_root)
+    if not entries:
+        return [(MANIFEST_NAME, "missing manifest")]
+
+    def check(item):
+        rel, entry = item
+        path = os.path.join(install_root, rel)
+        if entry[HASH].startswith(SYMLINK_PREFIX):
+            if not os.path.islink(path):
+                return rel, "missing symlink"
+            if SYMLINK_PREFIX + os.readlink(path) != entry[HASH]:
+                return rel, f"symlink -> {os.readlink(path)}"
+            return None
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            return rel, "missing"
+        if st.st_size != entry[SIZE]:
+            return rel, f"size {st.st_size} != {entry[SIZE]}"
+        if stat.S_IMODE(st.st_mode) != entry[MODE]:
+            return rel, f"mode {oct(stat.S_IMODE(st.st_mode))} != {oct(entry[MODE])}"
+        if (full or st.st_mtime_ns != entry[MTIME]) and file_hash(path) != entry[HASH]:
+            return rel, "content changed"
+        return None
+
+    with ThreadPoolExecutor(max_workers=workers or MAX_WORKERS) as executor:
+        return sorted(problem for problem in executor.map(check, entries.items()) if problem)
+
+def main():
+    if len(sys.argv) < 3:
+        print(__doc__.strip())
+        return 1
+
+    command, install_root = sys.argv[1], sys.argv[2]
+
+    if command == "verify":
+        entries = load_manifest(install_root)
+        problems = verify_manifest(install_root, full="--full" in sys.argv[3:])
+        for rel, reason in problems:
+            print(f"❌ {rel}: {reason}")
+        if problems:
+            print(f"❌ {len(problems)} problem(s) in {len(entries)} manifest entries")
+            return 1
+        print(f"✅ {len(entries)} files match the install manifest")
+    elif command == "list":
+        component = sys.argv[3] if len(sys.argv) > 3 else None
+        for rel, entry in sorted(load_manifest(install_root).items()):
+            if component is None or entry[COMPONENT] == component:
+                print(f"{entry[HASH][:12]}  {oct(entry[MODE])}  {entry[SIZE]:>10}  {entry[COMPONENT]:<24} {rel}")
+    else:
+        print(f"Unknown command: {command}")
+        print(__doc__.strip())
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+"""
+PySide6 Memory-aware Job Throttle
+빌드 중 여유 메모리와 작업별 RSS를 보고 동시에 실행되는 컴파일/링크 작업 수를 조절하는 도구
+
+CMake compiler/linker launcher로 끼워 넣은 'run'이 작업마다 슬롯(fcntl 잠금 파일)을 잡고 실행하고,
+controller가 주기적으로 pool별 허용 슬롯 수(limits.json)를 다시 계산함
+ninja -j는 상한으로만 쓰이고, 실제 동시 실행 수는 메모리 상황에 따라 줄었다 늘었다 함
+
+Usage: job_throttle.py run <compile|link> <command> [args...]
+       job_throttle.py control <state_dir> [--max-compile N] [--max-link N]
+       job_throttle.py env <state_dir>
+       job_throttle.py jobs
+"""
+
+import fcntl
+import glob
+import json
+import os
+import subprocess
+import sys
+import time
+from threading import Event, Thread
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+STATE_DIR_VARIABLE = "PYSIDE6_THROTTLE_DIR"
+LIMITS_NAME = "limits.json"
+
+# 작업 하나당 예상 메모리 (GiB), 실행 중인 작업의 RSS가 관측되면 그 값으로 대체
+COMPILE_JOB_MEMORY_GB = float(os.environ.get("PYSIDE6_COMPILE_JOB_MEMORY_GB", "1.5"))
+LINK_JOB_MEMORY_GB = float(os.environ.get("PYSIDE6_LINK_JOB_MEMORY_GB", "4"))
+
+# 다른 프로세스를 위해 남겨두는 메모리 (GiB)
+MEMORY_RESERVE_GB = float(os.environ.get("PYSIDE6_MEMORY_RESERVE_GB", "2"))
+
+# 링크 작업 상한 (대형 wrapper 링크는 메모리를 많이 쓰므로 별도 pool로 제한)
+MAX_LINK_JOBS = int(os.environ.get("PYSIDE6_MAX_LINK_JOBS", str(max(1, (os.cpu_count() or 1) // 8))))
+
+# controller 주기 (초), launcher 슬롯 대기 간격 (초)
+CONTROL_INTERVAL = float(os.environ.get("PYSIDE6_THROTTLE_INTERVAL", "2"))
+POLL_INTERVAL = 0.25
+
+# 한 번에 늘릴 수 있는 슬롯 비율 (줄이는 것은 즉시)
+SCALE_UP_STEP = 0.25
+
+# 같은 OOM으로 여러 줄이 출력되므로 이 시간 안의 보고는 한 번으로 취급 (초)
+OOM_REPORT_WINDOW = 30.0
+
+POOLS = ("compile", "link")
+
+def gib(value):
+    return value / (1024 ** 3)
+
+def read_limits(state_dir):
+    try:
+        with open(os.path.join(state_dir, LIMITS_NAME), "r") as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return None
+
+def write_limits(state_dir, limits):
+    path = os.path.join(state_dir, LIMITS_NAME)
+    tmp = f"{path}.tmp-{os.getpid()}"
+    with open(tmp, "w") as f:
+        json.dump(limits, f)
+    os.replace(tmp, path)
+
+def acquire_slot(state_dir, pool):
+    """허용된 슬롯 중 빈 것을 잡을 때까지 대기, 잠금이 걸린 파일 핸들 반환 (프로세스 종료 시 자동 해제)"""
+    while True:
+        limits = read_limits(state_dir)
+        if limits is None:
+            return None
+        for index in range(max(1, int(limits.get(pool, 1)))):
+            handle = open(os.path.join(state_dir, f"{pool}.{index}.slot"), "a")
+            try:
+                fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                return handle
+            except BlockingIOError:
+                handle.close()
+        time.sleep(POLL_INTERVAL)
+
+def run(pool, command):
+    """launcher 모드: 슬롯을 잡고 명령 실행 (throttle 디렉토리가 없으면 그대로 실행)"""
+    state_dir = os.environ.get(STATE_DIR_VARIABLE)
+    slot = acquire_slot(state_dir, pool) if state_dir and os.path.isdir(state_dir) else None
+    try:
+        returncode = subprocess.call(command)
+        # 시그널로 종료된 경우 셸과 같은 128+N 으로 전달
+        return 128 - returncode if returncode < 0 else returncode
+    finally:
+        if slot:
+            slot.close()
+
+def launcher_command(pool, previous=None):
+    """CMake launcher 목록 (세미콜론 구분), 기존 launcher(ccache 등)는 뒤에 이어서 실행"""
+    parts = [sys.executable, os.path.abspath(__file__), "run", pool]
+    if previous:
+        parts.append(previous)
+    return ";".join(parts)
+
+def throttle_environment(state_dir, base_env=None):
+    """빌드 환경에 추가할 변수 (CMake 3.17+ compiler launcher, 3.21+ linker launcher 환경 변수)"""
+    base_env = base_env or {}
+    env = {STATE_DIR_VARIABLE: state_dir}
+    for language in ("C", "CXX"):
+        compiler = f"CMAKE_{language}_COMPILER_LAUNCHER"
+        linker = f"CMAKE_{language}_LINKER_LAUNCHER"
+        env[compiler] = launcher_command("compile", base_env.get(compiler))
+        env[linker] = launcher_command("link", base_env.get(linker))
+    return env
+
+def running_jobs(state_dir, pool):
+    """잠금이 걸린 슬롯 수 (다른 프로세스에서 실행한 controller도 셀 수 있도록 슬롯 파일로 확인)"""
+    running = 0
+    for path in glob.glob(os.path.join(state_dir, f"{pool}.*.slot")):
+        with open(path, "a") as handle:
+            try:
+                fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                fcntl.flock(handle, fcntl.LOCK_UN)
+            except BlockingIOError:
+                running += 1
+    return running
+
+def job_rss():
+    """이 프로세스 하위의 launcher 기준 pool별 작업당 평균 RSS (GiB), 관측값이 없으면 None"""
+    totals = {pool: [0, 0.0] for pool in POOLS}
+    if psutil is None:
+        return {pool: None for pool in POOLS}
+
+    launcher = os.path.abspath(__file__)
+    for proc in psutil.Process().children(recursive=True):
+        try:
+            cmdline = proc.cmdline()
+            if len(cmdline) < 4 or cmdline[1] != launcher or cmdline[2] != "run" or cmdline[3] not in POOLS:
+                continue
+            rss = sum(child.memory_info().rss for child in proc.children(recursive=True))
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            continue
+        if rss:
+            totals[cmdline[3]][0] += 1
+            totals[cmdline[3]][1] += gib(rss)
+    return {pool: total / count if count else None for pool, (count, total) in totals.items()}
+
+def job_usage(state_dir):
+    """pool별 (실행 중인 작업 수, 작업당 평균 RSS GiB 또는 None)"""
+    rss = job_rss()
+    return {pool: (running_jobs(state_dir, pool), rss[pool]) for pool in POOLS}
+
+def available_memory_gb():
+    if psutil is None:
+        return None
+    return gib(psutil.virtual_memory().available)
+
+def recommended_jobs(max_jobs=None, job_memory_gb=None):
+    """지금 여유 메모리 기준 병렬 작업 수 (셸 스크립트의 $(nproc) 대체)"""
+    max_jobs = max_jobs or os.cpu_count() or 1
+    available = available_memory_gb()
+    if available is None:
+        return max_jobs
+    memory_jobs = int((available - MEMORY_RESERVE_GB) / (job_memory_gb or COMPILE_JOB_MEMORY_GB))
+    return max(1, min(max_jobs, memory_jobs))
+
+class MemoryThrottle:
+    """controller: CONTROL_INTERVAL마다 pool별 허용 슬롯 수 재계산
+
+    허용 수 = 실행 중인 작업 수 + (여유 메모리 - 예약분) / 작업당 메모리
+    작업당 메모리는 관측된 평균 RSS의 최댓값(여유 25%)과 설정값 중 관측값이 있으면 관측값 사용
+    """
+
+    def __init__(self, state_dir, max_compile=None, max_link=None, log=print):
+        self.state_dir = state_dir
+        self.max_jobs = {"compile": max_compile or os.cpu_count() or 1, "link": max_link or MAX_LINK_JOBS}
+        self.job_memory = {"compile": COMPILE_JOB_MEMORY_GB, "link": LINK_JOB_MEMORY_GB}
+        self.observed = {pool: None for pool in POOLS}
+        self.limits = {}
+        self.log = log
+        self._last_oom = None
+        self._stop = Event()
+        self._thread = None
+
+    def environment(self, base_env=None):
+        return throttle_environment(self.state_dir, base_env)
+
+    def job_memory_gb(self, pool):
+        observed = self.observed[pool]
+        return observed * 1.25 if observed else self.job_memory[pool]
+
+    def report_oom(self):
+        """OOM으로 죽은 작업이 보이면 작업당 메모리 예상치를 늘려 즉시 다시 계산"""
+        now = time.monotonic()
+        if self._last_oom is not None and now - self._last_oom < OOM_REPORT_WINDOW:
+            return
+        self._last_oom = now
+        for pool in POOLS:
+            self.job_memory[pool] *= 1.5
+            if self.observed[pool]:
+                self.observed[pool] *= 1.5
+        self.log(f"⚠️  Out-of-memory job detected, raising per-job memory estimate "
+                 f"(compile {self.job_memory_gb('compile'):.1f} GiB, link {self.job_memory_gb('link'):.1f} GiB)")
+        self.update()
+
+    def compute_limits(self, available, usage):
+        limits = {}
+        headroom = available - MEMORY_RESERVE_GB
+        # 링크 pool을 먼저 배정하고 남은 메모리를 컴파일에 배정
+        for pool in ("link", "compile"):
+            running, rss = usage[pool]
+            if rss:
+                self.observed[pool] = max(self.observed[pool] or 0.0, rss)
+            extra = int(max(0.0, headroom) / self.job_memory_gb(pool))
+            target = max(1, min(self.max_jobs[pool], running + extra))
+            previous = self.limits.get(pool)
+            if previous is not None and target > previous:
+                target = min(target, previous + max(1, int(previous * SCALE_UP_STEP)))
+            limits[pool] = target
+            headroom -= max(0, target - running) * self.job_memory_gb(pool)
+        return limits
+
+    def update(self):
+        available = available_memory_gb()
+        if available is None:
+            limits = dict(self.max_jobs)
+        else:
+            limits = self.compute_limits(available, job_usage(self.state_dir))
+
+        if limits != self.limits:
+            if self.limits and available is not None:
+                self.log(f"🎚️  Job limits: compile {self.limits.get('compile')} → {limits['compile']}, "
+                         f"link {self.limits.get('link')} → {limits['link']} ({available:.1f} GiB available)")
+            self.limits = limits
+            write_limits(self.state_dir, limits)
+        return limits
+
+    def _loop(self):
+        while not self._stop.wait(CONTROL_INTERVAL):
+            try:
+                self.update()
+            except Exception as e:
+                self.log(f"⚠️  Job throttle update failed: {e}")
+
+    def start(self):
+        os.makedirs(self.state_dir, exist_ok=True)
+        self.update()
+        self._thread = Thread(target=self._loop, name="job-throttle", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=CONTROL_INTERVAL * 2)
+        self._thread = None
+        # limits.json이 없으면 launcher는 제한 없이 실행 (빌드 트리를 나중에 직접 ninja로 돌리는 경우)
+        try:
+            os.remove(os.path.join(self.state_dir, LIMITS_NAME))
+        except FileNotFoundError:
+            pass
+
+def main():
+    args = sys.argv[1:]
+    if not args:
+        print(__doc__.strip())
+        return 1
+
+    command = args.pop(0)
+    if command == "run" and len(args) >= 2 and args[0] in POOLS:
+        return run(args[0], args[1:])
+    if command == "jobs":
+        print(recommended_jobs())
+        return 0
+    if command == "env" and args:
+        for key, value in throttle_environment(os.path.abspath(args[0]), os.environ).items():
+            print(f'export {key}="{value}"')
+        return 0
+    if command == "control" and args:
+        state_dir = os.path.abspath(args.pop(0))
+        max_compile = int(args[args.index("--max-compile") + 1]) if "--max-compile" in args else None
+        max_link = int(args[args.index("--max-link") + 1]) if "--max-link" in args else None
+        throttle = MemoryThrottle(state_dir, max_compile, max_link).start()
+        print(f"🎚️  Throttling jobs in {state_dir}: {throttle.limits}")
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            throttle.stop()
+        return 0
+
+    print(f"Unknown command: {command}")
+    print(__doc__.strip())
+    return 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,367 @@
+#!/usr/bin/env python3
+"""
+PySide6 Ninja Log Analyzer
+빌드 디렉토리의 .ninja_log를 읽어 critical path, 오래 걸린 translation unit, 시간대별 병렬도,
+모듈별 합계를 보고하고 Chrome trace-event JSON (chrome://tracing, Perfetto)으로 내보내는 도구
+
+Usage: ninja_log_analyzer.py <build_dir> [...] [--trace <trace.json>] [--json <report.json>] [--top N]
+"""
+
+import json
+import math
+import os
+import re
+import shutil
+import subprocess
+import sys
+
+# 보고서에 표시할 항목 수
+TOP_COUNT = int(os.environ.get("PYSIDE6_NINJA_REPORT_TOP", "15"))
+
+# 병렬도 그래프 구간 길이 (초)
+PARALLELISM_BUCKET_SECONDS = float(os.environ.get("PYSIDE6_NINJA_BUCKET_SECONDS", "30"))
+
+_TU_SUFFIXES = (".o", ".obj")
+_target_dir_pattern = re.compile(r"CMakeFiles/([^/]+)\.dir/")
+_qt_module_pattern = re.compile(r"(?:^|/)(Qt\w+)/")
+# 링크 출력 (libQtCore.so, QtCore.abi3.so, libpyside6.abi3.so.6.9, libfoo.a) → 타겟 이름
+_link_output_pattern = re.compile(r"^(?:lib)?(.+?)(?:\.abi3|\.cpython-[\w-]+)?\.(?:so|a)(?:\.\d+)*$")
+
+def find_ninja():
+    return os.environ.get("PYSIDE6_NINJA") or shutil.which("ninja")
+
+def read_ninja_log(build_dir):
+    """마지막 빌드 세션의 [{output, start, end, cmdhash}] (초 단위)
+
+    .ninja_log는 빌드마다 이어서 기록되므로 end 시간이 줄어드는 지점에서 새 세션이 시작된 것으로 봄
+    같은 출력이 여러 번 있으면 마지막 기록 사용
+    """
+    path = os.path.join(build_dir, ".ninja_log")
+    if not os.path.exists(path):
+        return []
+
+    sessions = [[]]
+    last_end = -1
+    with open(path, "r", errors="replace") as f:
+        header = f.readline()
+        if not header.startswith("# ninja log v"):
+            return []
+        for line in f:
+            parts = line.rstrip("\n").split("\t")
+            if len(parts) < 5 or not parts[0].isdigit():
+                continue
+            start, end = int(parts[0]), int(parts[1])
+            if end < last_end:
+                sessions.append([])
+            last_end = end
+            sessions[-1].append({"output": parts[3], "start": start / 1000.0, "end": end / 1000.0,
+                                 "cmdhash": parts[4]})
+
+    # 같은 명령이 여러 출력을 만들면 (cmdhash 같음) 첫 번째 출력 기준으로 하나만 남김
+    entries = {}
+    seen_commands = {}
+    for entry in sessions[-1]:
+        key = (entry["cmdhash"], entry["start"], entry["end"])
+        if key in seen_commands:
+            seen_commands[key].setdefault("outputs", [seen_commands[key]["output"]]).append(entry["output"])
+            continue
+        seen_commands[key] = entry
+        entries[entry["output"]] = entry
+    return sorted(entries.values(), key=lambda e: (e["start"], e["end"]))
+
+def target_module(text):
+    """경로나 명령줄에 들어있는 CMake 타겟 이름 (CMakeFiles/<target>.dir/), 없으면 None"""
+    match = _target_dir_pattern.search(text)
+    return match.group(1) if match else None
+
+def module_of(output):
+    """출력 경로 → 모듈 이름 (CMake 타겟 디렉토리, 링크 결과 이름, Qt 모듈 디렉토리 순서로 판단)"""
+    target = target_module(output)
+    if target:
+        return target
+    match = _link_output_pattern.match(os.path.basename(output))
+    if match:
+        return match.group(1)
+    match = _qt_module_pattern.search(output)
+    if match:
+        return match.group(1)
+    return output.split("/", 1)[0] if "/" in output else "other"
+
+def parse_ninja_graph(dot):
+    """ninja -t graph (DOT) → {output_label: [input_label, ...]}
+
+    입력/출력이 여러 개인 edge는 규칙 이름 노드를 거치므로 그 노드를 통과해서 연결
+    """
+    labels = {}
+    edge_nodes = set()
+    forward = {}
+    for line in dot.splitlines():
+        line = line.strip()
+        node = re.match(r'^"(0x[0-9a-f]+)" \[label="(.*?)"(, shape=ellipse)?\]$', line)
+        if node:
+            labels[node.group(1)] = node.group(2)
+            if node.group(3):
+                edge_nodes.add(node.group(1))
+            continue
+        edge = re.match(r'^"(0x[0-9a-f]+)" -> "(0x[0-9a-f]+)"', line)
+        if edge:
+            forward.setdefault(edge.group(2), []).append(edge.group(1))
+
+    dependencies = {}
+    for node_id, inputs in forward.items():
+        if node_id in edge_nodes:
+            continue
+        resolved = []
+        for input_id in inputs:
+            if input_id in edge_nodes:
+                resolved.extend(labels[i] for i in forward.get(input_id, []) if i in labels)
+            elif input_id in labels:
+                resolved.append(labels[input_id])
+        dependencies[labels.get(node_id, node_id)] = resolved
+    return dependencies
+
+def load_dependencies(build_dir, ninja=None):
+    ninja = ninja or find_ninja()
+    if not ninja:
+        return None
+    result = subprocess.run([ninja, "-C", build_dir, "-t", "graph"], capture_output=True, text=True)
+    if result.returncode != 0:
+        return None
+    return parse_ninja_graph(result.stdout)
+
+def critical_path_from_graph(entries, dependencies):
+    """의존성 그래프에서 실행 시간 합이 가장 긴 경로 [entry, ...] (먼저 실행되는 것부터)"""
+    by_output = {output: entry for entry in entries for output in entry.get("outputs", [entry["output"]])}
+    best = {}
+
+    def visit(root):
+        # 재귀 깊이 제한을 피하기 위해 명시적 스택 사용
+        stack = [(root, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if node in best:
+                continue
+            inputs = dependencies.get(node, [])
+            if not expanded:
+                stack.append((node, True))
+                stack.extend((i, False) for i in inputs if i not in best)
+                continue
+            weight = by_output[node]["end"] - by_output[node]["start"] if node in by_output else 0.0
+            predecessor = max(inputs, key=lambda i: best[i][0], default=None) if inputs else None
+            best[node] = (weight + (best[predecessor][0] if predecessor else 0.0), predecessor)
+
+    for entry in entries:
+        visit(entry["output"])
+
+    if not best:
+        return []
+    node = max((e["output"] for e in entries), key=lambda output: best[output][0])
+    path = []
+    while node:
+        if node in by_output:
+            path.append(by_output[node])
+        node = best[node][1]
+    return path[::-1]
+
+def critical_path_from_timeline(entries):
+    """의존성 정보가 없을 때 근사치: 마지막에 끝난 작업부터 시작 직전에 끝난 작업을 거슬러 올라감"""
+    if not entries:
+        return []
+    by_end = sorted(entries, key=lambda e: e["end"])
+    path = [by_end[-1]]
+    while True:
+        start = path[-1]["start"]
+        previous = [e for e in by_end if e["end"] <= start]
+        if not previous:
+            break
+        path.append(previous[-1])
+    return path[::-1]
+
+def peak_parallelism(entries):
+    """동시에 실행된 작업 수의 최댓값 (시작/종료 시점 sweep, 같은 시각에는 종료를 먼저 처리)"""
+    events = sorted([(e["start"], 1) for e in entries] + [(e["end"], -1) for e in entries])
+    running = peak = 0
+    for _, change in events:
+        running += change
+        peak = max(peak, running)
+    return peak
+
+def parallelism_timeline(entries, bucket_seconds=None):
+    """[(구간 시작 초, 평균 동시 실행 작업 수)] (마지막 구간은 실제 길이로 평균)"""
+    bucket_seconds = bucket_seconds or PARALLELISM_BUCKET_SECONDS
+    if not entries:
+        return []
+    begin = min(e["start"] for e in entries)
+    total = max(e["end"] for e in entries) - begin
+    buckets = [0.0] * max(1, math.ceil(total / bucket_seconds))
+    for entry in entries:
+        start, finish = entry["start"] - begin, entry["end"] - begin
+        index = int(start / bucket_seconds)
+        while start < finish:
+            bucket_end = (index + 1) * bucket_seconds
+            buckets[index] += min(finish, bucket_end) - start
+            start = bucket_end
+            index += 1
+    timeline = []
+    for i, busy in enumerate(buckets):
+        length = min(bucket_seconds, total - i * bucket_seconds)
+        timeline.append((round(i * bucket_seconds, 1), round(busy / length, 2) if length > 0 else 0.0))
+    return timeline
+
+def assign_lanes(entries):
+    """겹치지 않도록 각 작업에 trace thread 번호 배정"""
+    lanes = []
+    assigned = []
+    for entry in sorted(entries, key=lambda e: (e["start"], e["end"])):
+        for index, lane_end in enumerate(lanes):
+            if lane_end <= entry["start"]:
+                lanes[index] = entry["end"]
+                break
+        else:
+            index = len(lanes)
+            lanes.append(entry["end"])
+        assigned.append((index, entry))
+    return assigned
+
+def analyze_build_dir(build_dir, top=None, use_graph=True):
+    """하나의 ninja 빌드 디렉토리 분석 결과 딕셔너리 (로그가 없으면 None)"""
+    entries = read_ninja_log(build_dir)
+    if not entries:
+        return None
+
+    top = top or TOP_COUNT
+    dependencies = load_dependencies(build_dir) if use_graph else None
+    if dependencies:
+        path = critical_path_from_graph(entries, dependencies)
+        path_method = "graph"
+    else:
+        path = critical_path_from_timeline(entries)
+        path_method = "timeline"
+
+    begin = min(e["start"] for e in entries)
+    wall = max(e["end"] for e in entries) - begin
+    busy = sum(e["end"] - e["start"] for e in entries)
+
+    modules = {}
+    for entry in entries:
+        module = modules.setdefault(module_of(entry["output"]), {"seconds": 0.0, "edges": 0, "longest": 0.0})
+        duration = entry["end"] - entry["start"]
+        module["seconds"] += duration
+        module["edges"] += 1
+        module["longest"] = max(module["longest"], duration)
+
+    translation_units = sorted((e for e in entries if e["output"].endswith(_TU_SUFFIXES)),
+                               key=lambda e: e["end"] - e["start"], reverse=True)
+    timeline = parallelism_timeline(entries)
+
+    return {
+        "build_dir": build_dir,
+        "edges": len(entries),
+        "wall_seconds": round(wall, 2),
+        "busy_seconds": round(busy, 2),
+        "average_parallelism": round(busy / wall, 2) if wall else 0.0,
+        "peak_parallelism": peak_parallelism(entries),
+        "critical_path": {
+            "method": path_method,
+            "seconds": round(sum(e["end"] - e["start"] for e in path), 2),
+            "edges": [{"output": e["output"], "seconds": round(e["end"] - e["start"], 2)} for e in path],
+        },
+        "longest_translation_units": [{"output": e["output"], "module": module_of(e["output"]),
+                                       "seconds": round(e["end"] - e["start"], 2)} for e in translation_units[:top]],
+        "modules": {name: {key: round(value, 2) if isinstance(value, float) else value for key, value in stats.items()}
+                    for name, stats in sorted(modules.items(), key=lambda item: item[1]["seconds"], reverse=True)},
+        "parallelism": timeline,
+        "_entries": entries,
+    }
+
+def analyze(build_dirs, top=None, use_graph=True):
+    """여러 빌드 디렉토리 분석 결과 목록 (로그 없는 디렉토리 제외)"""
+    return [report for report in (analyze_build_dir(d, top, use_graph) for d in build_dirs) if report]
+
+def write_chrome_trace(reports, path, process_name=None):
+    """빌드 디렉토리마다 process 하나, 겹치지 않는 작업 묶음마다 thread 하나인 trace-event JSON"""
+    events = []
+    for pid, report in enumerate(reports, 1):
+        label = f"{process_name} {os.path.basename(report['build_dir'])}" if process_name else report["build_dir"]
+        events.append({"name": "process_name", "ph": "M", "pid": pid, "args": {"name": label}})
+        for lane, entry in assign_lanes(report["_entries"]):
+            events.append({"name": os.path.basename(entry["output"]), "cat": module_of(entry["output"]),
+                           "ph": "X", "pid": pid, "tid": lane, "ts": int(entry["start"] * 1e6),
+                           "dur": int((entry["end"] - entry["start"]) * 1e6), "args": {"output": entry["output"]}})
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w") as f:
+        json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+    return path
+
+def write_report(reports, path):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w") as f:
+        json.dump([{key: value for key, value in report.items() if not key.startswith("_")} for report in reports],
+                  f, indent=2)
+    return path
+
+def format_seconds(seconds):
+    minutes, seconds = divmod(seconds, 60)
+    return f"{int(minutes)}m {seconds:04.1f}s" if minutes else f"{seconds:.1f}s"
+
+def sparkline(values, peak):
+    blocks = " ▁▂▃▄▅▆▇█"
+    if not peak:
+        return ""
+    return "".join(blocks[min(len(blocks) - 1, int(value * (len(blocks) - 1) / peak + 0.5))] for value in values)
+
+def format_report(report, top=5):
+    """요약 출력 줄 목록"""
+    lines = [
+        f"📊 {report['build_dir']}: {report['edges']} edges, wall {format_seconds(report['wall_seconds'])}, "
+        f"parallelism avg {report['average_parallelism']:.1f} / peak {report['peak_parallelism']:.1f}",
+        f"   Critical path ({report['critical_path']['method']}): {format_seconds(report['critical_path']['seconds'])} "
+        f"over {len(report['critical_path']['edges'])} edge(s)",
+    ]
+    for edge in sorted(report["critical_path"]["edges"], key=lambda e: e["seconds"], reverse=True)[:top]:
+        lines.append(f"      {format_seconds(edge['seconds']):>10}  {edge['output']}")
+    lines.append("   Longest translation units:")
+    for tu in report["longest_translation_units"][:top]:
+        lines.append(f"      {format_seconds(tu['seconds']):>10}  {tu['output']}")
+    lines.append("   Modules by total CPU time:")
+    for name, stats in list(report["modules"].items())[:top]:
+        lines.append(f"      {format_seconds(stats['seconds']):>10}  {name} ({stats['edges']} edges, "
+                     f"longest {format_seconds(stats['longest'])})")
+    values = [value for _, value in report["parallelism"]]
+    lines.append(f"   Parallelism: {sparkline(values, max(values, default=0.0))}")
+    return lines
+
+def main():
+    args = sys.argv[1:]
+    if not args:
+        print(__doc__.strip())
+        return 1
+
+    build_dirs, trace_path, json_path, top = [], None, None, TOP_COUNT
+    while args:
+        item = args.pop(0)
+        if item == "--trace" and args:
+            trace_path = args.pop(0)
+        elif item == "--json" and args:
+            json_path = args.pop(0)
+        elif item == "--top" and args:
+            top = int(args.pop(0))
+        else:
+            build_dirs.append(item)
+
+    reports = analyze(build_dirs, top)
+    if not reports:
+        print("No .ninja_log found")
+        return 1
+
+    for report in reports:
+        print("\n".join(format_report(report, top)))
+    if trace_path:
+        print(f"📄 Chrome trace: {write_chrome_trace(reports, trace_path)}")
+    if json_path:
+        print(f"📄 Report: {write_report(reports, json_path)}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
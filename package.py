@@ -31,6 +31,7 @@ tools = [
     # 기본 도구들
     "pyside6-uic",                    # UI 파일 → Python 변환
     "pyside6-rcc",                    # 리소스 컴파일러
+    "pyside6-qt-batch",               # uic/rcc 배치 처리 (캐시, serve 모드)
     "pyside6-designer",               # Qt Designer (GUI 디자인)
     "pyside6-assistant",              # Qt Assistant (도움말)
     
@@ -70,31 +71,15 @@ tools = [
 build_command = "python {root}/rezbuild.py install"
 
 def commands():
-    import os
-    import subprocess
-    
-    # 현재 활성화된 Python 버전 감지 (개선된 버전)
+    # 현재 활성화된 Python 버전 감지
+    # 인터프리터를 실행하지 않고 rez가 이미 resolve한 python 패키지 버전을 사용
     python_version = "3.13"  # 기본값
     
-    # 여러 방법으로 Python 버전 감지 시도
-    try:
-        # 1. 현재 실행 중인 Python 버전 확인
-        result = subprocess.run(['python', '-c', 'import sys; print(f"{sys.version_info.major}.{sys.version_info.minor}")'], 
-                               capture_output=True, text=True, timeout=5)
-        if result.returncode == 0:
-            detected_version = result.stdout.strip()
-            # 지원되는 Python 버전인지 확인 (3.9, 3.10, 3.11, 3.12, 3.13)
-            if detected_version in ["3.9", "3.10", "3.11", "3.12", "3.13"]:
-                python_version = detected_version
-    except:
-        # 2. 환경변수에서 Python 버전 확인
-        try:
-            if os.environ.get('REZ_PYTHON_VERSION'):
-                rez_python = os.environ.get('REZ_PYTHON_VERSION')
-                if rez_python and rez_python in ["3.9", "3.10", "3.11", "3.12", "3.13"]:
-                    python_version = rez_python
-        except:
-            pass
+    if "python" in resolve:
+        resolved_version = "{}.{}".format(resolve.python.version.major, resolve.python.version.minor)
+        # 지원되는 Python 버전인지 확인 (3.9, 3.10, 3.11, 3.12, 3.13)
+        if resolved_version in ["3.9", "3.10", "3.11", "3.12", "3.13"]:
+            python_version = resolved_version
     
     # Python 버전별 site-packages 경로 설정
     python_site_packages = "{root}/lib/python" + python_version + "/site-packages"
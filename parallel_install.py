@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+PySide6 Parallel Installer
+스레드 풀로 파일을 설치하면서 변경 없는 파일은 건너뛰고, 같은 내용은 hardlink/reflink로 공유
+"""
+
+import errno
+import hashlib
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+
+# NFS 설치 경로는 I/O 대기 시간이 길어서 CPU 수보다 많은 스레드가 유리
+MAX_WORKERS = int(os.environ.get("PYSIDE6_INSTALL_WORKERS", str(min(32, (os.cpu_count() or 1) * 4))))
+
+FICLONE = 0x40049409  # linux/fs.h
+
+# (소스 장치, 대상 장치)별 reflink 지원 여부 - NFS 등에서 파일마다 create/remove를 반복하지 않도록 한 번만 확인
+_reflink_support = {}
+_reflink_lock = Lock()
+
+# 파일시스템이 clone을 지원하지 않을 때의 errno (그 외 오류는 파일 단위 실패로 보고 캐시하지 않음)
+_REFLINK_UNSUPPORTED = {errno.EOPNOTSUPP, errno.ENOTTY, errno.EXDEV, errno.EINVAL, errno.ENOSYS}
+
+def file_hash(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def _reflink_key(src, dst):
+    try:
+        return os.stat(src).st_dev, os.stat(os.path.dirname(dst)).st_dev
+    except FileNotFoundError:
+        return None
+
+def _try_reflink(src, dst):
+    """copy-on-write clone (XFS/Btrfs), 지원하지 않으면 False (장치 쌍마다 첫 시도 결과를 기억)"""
+    key = _reflink_key(src, dst)
+    with _reflink_lock:
+        if key is not None and _reflink_support.get(key) is False:
+            return False
+    try:
+        import fcntl
+        with open(src, "rb") as s, open(dst, "wb") as d:
+            fcntl.ioctl(d.fileno(), FICLONE, s.fileno())
+        shutil.copystat(src, dst)
+        supported = True
+    except ImportError:
+        supported = False
+    except OSError as e:
+        if os.path.exists(dst):
+            os.remove(dst)
+        if e.errno not in _REFLINK_UNSUPPORTED:
+            return False
+        supported = False
+    if key is not None:
+        with _reflink_lock:
+            _reflink_support[key] = supported
+    if not supported and os.path.exists(dst):
+        os.remove(dst)
+    return supported
+
+def _is_up_to_date(src, dst, src_hash):
+    """크기/mtime이 같으면 최신, 크기만 같으면 해시 비교 후 mtime만 맞춤"""
+    try:
+        src_stat = os.stat(src)
+        dst_stat = os.stat(dst)
+    except FileNotFoundError:
+        return False
+
+    if src_stat.st_size != dst_stat.st_size:
+        return False
+    if int(src_stat.st_mtime) == int(dst_stat.st_mtime):
+        return True
+    if file_hash(dst) == src_hash:
+        os.utime(dst, (src_stat.st_atime, src_stat.st_mtime))
+        return True
+    return False
+
+def _place(src, dst, link_source=None):
+    """dst에 원자적으로 설치: hardlink → reflink → copy 순서로 시도"""
+    os.makedirs(os.path.dirname(dst), exist_ok=True)
+    tmp = f"{dst}.tmp-{os.getpid()}"
+    if os.path.lexists(tmp):
+        os.remove(tmp)
+
+    method = "copied"
+    if link_source:
+        try:
+            os.link(link_source, tmp)
+            method = "linked"
+        except OSError:
+            link_source = None
+    if not link_source:
+        if _try_reflink(src, tmp):
+            method = "reflinked"
+        else:
+            shutil.copy2(src, tmp)
+
+    os.replace(tmp, dst)
+    return method
+
+def _place_symlink(target, dst):
+    """dst를 target을 가리키는 심볼릭 링크로 원자적으로 설치 (이미 같은 링크면 건너뜀)"""
+    if os.path.islink(dst) and os.readlink(dst) == target:
+        return "skipped"
+    os.makedirs(os.path.dirname(dst), exist_ok=True)
+    tmp = f"{dst}.tmp-{os.getpid()}"
+    if os.path.lexists(tmp):
+        os.remove(tmp)
+    os.symlink(target, tmp)
+    if os.path.isdir(dst) and not os.path.islink(dst):
+        shutil.rmtree(dst)
+    os.replace(tmp, dst)
+    return "symlinked"
+
+def _same_device(path_a, path_b):
+    try:
+        return os.stat(path_a).st_dev == os.stat(os.path.dirname(path_b)).st_dev
+    except FileNotFoundError:
+        return False
+
+def install_files(pairs, link_identical=True, link_sources=False, workers=None):
+    """(src, dst) 목록을 병렬 설치하고 {copied, linked, reflinked, skipped, bytes} 통계 반환
+
+    link_identical: 같은 내용의 설치 파일끼리 hardlink
+    link_sources: 소스가 같은 파일시스템의 설치본이면 소스 자체를 hardlink (빌드 트리에는 사용 금지)
+    """
+    stats = {"copied": 0, "linked": 0, "reflinked": 0, "skipped": 0, "bytes": 0}
+    pairs = [(src, dst) for src, dst in pairs if os.path.isfile(src)]
+    if not pairs:
+        return stats
+
+    workers = workers or MAX_WORKERS
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # 1단계: 소스 해시 계산 후 같은 내용끼리 묶기
+        hashes = list(executor.map(lambda pair: file_hash(pair[0]), pairs))
+        groups = {}
+        for (src, dst), digest in zip(pairs, hashes):
+            groups.setdefault(digest, []).append((src, dst))
+
+        def install_one(src, dst, digest, link_source=None):
+            if _is_up_to_date(src, dst, digest):
+                return "skipped", 0
+            if link_source and os.path.exists(dst) and os.path.samefile(link_source, dst):
+                return "skipped", 0
+            return _place(src, dst, link_source), os.path.getsize(src)
+
+        def record(results):
+            for method, size in results:
+                stats[method] += 1
+                stats["bytes"] += size if method == "copied" else 0
+
+        # 2단계: 그룹별 대표 파일 설치
+        leaders = []
+        for digest, members in groups.items():
+            src, dst = members[0]
+            link_source = src if link_sources and _same_device(src, dst) else None
+            leaders.append(executor.submit(install_one, src, dst, digest, link_source))
+        record(future.result() for future in leaders)
+
+        # 3단계: 나머지 동일 파일들은 대표 파일에 hardlink
+        followers = []
+        for digest, members in groups.items():
+            leader_dst = members[0][1]
+            for src, dst in members[1:]:
+                link_source = leader_dst if link_identical else None
+                followers.append(executor.submit(install_one, src, dst, digest, link_source))
+        record(future.result() for future in followers)
+
+    return stats
+
+def install_tree(src_dir, dst_dir, delete_stale=True, link_identical=True, link_sources=False, workers=None):
+    """디렉토리 트리를 증분 설치 (rmtree + copytree(symlinks=True) 대체)
+
+    심볼릭 링크(파일/디렉토리)는 따라가지 않고 링크 그대로 설치
+    """
+    pairs = []
+    links = []
+    expected = set()
+    for root, dirs, files in os.walk(src_dir):
+        rel_root = os.path.relpath(root, src_dir)
+        for name in dirs + files:
+            path = os.path.join(root, name)
+            rel_path = os.path.normpath(os.path.join(rel_root, name))
+            if os.path.islink(path):
+                expected.add(rel_path)
+                links.append((os.readlink(path), os.path.join(dst_dir, rel_path)))
+            elif name in files:
+                expected.add(rel_path)
+                pairs.append((path, os.path.join(dst_dir, rel_path)))
+
+    stats = install_files(pairs, link_identical=link_identical, link_sources=link_sources, workers=workers)
+    stats["symlinked"] = 0
+    stats["removed"] = 0
+    for target, dst in links:
+        method = _place_symlink(target, dst)
+        stats[method] += 1
+
+    if delete_stale and os.path.isdir(dst_dir):
+        for root, dirs, files in os.walk(dst_dir):
+            rel_root = os.path.relpath(root, dst_dir)
+            # 디렉토리 심볼릭 링크는 dirs에 나오지만 walk가 따라가지 않으므로 여기서 확인
+            for name in [d for d in dirs if os.path.islink(os.path.join(root, d))] + files:
+                rel_path = os.path.normpath(os.path.join(rel_root, name))
+                if rel_path not in expected:
+                    os.remove(os.path.join(root, name))
+                    stats["removed"] += 1
+
+    return stats
+
+def format_install_stats(stats):
+    text = (f"{stats['copied']} copied ({stats['bytes'] / (1024 * 1024):.1f} MiB), "
+            f"{stats['linked']} hardlinked, {stats['reflinked']} reflinked, {stats['skipped']} unchanged")
+    if stats.get("symlinked"):
+        text += f", {stats['symlinked']} symlinks"
+    if stats.get("removed"):
+        text += f", {stats['removed']} stale removed"
+    return text
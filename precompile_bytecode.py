@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+PySide6 Bytecode Precompiler
+설치된 site-packages를 각 Python 인터프리터로 미리 컴파일 (hash 기반 pyc라 읽기 전용 NFS에서도 유효)
+
+Usage: precompile_bytecode.py <install_root> <python_version>=<python_exe> [...]
+"""
+
+import json
+import os
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+# checked-hash: import 시 소스 해시 확인, unchecked-hash: 확인 없음 (불변 release 설치본에 적합)
+INVALIDATION_MODE = os.environ.get("PYSIDE6_PYC_MODE", "unchecked-hash")
+
+# 대상 인터프리터에서 실행되는 컴파일 스크립트 (결과 통계를 JSON으로 출력)
+_COMPILE_SCRIPT = r"""
+import compileall, importlib.util, json, os, py_compile, sys
+
+root, mode, workers = sys.argv[1], sys.argv[2], int(sys.argv[3])
+invalidation = py_compile.PycInvalidationMode[mode.upper().replace("-", "_")]
+
+def sources():
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d != "__pycache__"]
+        for name in filenames:
+            if name.endswith(".py"):
+                yield os.path.join(dirpath, name)
+
+def cached_state(path):
+    try:
+        with open(importlib.util.cache_from_source(path), "rb") as f:
+            return f.read(16)
+    except OSError:
+        return None
+
+paths = list(sources())
+before = {path: cached_state(path) for path in paths}
+compileall.compile_dir(root, quiet=2, workers=workers, invalidation_mode=invalidation)
+after = {path: cached_state(path) for path in paths}
+
+stats = {"sources": len(paths), "compiled": 0, "unchanged": 0, "failed": 0}
+for path in paths:
+    if after[path] is None:
+        stats["failed"] += 1
+    elif after[path] == before[path]:
+        stats["unchanged"] += 1
+    else:
+        stats["compiled"] += 1
+print(json.dumps(stats))
+"""
+
+def compile_site_packages(python_exe, site_packages, mode=None, workers=0):
+    """한 인터프리터로 site_packages 컴파일, {sources, compiled, unchanged, failed} 또는 {error}"""
+    result = subprocess.run([python_exe, "-c", _COMPILE_SCRIPT, site_packages, mode or INVALIDATION_MODE, str(workers)],
+                            capture_output=True, text=True)
+    if result.returncode != 0:
+        lines = result.stderr.strip().splitlines()
+        return {"error": lines[-1] if lines else f"exit code {result.returncode}"}
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+def precompile_interpreters(interpreters, mode=None):
+    """interpreters: [(python_version, python_exe, site_packages)] → {python_version: stats}"""
+    if not interpreters:
+        return {}
+
+    # 인터프리터별로 동시에 실행하고 CPU를 나눠서 사용
+    workers = max(1, (os.cpu_count() or 1) // len(interpreters))
+    with ThreadPoolExecutor(max_workers=len(interpreters)) as executor:
+        futures = {python_version: executor.submit(compile_site_packages, python_exe, site_packages, mode, workers)
+                   for python_version, python_exe, site_packages in interpreters}
+        return {python_version: future.result() for python_version, future in futures.items()}
+
+def format_compile_stats(stats):
+    if "error" in stats:
+        return f"error: {stats['error']}"
+    return (f"{stats['compiled']} compiled, {stats['unchanged']} unchanged, "
+            f"{stats['failed']} failed ({stats['sources']} sources)")
+
+def main():
+    if len(sys.argv) < 3:
+        print(__doc__.strip())
+        return 1
+
+    install_root = sys.argv[1]
+    interpreters = []
+    for item in sys.argv[2:]:
+        python_version, python_exe = item.split("=", 1)
+        major_minor = ".".join(python_version.split(".")[:2])
+        interpreters.append((python_version, python_exe,
+                             os.path.join(install_root, "lib", f"python{major_minor}", "site-packages")))
+
+    results = precompile_interpreters(interpreters)
+    for python_version, stats in results.items():
+        print(f"🐍 Python {python_version}: {format_compile_stats(stats)}")
+    return 1 if any("error" in stats or stats["failed"] for stats in results.values()) else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+PySide6 uic/rcc Batch Front-end
+여러 .ui/.qrc 파일을 한 번에 병렬 처리하고, 입력 내용 + 도구 버전 해시 캐시로 변경 없는 파일은 다시 생성하지 않는 도구
+
+Usage: pyside6-qt-batch uic|rcc [-j N] [--tool-arg ARG ...] <input>=<output> [...]
+       pyside6-qt-batch serve [-j N] [--socket PATH]
+       pyside6-qt-batch client [--socket PATH] uic|rcc [--tool-arg ARG ...] <input>=<output> [...]
+
+serve 모드는 Unix socket에서 JSON 한 줄 요청을 받음:
+  {"id": 0, "tool": "uic", "input": "a.ui", "output": "ui_a.py", "args": ["-g", "python"]}
+요청은 병렬로 처리되고 응답은 끝나는 순서대로 id/input/output과 함께 한 줄씩 돌아옴
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import socketserver
+import socket
+import subprocess
+import sys
+import tempfile
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor, wait
+from threading import Lock
+
+CACHE_DIR = os.environ.get("PYSIDE6_QT_TOOL_CACHE_DIR", os.path.expanduser("~/.cache/pyside6-qt-tools"))
+DEFAULT_SOCKET = os.environ.get("PYSIDE6_QT_BATCH_SOCKET",
+                                os.path.join(tempfile.gettempdir(), f"pyside6-qt-batch-{os.getuid()}.sock"))
+MAX_WORKERS = int(os.environ.get("PYSIDE6_QT_BATCH_JOBS", str(os.cpu_count() or 4)))
+
+TOOLS = ("uic", "rcc")
+
+_tool_identity_cache = {}
+_tool_identity_lock = Lock()
+
+def hash_file(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def find_tool(tool):
+    """PYSIDE6_UIC / PYSIDE6_RCC, 같은 bin 디렉토리의 pyside6-<tool>, PATH 순서로 검색"""
+    override = os.environ.get(f"PYSIDE6_{tool.upper()}")
+    if override:
+        return override
+    sibling = os.path.join(os.path.dirname(os.path.abspath(__file__)), f"pyside6-{tool}")
+    if os.path.exists(sibling):
+        return sibling
+    return shutil.which(f"pyside6-{tool}") or shutil.which(tool)
+
+def tool_identity(tool_path):
+    """도구 실행 파일 내용 해시 (버전이 바뀌면 캐시 무효화), (path, size, mtime) 기준으로 메모"""
+    real_path = os.path.realpath(tool_path)
+    st = os.stat(real_path)
+    key = (real_path, st.st_size, st.st_mtime_ns)
+    with _tool_identity_lock:
+        if key not in _tool_identity_cache:
+            _tool_identity_cache[key] = hash_file(real_path)
+        return _tool_identity_cache[key]
+
+def qrc_dependencies(qrc_path):
+    """.qrc가 참조하는 파일 목록 (rcc 출력은 이 파일들 내용에 따라 달라짐)"""
+    base_dir = os.path.dirname(os.path.abspath(qrc_path))
+    try:
+        tree = ET.parse(qrc_path)
+    except ET.ParseError:
+        return []
+    return [os.path.join(base_dir, element.text.strip()) for element in tree.iter("file") if element.text]
+
+def cache_key(tool, tool_path, args, input_path):
+    digest = hashlib.sha256()
+    digest.update(tool.encode())
+    digest.update(tool_identity(tool_path).encode())
+    digest.update(json.dumps(list(args)).encode())
+    # uic는 출력에 입력 파일 이름을 넣으므로 내용이 같아도 이름이 다르면 다른 결과
+    digest.update(os.path.basename(input_path).encode())
+    digest.update(hash_file(input_path).encode())
+    if tool == "rcc":
+        for dependency in qrc_dependencies(input_path):
+            digest.update(os.path.relpath(dependency, os.path.dirname(os.path.abspath(input_path))).encode())
+            digest.update(hash_file(dependency).encode() if os.path.isfile(dependency) else b"missing")
+    return digest.hexdigest()
+
+def _replace_if_changed(src, dst):
+    """내용이 같으면 dst를 그대로 둬서 mtime 유지 (하위 빌드 단계 재실행 방지)"""
+    if os.path.exists(dst) and os.path.getsize(dst) == os.path.getsize(src) and hash_file(dst) == hash_file(src):
+        return False
+    os.makedirs(os.path.dirname(os.path.abspath(dst)), exist_ok=True)
+    tmp = f"{dst}.tmp-{os.getpid()}"
+    shutil.copyfile(src, tmp)
+    os.replace(tmp, dst)
+    return True
+
+def process(tool, input_path, output_path, args=()):
+    """입력 하나 처리, {input, output, status: cached|generated|unchanged|failed, message}"""
+    result = {"input": input_path, "output": output_path, "status": "failed", "message": ""}
+    tool_path = find_tool(tool)
+    if tool not in TOOLS or not tool_path:
+        result["message"] = f"tool not found: {tool}"
+        return result
+    if not os.path.isfile(input_path):
+        result["message"] = f"input not found: {input_path}"
+        return result
+
+    key = cache_key(tool, tool_path, args, input_path)
+    entry = os.path.join(CACHE_DIR, key[:2], key)
+
+    if os.path.exists(entry):
+        result["status"] = "cached" if _replace_if_changed(entry, output_path) else "unchanged"
+        return result
+
+    os.makedirs(os.path.dirname(entry), exist_ok=True)
+    fd, tmp_output = tempfile.mkstemp(prefix=f"{key[:12]}.", dir=os.path.dirname(entry))
+    os.close(fd)
+    try:
+        completed = subprocess.run([tool_path, *args, input_path, "-o", tmp_output], capture_output=True, text=True)
+        if completed.returncode != 0:
+            result["message"] = completed.stderr.strip() or f"exit code {completed.returncode}"
+            return result
+        _replace_if_changed(tmp_output, output_path)
+        os.replace(tmp_output, entry)
+        tmp_output = None
+        result["status"] = "generated"
+        return result
+    finally:
+        if tmp_output and os.path.exists(tmp_output):
+            os.remove(tmp_output)
+
+def process_batch(tool, pairs, args=(), jobs=None):
+    with ThreadPoolExecutor(max_workers=jobs or MAX_WORKERS) as executor:
+        return list(executor.map(lambda pair: process(tool, pair[0], pair[1], args), pairs))
+
+def handle_request(line):
+    """요청 한 줄 처리, 응답에는 요청의 id/input/output을 그대로 붙임 (응답 순서가 요청 순서와 다름)"""
+    request = {}
+    try:
+        request = json.loads(line)
+        response = process(request["tool"], request["input"], request["output"], request.get("args", []))
+    except (ValueError, KeyError, TypeError) as e:
+        response = {"status": "failed", "message": f"bad request: {e}"}
+    except OSError as e:
+        response = {"status": "failed", "message": str(e)}
+    if isinstance(request, dict):
+        for field in ("id", "input", "output"):
+            if field in request:
+                response.setdefault(field, request[field])
+    return response
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """요청 한 줄(JSON)마다 서버 작업 풀에서 처리하고, 끝나는 대로 결과 한 줄(JSON) 응답"""
+
+    def handle(self):
+        write_lock = Lock()
+        futures = []
+
+        def respond(line):
+            response = handle_request(line)
+            with write_lock:
+                try:
+                    self.wfile.write((json.dumps(response) + "\n").encode())
+                    self.wfile.flush()
+                except OSError:
+                    pass  # 클라이언트가 먼저 연결을 끊음
+
+        for line in self.rfile:
+            if line.strip():
+                futures.append(self.server.executor.submit(respond, line))
+
+        # 요청을 다 읽어도 모든 응답을 보낼 때까지 연결 유지
+        wait(futures)
+
+class _ThreadingUnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+def serve(socket_path, jobs=None):
+    if os.path.exists(socket_path):
+        os.remove(socket_path)
+    with _ThreadingUnixServer(socket_path, _RequestHandler) as server, \
+            ThreadPoolExecutor(max_workers=jobs or MAX_WORKERS) as executor:
+        server.executor = executor
+        print(f"🛰️  Serving uic/rcc requests on {socket_path}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            os.remove(socket_path)
+    return 0
+
+def request_batch(socket_path, tool, pairs, args=()):
+    """serve 모드 서버에 요청을 보내고 결과 목록 반환 (완료 순서로 온 응답을 id로 요청 순서에 맞춤)"""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(socket_path)
+        stream = client.makefile("rwb")
+        for request_id, (input_path, output_path) in enumerate(pairs):
+            request = {"id": request_id, "tool": tool, "input": os.path.abspath(input_path),
+                       "output": os.path.abspath(output_path), "args": list(args)}
+            stream.write((json.dumps(request) + "\n").encode())
+        stream.flush()
+        client.shutdown(socket.SHUT_WR)
+        results = [None] * len(pairs)
+        for line in stream:
+            response = json.loads(line)
+            results[response["id"]] = response
+        return [result or {"input": pair[0], "status": "failed", "message": "no response from server"}
+                for pair, result in zip(pairs, results)]
+
+def parse_batch_arguments(args):
+    """(tool, tool_args, pairs, jobs, socket_path)"""
+    tool, tool_args, pairs, jobs, socket_path = None, [], [], None, DEFAULT_SOCKET
+    while args:
+        item = args.pop(0)
+        if item in TOOLS and tool is None:
+            tool = item
+        elif item == "--tool-arg" and args:
+            tool_args.append(args.pop(0))
+        elif item == "-j" and args:
+            jobs = int(args.pop(0))
+        elif item == "--socket" and args:
+            socket_path = args.pop(0)
+        elif "=" in item:
+            pairs.append(tuple(item.split("=", 1)))
+        else:
+            raise ValueError(f"unexpected argument: {item}")
+    return tool, tool_args, pairs, jobs, socket_path
+
+def report(results):
+    counts = {}
+    for result in results:
+        counts[result["status"]] = counts.get(result["status"], 0) + 1
+        if result["status"] == "failed":
+            print(f"❌ {result.get('input', '?')}: {result['message']}", file=sys.stderr)
+    print(", ".join(f"{count} {status}" for status, count in sorted(counts.items())) or "nothing to do")
+    return 1 if counts.get("failed") else 0
+
+def main():
+    args = sys.argv[1:]
+    if not args:
+        print(__doc__.strip())
+        return 1
+
+    command = args[0]
+    try:
+        tool, tool_args, pairs, jobs, socket_path = parse_batch_arguments(args[1:] if command in ("serve", "client") else args)
+        if command == "serve":
+            return serve(socket_path, jobs)
+        if command == "client":
+            if tool is None:
+                raise ValueError("client needs a tool (uic or rcc)")
+            return report(request_batch(socket_path, tool, pairs, tool_args))
+        if command in TOOLS:
+            return report(process_batch(tool, pairs, tool_args, jobs))
+    except ValueError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 2
+
+    print(f"Unknown command: {command}")
+    print(__doc__.strip())
+    return 1
+
+if __name__ == "__main__":
+    sys.exit(main())
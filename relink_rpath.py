@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+PySide6 RUNPATH Relinker
+설치된 *.abi3.so / libpyside6*.so 의 RUNPATH를 실제 의존 라이브러리가 있는 디렉토리의
+$ORIGIN 상대 경로(트리 밖 의존성은 절대 경로)로 다시 쓰고, 찾을 수 없는 DT_NEEDED 를 보고하는 도구
+
+Usage: relink_rpath.py <install_root> [--check]
+"""
+
+import fnmatch
+import os
+import shutil
+import struct
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+# 설치 트리 밖에서 찾는 의존 라이브러리 디렉토리 (rez 패키지 경로, 순서대로 검색)
+DEPENDENCY_LIB_DIRS = [
+    "/core/Linux/APPZ/packages/qt/6.9.1/lib",
+    "/core/Linux/APPZ/packages/shiboken6/6.9.1/lib",
+    "/core/Linux/APPZ/packages/minizip_ng/4.0.10/lib64",
+    "/core/Linux/APPZ/packages/minizip_ng/4.0.10/lib",
+]
+
+# 시스템 기본 검색 경로 (ld.so.cache에 없을 때 확인)
+SYSTEM_LIB_DIRS = ["/lib64", "/usr/lib64", "/lib", "/usr/lib"]
+
+RELINK_PATTERNS = ("*.abi3.so", "libpyside6*.so*")
+
+# DT_NULL, DT_NEEDED, DT_STRTAB, DT_RPATH, DT_RUNPATH
+DT_NULL, DT_NEEDED, DT_STRTAB, DT_RPATH, DT_RUNPATH = 0, 1, 5, 15, 29
+PT_LOAD, PT_DYNAMIC = 1, 2
+
+def find_patchelf():
+    return os.environ.get("PYSIDE6_PATCHELF") or shutil.which("patchelf")
+
+def read_dynamic(path):
+    """ELF64 (little endian) dynamic section에서 {needed, runpath, rpath} 읽기, ELF가 아니면 None"""
+    with open(path, "rb") as f:
+        header = f.read(64)
+        if len(header) < 64 or header[:4] != b"\x7fELF" or header[4] != 2 or header[5] != 1:
+            return None
+
+        e_phoff = struct.unpack_from("<Q", header, 32)[0]
+        e_phentsize, e_phnum = struct.unpack_from("<HH", header, 54)
+
+        loads = []
+        dynamic = None
+        for index in range(e_phnum):
+            f.seek(e_phoff + index * e_phentsize)
+            p_type, _, p_offset, p_vaddr, _, p_filesz, _, _ = struct.unpack("<IIQQQQQQ", f.read(56))
+            if p_type == PT_LOAD:
+                loads.append((p_vaddr, p_offset, p_filesz))
+            elif p_type == PT_DYNAMIC:
+                dynamic = (p_offset, p_filesz)
+
+        result = {"needed": [], "runpath": None, "rpath": None}
+        if not dynamic:
+            return result
+
+        f.seek(dynamic[0])
+        data = f.read(dynamic[1])
+        entries = []
+        for offset in range(0, len(data) - 15, 16):
+            tag, value = struct.unpack_from("<qQ", data, offset)
+            if tag == DT_NULL:
+                break
+            entries.append((tag, value))
+
+        strtab = next((value for tag, value in entries if tag == DT_STRTAB), None)
+        strtab_offset = next((offset + strtab - vaddr for vaddr, offset, size in loads
+                              if strtab is not None and vaddr <= strtab < vaddr + size), None)
+        if strtab_offset is None:
+            return result
+
+        def read_string(index):
+            f.seek(strtab_offset + index)
+            raw = b""
+            while b"\0" not in raw:
+                chunk = f.read(256)
+                if not chunk:
+                    break
+                raw += chunk
+            return raw.split(b"\0", 1)[0].decode("utf-8", "replace")
+
+        for tag, value in entries:
+            if tag == DT_NEEDED:
+                result["needed"].append(read_string(value))
+            elif tag == DT_RUNPATH:
+                result["runpath"] = read_string(value)
+            elif tag == DT_RPATH:
+                result["rpath"] = read_string(value)
+        return result
+
+def system_libraries():
+    """ld.so.cache에 등록된 x86-64 라이브러리 이름 집합"""
+    try:
+        output = subprocess.run(["ldconfig", "-p"], capture_output=True, text=True).stdout
+    except OSError:
+        return set()
+    return {line.split()[0] for line in output.splitlines()[1:] if "x86-64" in line}
+
+def find_relink_targets(install_root):
+    targets = []
+    for root, dirs, files in os.walk(install_root):
+        for name in files:
+            path = os.path.join(root, name)
+            if not os.path.islink(path) and any(fnmatch.fnmatch(name, p) for p in RELINK_PATTERNS):
+                targets.append(path)
+    return sorted(targets)
+
+def index_shared_objects(install_root):
+    """설치 트리 안의 라이브러리 이름 -> 디렉토리 목록"""
+    index = {}
+    for root, dirs, files in os.walk(install_root):
+        for name in files:
+            if ".so" in name:
+                index.setdefault(name, []).append(root)
+    return index
+
+def origin_relative(lib_dir, origin_dir):
+    rel = os.path.relpath(lib_dir, origin_dir)
+    return "$ORIGIN" if rel == "." else f"$ORIGIN/{rel}"
+
+def plan_runpath(path, needed, install_root, index, system_libs):
+    """(새 RUNPATH, 찾지 못한 라이브러리 목록)"""
+    file_dir = os.path.dirname(path)
+    search_dirs = [file_dir, os.path.join(install_root, "lib")] + DEPENDENCY_LIB_DIRS
+
+    lib_dirs = []
+    unresolved = []
+    for lib in needed:
+        found = next((d for d in search_dirs if os.path.exists(os.path.join(d, lib))), None)
+        if found is None and lib in index:
+            found = index[lib][0]
+        if found is None:
+            if lib not in system_libs and not any(os.path.exists(os.path.join(d, lib)) for d in SYSTEM_LIB_DIRS):
+                unresolved.append(lib)
+            continue
+        if found not in lib_dirs:
+            lib_dirs.append(found)
+
+    # 설치 트리 안은 release 위치와 무관하게 상대 경로가 같고,
+    # 밖(rez 패키지)은 절대 경로 (공개 경로는 release 디렉토리로 가는 심볼릭 링크라서
+    # $ORIGIN/.. 이 실제 release 위치 기준으로 풀리므로 상대 경로로는 가리킬 수 없음)
+    runpath = []
+    for lib_dir in lib_dirs:
+        if lib_dir == install_root or lib_dir.startswith(install_root + os.sep):
+            entry = origin_relative(lib_dir, file_dir)
+        else:
+            entry = lib_dir
+        if entry not in runpath:
+            runpath.append(entry)
+    return ":".join(runpath), unresolved
+
+def set_runpath(patchelf, path, runpath):
+    """복사본을 patch한 뒤 교체 (hardlink로 공유된 이전 release 파일을 건드리지 않음)"""
+    tmp = f"{path}.tmp-relink-{os.getpid()}"
+    shutil.copy2(path, tmp)
+    try:
+        subprocess.run([patchelf, "--set-rpath", runpath, tmp], check=True, capture_output=True, text=True)
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+def relink_install_tree(install_root, check_only=False, workers=8):
+    """설치 트리 RUNPATH 재작성, {relinked, unchanged, skipped, unresolved: {path: [libs]}, changed: [paths]} 반환"""
+    install_root = os.path.abspath(install_root)
+    patchelf = None if check_only else find_patchelf()
+
+    targets = find_relink_targets(install_root)
+    index = index_shared_objects(install_root)
+    system_libs = system_libraries()
+
+    stats = {"relinked": 0, "unchanged": 0, "skipped": 0, "unresolved": {}, "changed": []}
+
+    def relink(path):
+        dynamic = read_dynamic(path)
+        if dynamic is None:
+            return path, "skipped", []
+        runpath, unresolved = plan_runpath(path, dynamic["needed"], install_root, index, system_libs)
+        if not patchelf or not runpath or runpath == dynamic["runpath"]:
+            return path, "unchanged" if runpath == dynamic["runpath"] else "skipped", unresolved
+        set_runpath(patchelf, path, runpath)
+        return path, "relinked", unresolved
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for path, result, unresolved in executor.map(relink, targets):
+            stats[result] += 1
+            if result == "relinked":
+                stats["changed"].append(path)
+            if unresolved:
+                stats["unresolved"][path] = unresolved
+
+    stats["patchelf"] = patchelf
+    return stats
+
+def format_relink_stats(stats):
+    text = f"{stats['relinked']} relinked, {stats['unchanged']} unchanged, {stats['skipped']} skipped"
+    if stats["unresolved"]:
+        text += f", {len(stats['unresolved'])} with unresolved DT_NEEDED"
+    return text
+
+def main():
+    args = sys.argv[1:]
+    if not args or args[0].startswith("-"):
+        print(__doc__.strip())
+        return 1
+
+    install_root = args[0]
+    check_only = "--check" in args
+
+    stats = relink_install_tree(install_root, check_only=check_only)
+    if not check_only and not stats["patchelf"]:
+        print("⚠️  patchelf not found, RUNPATH left unchanged")
+    print(f"🔗 RUNPATH: {format_relink_stats(stats)}")
+    for path, libs in sorted(stats["unresolved"].items()):
+        print(f"❌ {os.path.relpath(path, install_root)}: {', '.join(libs)}")
+    return 1 if stats["unresolved"] else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
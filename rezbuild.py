@@ -1,8 +1,25 @@
 # -*- coding: utf-8 -*-
-import os, sys, shutil, subprocess, json, time, psutil
+import os, sys, re, glob, shutil, subprocess, json, time, hashlib, queue, atexit, psutil
 from pathlib import Path
+from collections import deque
 from datetime import datetime
-from threading import Thread, Event
+from threading import Thread, Event, Lock, current_thread
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from contextlib import contextmanager, nullcontext
+
+from compiler_cache import compiler_cache_environment, reset_compiler_cache_stats, compiler_cache_stats, format_compiler_cache_stats
+from parallel_install import MAX_WORKERS as PARALLEL_INSTALL_WORKERS
+from install_manifest import InstallManifest, format_manifest_stats, verify_manifest, refresh_manifest_entries
+from relink_rpath import relink_install_tree, format_relink_stats
+from import_benchmark import run_benchmarks
+from smoke_matrix import run_matrix, summarize_matrix, write_results
+from precompile_bytecode import precompile_interpreters, format_compile_stats
+from build_metrics import BuildMetrics, OutputPhaseTimer, ALL_VERSIONS, format_duration, load_module_history
+from build_progress import ProgressBoard, NINJA_STATUS_PATTERN
+from job_throttle import MemoryThrottle, recommended_jobs, COMPILE_JOB_MEMORY_GB, LINK_JOB_MEMORY_GB, MAX_LINK_JOBS, MEMORY_RESERVE_GB
+from build_lock import BuildLock, BuildLockLost, describe_owner, lock_path, terminate_process_tree
+from shiboken_cache import write_cmake_include as write_shiboken_cache_include
+from ninja_log_analyzer import analyze as analyze_ninja_build_dirs, format_report as format_ninja_report, write_chrome_trace, write_report as write_ninja_report
 
 # Smart Build Management Variables
 _build_log_file = None
@@ -11,72 +28,236 @@ _retry_count = 0
 _max_retries = 3
 _auto_build_system = "/home/m83/chulho/auto-build-system/1.0.0"
 
+# abi3 (Limited API) 트리를 한 번만 컴파일하고 나머지 Python 버전에는 설치만 수행
+_abi3_build_once = os.environ.get("PYSIDE6_ABI3_BUILD_ONCE", "1") == "1"
+
+# Python 버전별 병렬 빌드 설정 (0 = 자동)
+_max_parallel_builds = int(os.environ.get("PYSIDE6_PARALLEL_BUILDS", "0"))
+_min_jobs_per_build = int(os.environ.get("PYSIDE6_MIN_JOBS_PER_BUILD", "8"))
+
+# 동시 빌드 스레드가 공유하는 프로세스 상태 보호
+# (os.environ 변경/복사, 자동 수정, setup.py가 소스 트리에 쓰는 build_history/egg-info 준비 단계)
+_environment_lock = Lock()
+_source_tree_lock = Lock()
+
+# 메모리 기반 컴파일/링크 동시 실행 수 조절 (job_throttle.py, ninja -j는 상한으로만 사용)
+_job_throttle_enabled = os.environ.get("PYSIDE6_JOB_THROTTLE", "1") == "1"
+_job_throttle = None
+# 같은 빌드 루트의 동시 빌드는 lock 파일로 조정 (PYSIDE6_BUILD_LOCK_POLICY: reuse | wait | fail)
+_build_lock = None
+
+# 실행 중인 stream_cmd 프로세스 (잠금을 빼앗기면 종료)
+_running_processes = set()
+_running_processes_lock = Lock()
+
+_oom_pattern = re.compile(r"Killed signal terminated program|terminated with signal 9|virtual memory exhausted|"
+                          r"out of memory allocating")
+
+# 입력 fingerprint 기반 증분 빌드 (fingerprint 파일은 .json이라 clean_build_dir에서 보존됨)
+_incremental_builds = os.environ.get("PYSIDE6_INCREMENTAL", "1") == "1"
+_build_fingerprint_name = "build_fingerprint.json"
+
+# shiboken 생성 결과 캐시 (shiboken_cache.py)
+_shiboken_generation_cache = os.environ.get("PYSIDE6_SHIBOKEN_CACHE", "1") == "1"
+
+# build.sh에서 검증된 경로들
+_buildsh_qt_dir = "/core/Linux/APPZ/packages/qt/6.9.1"
+_buildsh_shiboken_dir = "/core/Linux/APPZ/packages/shiboken6/6.9.1"
+
+# 버퍼링된 백그라운드 로그 writer (시간/크기 기준으로 flush)
+_json_log_file = None
+_log_queue = queue.SimpleQueue()
+_log_writer_thread = None
+_log_flush_interval = float(os.environ.get("PYSIDE6_LOG_FLUSH_INTERVAL", "1.0"))
+_log_flush_bytes = int(os.environ.get("PYSIDE6_LOG_FLUSH_BYTES", str(256 * 1024)))
+_log_json_enabled = os.environ.get("PYSIDE6_JSON_LOG", "0") == "1"
+_LOG_STOP = object()
+
+# 스테이징 설치: 사이블링 release 디렉토리에 완성된 트리를 만든 뒤 심볼릭 링크 교체로 한 번에 공개
+_staged_install = os.environ.get("PYSIDE6_STAGED_INSTALL", "1") == "1"
+_keep_releases = int(os.environ.get("PYSIDE6_KEEP_RELEASES", "3"))
+_publish_partial = os.environ.get("PYSIDE6_PUBLISH_PARTIAL", "0") == "1"
+
+# 설치 후 서브모듈 import 시간 벤치마크 (이전 설치본 대비 회귀 표시)
+_import_benchmark = os.environ.get("PYSIDE6_IMPORT_BENCHMARK", "1") == "1"
+
+# 단계별 소요 시간 기록 (build_metrics.py, SQLite)
+_build_metrics_enabled = os.environ.get("PYSIDE6_BUILD_METRICS", "1") == "1"
+_build_metrics = None
+
+# NINJA_STATUS 기반 버전별 진행률/ETA (PYSIDE6_PROGRESS_INTERVAL 초마다 한 줄)
+_build_progress = None
+
+# 0이면 컴파일러 명령줄 등 빌드 출력은 로그 파일에만 기록하고 콘솔에는 진행 상태만 표시
+_console_build_output = os.environ.get("PYSIDE6_CONSOLE_BUILD_OUTPUT", "1") == "1"
+
+# 빌드 후 .ninja_log 분석 (critical path, 느린 TU, 모듈별 합계, Chrome trace)
+_ninja_log_analysis = os.environ.get("PYSIDE6_NINJA_ANALYSIS", "1") == "1"
+
+# 실패 보고용으로 보관하는 마지막 출력 줄 수
+_output_tail_lines = int(os.environ.get("PYSIDE6_OUTPUT_TAIL_LINES", "200"))
+_ninja_failed_pattern = re.compile(r"^FAILED: (.+?)\s*$")
+
+def _log_writer_loop(log_file, json_log_file):
+    """Drain queued log records into long-lived buffered handles"""
+    handle = open(log_file, 'a', encoding='utf-8', buffering=_log_flush_bytes)
+    json_handle = open(json_log_file, 'a', encoding='utf-8', buffering=_log_flush_bytes) if json_log_file else None
+    pending_bytes = 0
+    last_flush = time.monotonic()
+    
+    try:
+        while True:
+            try:
+                record = _log_queue.get(timeout=_log_flush_interval)
+            except queue.Empty:
+                record = None
+            
+            if record is _LOG_STOP:
+                break
+            
+            flush_done = None
+            if isinstance(record, Event):
+                # flush_build_log() 요청
+                flush_done = record
+            elif record is not None:
+                log_entry, json_record = record
+                handle.write(f"{log_entry}\n")
+                pending_bytes += len(log_entry) + 1
+                if json_handle and json_record:
+                    json_handle.write(json.dumps(json_record, ensure_ascii=False) + "\n")
+            
+            now = time.monotonic()
+            if flush_done or pending_bytes >= _log_flush_bytes or (pending_bytes and now - last_flush >= _log_flush_interval):
+                handle.flush()
+                if json_handle:
+                    json_handle.flush()
+                pending_bytes = 0
+                last_flush = now
+            
+            if flush_done:
+                flush_done.set()
+    finally:
+        handle.close()
+        if json_handle:
+            json_handle.close()
+
+def start_log_writer(log_file):
+    """Start the background log writer for log_file (plus a .jsonl twin if enabled)"""
+    global _build_log_file, _json_log_file, _log_writer_thread
+    
+    stop_log_writer()
+    
+    _build_log_file = log_file
+    _json_log_file = os.path.splitext(log_file)[0] + ".jsonl" if _log_json_enabled else None
+    os.makedirs(os.path.dirname(os.path.abspath(log_file)), exist_ok=True)
+    
+    _log_writer_thread = Thread(target=_log_writer_loop, args=(log_file, _json_log_file),
+                                name="smart-log-writer", daemon=True)
+    _log_writer_thread.start()
+    atexit.register(stop_log_writer)
+
+def flush_build_log(timeout=10):
+    """Block until everything logged so far is on disk"""
+    if _log_writer_thread and _log_writer_thread.is_alive():
+        done = Event()
+        _log_queue.put(done)
+        done.wait(timeout)
+
+def stop_log_writer():
+    """Flush and close the background log writer"""
+    global _log_writer_thread
+    
+    if _log_writer_thread and _log_writer_thread.is_alive():
+        _log_queue.put(_LOG_STOP)
+        _log_writer_thread.join(timeout=30)
+    _log_writer_thread = None
+
 def smart_log(message, level="INFO"):
     """Enhanced logging with auto-build system integration"""
-    global _build_log_file
-    timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    now = datetime.now()
+    timestamp = now.strftime('%Y-%m-%d %H:%M:%S')
     log_entry = f"[{timestamp}] [{level}] {message}"
     print(log_entry)
     
-    if _build_log_file:
+    if _log_writer_thread:
+        json_record = {"time": now.isoformat(), "level": level, "thread": current_thread().name, "message": message}
+        _log_queue.put((log_entry, json_record))
+    elif _build_log_file:
         with open(_build_log_file, 'a', encoding='utf-8') as f:
             f.write(f"{log_entry}\n")
-            f.flush()
 
-def detect_and_terminate_builds():
-    """Detect and safely terminate any running PySide6 builds"""
-    smart_log("🔍 Checking for running build processes...")
-    
-    terminated_count = 0
-    for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
-        try:
-            cmdline = ' '.join(proc.info['cmdline'] or [])
-            if ('rez-build' in cmdline or 'setup.py' in cmdline) and 'pyside' in cmdline.lower():
-                smart_log(f"🛑 Terminating running build: PID {proc.info['pid']}")
-                proc.terminate()
-                try:
-                    proc.wait(timeout=10)
-                except psutil.TimeoutExpired:
-                    proc.kill()
-                terminated_count += 1
-        except (psutil.NoSuchProcess, psutil.AccessDenied):
-            continue
-    
-    if terminated_count > 0:
-        smart_log(f"✅ Terminated {terminated_count} running build process(es)")
-        time.sleep(3)  # Allow cleanup
+def log_output(line):
+    """Tee one raw line of subprocess output to the console and the build log"""
+    if _console_build_output:
+        sys.stdout.write(line if line.endswith("\n") else f"{line}\n")
+    
+    if _log_writer_thread:
+        _log_queue.put((line.rstrip("\n"), None))
+    elif _build_log_file:
+        with open(_build_log_file, 'a', encoding='utf-8') as f:
+            f.write(line if line.endswith("\n") else f"{line}\n")
+
+def acquire_build_lock(build_path, version, targets):
+    """같은 빌드 루트를 쓰는 다른 빌드와 lock 파일로 조정 (실행 중인 빌드를 종료하지 않음)
+    
+    "acquired", "reused" (기다린 빌드가 같은 결과를 이미 만듦), "busy" 또는 "timeout" 반환
+    """
+    global _build_lock
+    
+    smart_log("🔒 Acquiring build lock...")
+    lock = BuildLock(build_path, version, targets, log=smart_log, log_file=_build_log_file,
+                     progress=lambda: _build_progress.status_line() if _build_progress else None,
+                     on_lost=abort_running_commands)
+    state, info = lock.acquire()
+    if state == "acquired":
+        _build_lock = lock
+        smart_log(f"✅ Build lock acquired: {lock_path(build_path)}")
+    elif state == "reused":
+        smart_log(f"♻️  Build finished at {info['finished']} by {info['owner']} already covers this request")
     else:
-        smart_log("✅ No conflicting build processes found")
+        smart_log(f"❌ Build root is locked by {describe_owner(info)} ({state})", "ERROR")
+    return state
+
+def set_build_stage(stage):
+    """대기 중인 다른 빌드에 보여줄 현재 단계 기록 (잠금을 빼앗겼으면 BuildLockLost로 빌드 중단)"""
+    if _build_lock:
+        _build_lock.update(stage=stage)
+
+def check_build_lock():
+    """잠금을 빼앗긴 뒤에는 새 명령을 실행하거나 재시도하지 않도록 BuildLockLost"""
+    if _build_lock:
+        _build_lock.check()
 
-def analyze_and_fix_errors():
-    """Analyze build log and apply automatic fixes"""
-    global _build_log_file, _error_count
+def abort_running_commands():
+    """잠금을 빼앗겼을 때 실행 중인 빌드 명령(setup.py, ninja, 컴파일러)을 모두 종료"""
+    with _running_processes_lock:
+        processes = list(_running_processes)
+    for process in processes:
+        smart_log(f"🛑 Terminating {process.args if isinstance(process.args, str) else ' '.join(process.args)}", "ERROR")
+        terminate_process_tree(process.pid)
+
+def release_build_lock(status, **details):
+    global _build_lock
     
-    if not _build_log_file or not os.path.exists(_build_log_file):
-        return False
+    if _build_lock:
+        _build_lock.release(status, **details)
+        _build_lock = None
+
+def analyze_and_fix_errors(records, applied_fingerprints):
+    """Apply automatic fixes for the error records streamed from one failed command
     
+    records는 실패한 명령의 출력에서만 수집된 것 (동시에 빌드 중인 다른 버전의 에러는 섞이지 않음),
+    applied_fingerprints는 같은 빌드의 재시도 간에 유지되는 이미 수정한 에러 목록
+    """
     smart_log("🔍 Analyzing build errors...")
     
     fixes_applied = 0
     
-    # Read recent log content
     try:
-        with open(_build_log_file, 'r', encoding='utf-8', errors='ignore') as f:
-            log_content = f.read()
-        
-        # Check for common PySide6 build issues
-        if "stdbool.h" in log_content.lower() and "not found" in log_content.lower():
-            fixes_applied += fix_stdbool_headers()
-        
-        if "shiboken" in log_content.lower() and ("include" in log_content.lower() or "header" in log_content.lower()):
-            fixes_applied += fix_shiboken_wrapper()
-        
-        if "python" in log_content.lower() and "not found" in log_content.lower():
-            fixes_applied += fix_python_environment()
-        
-        if "cmake" in log_content.lower() and ("qt" in log_content.lower() or "config" in log_content.lower()):
-            fixes_applied += fix_cmake_configuration()
-            
+        for record in records:
+            location = f"{record['file']}:{record['line']} " if record['file'] else ""
+            smart_log(f"🔎 [{record['rule']}] {location}{record['text'][:200]}")
+        fixes_applied = apply_error_fixes(records, applied_fingerprints)
     except Exception as e:
         smart_log(f"⚠️  Error analyzing log: {e}")
     
@@ -231,16 +412,243 @@ def fix_cmake_configuration():
         smart_log(f"❌ Failed to fix CMake configuration: {e}")
         return 0
 
-def run_cmd(cmd, cwd=None):
+# 빌드 로그 에러 규칙: (이름, 정규식, 자동 수정 함수)
+_ERROR_RULES = [
+    ("stdbool_header",
+     r"(?:fatal error: stdbool\.h: No such file or directory|'stdbool\.h' file not found)",
+     fix_stdbool_headers),
+    ("shiboken_header",
+     r"(?:shiboken6?|clang)[^\n]*?(?:fatal )?error: '?[\w./+-]+\.h'? (?:file not found|No such file or directory)",
+     fix_shiboken_wrapper),
+    ("python_not_found",
+     r"(?:Could NOT find Python3?\b|Python3? (?:interpreter|executable|Development) (?:was )?not found|python3?: (?:command )?not found)",
+     fix_python_environment),
+    ("cmake_qt_config",
+     r"(?:Could not find a package configuration file provided by \"Qt6|Could NOT find Qt6|CMake Error at [^\n]*Qt6)",
+     fix_cmake_configuration),
+]
+_error_pattern = re.compile("|".join(f"(?P<{name}>{pattern})" for name, pattern, _ in _ERROR_RULES))
+_error_location_pattern = re.compile(r"(?P<file>[\w./+-]+\.(?:c|cc|cpp|cxx|h|hh|hpp|xml|cmake|txt)):(?P<line>\d+)")
+_error_fixers = {name: fixer for name, _, fixer in _ERROR_RULES}
+
+def match_error_lines(text, fingerprints):
+    """Return error records for rule matches in text not yet seen in fingerprints (fingerprint -> record)"""
+    records = []
+    for match in _error_pattern.finditer(text):
+        line_start = text.rfind("\n", 0, match.start()) + 1
+        line_end = text.find("\n", match.end())
+        line = text[line_start:line_end if line_end != -1 else len(text)].strip()
+        
+        location = _error_location_pattern.search(line)
+        source_file = location.group("file") if location else None
+        source_line = int(location.group("line")) if location else None
+        
+        # 매칭된 부분만 사용 (타임스탬프/로그 prefix 제외), 주소/숫자는 정규화
+        normalized = re.sub(r"0x[0-9a-fA-F]+|\d+", "#", match.group())
+        fingerprint = hashlib.sha1(f"{match.lastgroup}|{source_file}|{source_line}|{normalized}".encode()).hexdigest()[:16]
+        
+        if fingerprint in fingerprints:
+            fingerprints[fingerprint]["count"] += 1
+            continue
+        
+        record = {"fingerprint": fingerprint, "rule": match.lastgroup, "file": source_file,
+                  "line": source_line, "text": line, "count": 1}
+        fingerprints[fingerprint] = record
+        records.append(record)
+    return records
+
+def apply_error_fixes(records, applied_fingerprints):
+    """Apply each rule's fix at most once per new error fingerprint"""
+    fixes_applied = 0
+    applied_rules = set()
+    for record in records:
+        if record["rule"] in applied_rules or record["fingerprint"] in applied_fingerprints:
+            continue
+        applied_fingerprints.add(record["fingerprint"])
+        applied_rules.add(record["rule"])
+        fixes_applied += _error_fixers[record["rule"]]()
+    return fixes_applied
+
+def timed_phase(python_version, phase):
+    """Context manager timing one build phase into the metrics store (no-op when metrics are disabled)"""
+    if _build_metrics:
+        return _build_metrics.phase(python_version, phase)
+    return nullcontext({"status": "ok"})
+
+def output_phase_timer(python_version):
+    """Split streamed setup.py build output into configure/shiboken/compile/link timings"""
+    return OutputPhaseTimer(_build_metrics, python_version)
+
+@contextmanager
+def source_tree_turn():
+    """Hold the shared source tree while setup.py prepares it, yielding a release for the first ninja line"""
+    released = Event()
+    _source_tree_lock.acquire()
+    
+    def release():
+        if not released.is_set():
+            released.set()
+            _source_tree_lock.release()
+    
+    try:
+        yield release
+    finally:
+        release()
+
+def build_output_handler(python_version, timer, release_source_tree=None):
+    """on_line callback feeding the phase timer and the live progress board"""
+    def on_line(line):
+        # ninja가 시작되면 setup.py의 소스 트리 준비가 끝났으므로 다른 버전 빌드 진행
+        if release_source_tree and NINJA_STATUS_PATTERN.match(line):
+            release_source_tree()
+        timer.feed(line)
+        if _build_progress:
+            _build_progress.feed(python_version, line)
+        if _job_throttle and _oom_pattern.search(line):
+            _job_throttle.report_oom()
+    return on_line
+
+def register_build_progress(python_versions):
+    """빌드할 버전을 미리 등록 - 진행 상태/모듈 이력은 major.minor ("3.13") 기준이므로 같은 키로 등록"""
+    if _build_progress:
+        _build_progress.register([".".join(version.split(".")[:2]) for version in python_versions])
+
+def restart_build_progress(python_version):
+    if _build_progress:
+        _build_progress.restart(python_version)
+
+def close_build_progress(python_version, ok):
+    if _build_progress:
+        _build_progress.close(python_version, ok)
+
+def stream_cmd(cmd, cwd=None, env=None, check=True, on_line=None):
+    """Run cmd streaming its output line by line to the console, the log and the error analyzer"""
+    shell = isinstance(cmd, str)
+    tail = deque(maxlen=_output_tail_lines)
+    failed_targets = []
+    error_records = {}
+    
+    check_build_lock()
+    process = subprocess.Popen(cmd, shell=shell, cwd=cwd, env=env, stdout=subprocess.PIPE,
+                               stderr=subprocess.STDOUT, text=True, errors='replace', bufsize=1)
+    with _running_processes_lock:
+        _running_processes.add(process)
+    try:
+        returncode = _stream_process_output(process, tail, failed_targets, error_records, on_line)
+    finally:
+        with _running_processes_lock:
+            _running_processes.discard(process)
+    
+    # 잠금을 빼앗겨 종료된 명령은 재시도하지 않음
+    check_build_lock()
+    output = "".join(tail)
+    if check and returncode != 0:
+        error = subprocess.CalledProcessError(returncode, cmd, output=output)
+        error.failed_targets = failed_targets
+        error.error_records = list(error_records.values())
+        raise error
+    result = subprocess.CompletedProcess(cmd, returncode, stdout=output, stderr="")
+    result.failed_targets = failed_targets
+    result.error_records = list(error_records.values())
+    return result
+
+def _stream_process_output(process, tail, failed_targets, error_records, on_line):
+    with process.stdout:
+        for line in process.stdout:
+            log_output(line)
+            tail.append(line)
+            if on_line:
+                on_line(line)
+            
+            # ninja가 실패한 edge 기록 (단계별 재시도용)
+            failed = _ninja_failed_pattern.match(line)
+            if failed:
+                failed_targets.extend(failed.group(1).split())
+            
+            # 에러는 프로세스 종료를 기다리지 않고 즉시 보고
+            for record in match_error_lines(line, error_records):
+                location = f" ({record['file']}:{record['line']})" if record['file'] else ""
+                smart_log(f"🔎 Detected {record['rule']}{location}", "WARNING")
+    return process.wait()
+
+def ninja_build_dirs(src, python_version):
+    """ninja build directories of the setup.py build tree for one Python major.minor"""
+    patterns = [
+        os.path.join(src, "build", f"qfp-py{python_version}-*", "build", "*", "build.ninja"),
+        os.path.join(src, "..", "build", f"qfp-py{python_version}-*", "build", "*", "build.ninja"),
+    ]
+    build_dirs = []
+    for pattern in patterns:
+        build_dirs.extend(os.path.dirname(path) for path in glob.glob(pattern))
+    return build_dirs
+
+def analyze_ninja_logs(src, python_version):
+    """Report critical path / hot targets of each ninja build dir and export a Chrome trace next to the log"""
+    try:
+        reports = analyze_ninja_build_dirs(ninja_build_dirs(src, python_version))
+        if not reports:
+            smart_log(f"ℹ️  No .ninja_log found for Python {python_version}")
+            return None
+        
+        for report in reports:
+            for line in format_ninja_report(report):
+                smart_log(line)
+            # 다음 빌드의 진행률 ETA 계산에 쓰는 모듈별 이력
+            if _build_metrics:
+                _build_metrics.add_modules(python_version, report["modules"])
+        
+        output_dir = os.path.dirname(_build_log_file) if _build_log_file else src
+        trace_path = write_chrome_trace(reports, os.path.join(output_dir, f"ninja_trace_py{python_version}.json"),
+                                        f"Python {python_version}")
+        report_path = write_ninja_report(reports, os.path.join(output_dir, f"ninja_report_py{python_version}.json"))
+        smart_log(f"📄 Ninja trace: {trace_path}, report: {report_path}")
+        return reports
+    except Exception as e:
+        smart_log(f"⚠️  Ninja log analysis failed for Python {python_version}: {e}", "WARNING")
+        return None
+
+def locate_failed_targets(build_dirs, failed_targets, env):
+    """Map each failed ninja target to the build directory that owns it"""
+    ninja = shutil.which("ninja", path=env.get("PATH")) or "ninja"
+    located = {}
+    for target in failed_targets:
+        for build_dir in build_dirs:
+            query = subprocess.run([ninja, "-C", build_dir, "-t", "query", target],
+                                   env=env, capture_output=True, text=True)
+            if query.returncode == 0:
+                located.setdefault(build_dir, []).append(target)
+                break
+    return located
+
+def retry_failed_ninja_targets(src, python_version, failed_targets, env, jobs):
+    """Re-run only the failed ninja edges, then let ninja finish the rest of each module"""
+    located = locate_failed_targets(ninja_build_dirs(src, python_version), failed_targets, env)
+    if not located:
+        smart_log("⚠️  Failed targets not found in any ninja build directory", "WARNING")
+        return False
+    
+    ninja = shutil.which("ninja", path=env.get("PATH")) or "ninja"
+    for build_dir, targets in located.items():
+        smart_log(f"🎯 Retrying {len(targets)} failed target(s) in {build_dir}")
+        try:
+            stream_cmd([ninja, "-C", build_dir, "-j", str(jobs)] + targets, env=env)
+            # 나머지 미완료 edge 마무리 (완료된 오브젝트는 재사용)
+            stream_cmd([ninja, "-C", build_dir, "-j", str(jobs)], env=env)
+        except subprocess.CalledProcessError as e:
+            smart_log(f"❌ Targeted retry failed in {build_dir}: {e}")
+            return False
+    return True
+
+def run_cmd(cmd, cwd=None, env=None):
     """Enhanced run_cmd with smart error handling"""
     global _error_count, _retry_count
     
     smart_log(f"🚀 Executing: {cmd}")
+    applied_fingerprints = set()
     
     for attempt in range(_max_retries):
         try:
-            result = subprocess.run(cmd, shell=True, cwd=cwd, check=True, 
-                                   capture_output=True, text=True)
+            result = stream_cmd(cmd, cwd=cwd, env=env)
             smart_log("✅ Command completed successfully")
             return result
             
@@ -248,19 +656,21 @@ def run_cmd(cmd, cwd=None):
             _error_count += 1
             smart_log(f"❌ Command failed (attempt {attempt + 1}/{_max_retries}): {e}")
             
-            if e.stderr:
-                smart_log(f"stderr: {e.stderr[:500]}")
-            if e.stdout:
-                smart_log(f"stdout: {e.stdout[:500]}")
+            if e.output:
+                smart_log(f"Last {len(e.output.splitlines())} output lines:\n{e.output}")
             
             if attempt < _max_retries - 1:
-                # Try to apply fixes before retry
-                if analyze_and_fix_errors():
+                # Try to apply fixes before retry (명시적으로 받은 env에도 수정 내용 반영)
+                with _environment_lock:
+                    environ_before = dict(os.environ)
+                    fixes_applied = analyze_and_fix_errors(getattr(e, "error_records", []), applied_fingerprints)
+                    fix_env = {key: value for key, value in os.environ.items() if environ_before.get(key) != value}
+                if fixes_applied:
+                    if env is not None:
+                        env = merge_fix_environment(dict(env), fix_env)
                     smart_log("🔄 Fixes applied, retrying...")
-                    time.sleep(5)
                 else:
-                    smart_log(f"⏳ Waiting before retry {attempt + 2}...")
-                    time.sleep(10 * (attempt + 1))
+                    smart_log(f"🔄 Retrying (attempt {attempt + 2})...")
             else:
                 smart_log("❌ All retry attempts exhausted")
                 raise
@@ -296,6 +706,105 @@ def clean_install_dir(install_path):
             else:
                 raise
 
+def releases_dir(install_root):
+    """install_root 옆의 release 디렉토리 (같은 파일시스템이라 rename/symlink 교체가 원자적)"""
+    parent, name = os.path.split(install_root.rstrip("/"))
+    return os.path.join(parent, f".{name}.releases")
+
+def create_staging_dir(install_root):
+    """새 release 디렉토리 생성 - 설치 prefix가 그대로 유지되도록 처음부터 최종 이름 사용"""
+    staging_root = os.path.join(releases_dir(install_root), datetime.now().strftime('%Y%m%d_%H%M%S'))
+    os.makedirs(staging_root)
+    return staging_root
+
+# renameat2(RENAME_EXCHANGE): 기존 디렉토리와 새 링크를 한 번에 맞바꿈 (install_root가 없는 순간이 없음)
+RENAME_EXCHANGE = 2
+AT_FDCWD = -100
+PUBLISHED_MARKER = ".published"
+
+def exchange_paths(path_a, path_b):
+    """두 경로를 원자적으로 맞바꿈, 커널/파일시스템(NFS 등)이 지원하지 않으면 False"""
+    import ctypes
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        renameat2 = libc.renameat2
+    except (OSError, AttributeError):
+        return False
+    renameat2.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_int, ctypes.c_char_p, ctypes.c_uint]
+    return renameat2(AT_FDCWD, os.fsencode(path_a), AT_FDCWD, os.fsencode(path_b), RENAME_EXCHANGE) == 0
+
+def mark_published(release_root):
+    """prune_releases가 정리해도 되는 release 표시 (한 번도 공개되지 않은 release는 다른 빌드가 설치 중일 수 있음)"""
+    open(os.path.join(release_root, PUBLISHED_MARKER), "a").close()
+
+def publish_staged_install(staging_root, install_root):
+    """install_root 심볼릭 링크를 staging_root로 원자적으로 교체, 교체하지 못하면 False"""
+    link_target = os.path.relpath(staging_root, os.path.dirname(install_root))
+    tmp_link = f"{install_root}.tmp-{os.getpid()}"
+    if os.path.lexists(tmp_link):
+        os.remove(tmp_link)
+    os.symlink(link_target, tmp_link)
+    mark_published(staging_root)
+    
+    # 기존 실제 디렉토리는 링크와 맞바꾼 뒤 release로 옮김 (최초 전환 시 한 번만 발생)
+    if os.path.isdir(install_root) and not os.path.islink(install_root):
+        if not exchange_paths(tmp_link, install_root):
+            os.remove(tmp_link)
+            os.remove(os.path.join(staging_root, PUBLISHED_MARKER))
+            smart_log(f"⚠️  Cannot atomically replace existing install directory {install_root} (renameat2 unsupported)", "WARNING")
+            smart_log(f"    Move it into {releases_dir(install_root)} while it is not in use, then rebuild to publish", "WARNING")
+            return False
+        legacy_root = os.path.join(releases_dir(install_root), f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_legacy")
+        smart_log(f"📦 Moving previous install directory to {legacy_root}")
+        os.rename(tmp_link, legacy_root)
+        mark_published(legacy_root)
+    else:
+        os.replace(tmp_link, install_root)
+    smart_log(f"🚀 Published {staging_root} → {install_root}")
+    return True
+
+def prune_releases(install_root, keep=None):
+    """현재 release를 제외하고 오래된 공개 release 정리 (사용 중인 NFS 파일은 clean_install_dir가 건너뜀)"""
+    keep = _keep_releases if keep is None else keep
+    releases = releases_dir(install_root)
+    if not os.path.isdir(releases):
+        return
+    
+    # 공개된 적 없는 release는 다른 빌드가 아직 설치 중일 수 있으므로 건드리지 않음
+    current = os.path.realpath(install_root)
+    candidates = sorted(os.path.join(releases, name) for name in os.listdir(releases))
+    candidates = [path for path in candidates
+                  if os.path.realpath(path) != current and os.path.exists(os.path.join(path, PUBLISHED_MARKER))]
+    
+    # 현재 release + 최근 (keep - 1)개 유지
+    for path in candidates[:max(0, len(candidates) - max(0, keep - 1))]:
+        clean_install_dir(path)
+
+def manifest_seed_root(install_root):
+    """스테이징 설치 중이면 현재 공개된 release (변경 없는 파일을 hardlink로 재사용)"""
+    releases = os.path.dirname(install_root.rstrip("/"))
+    name = os.path.basename(releases)
+    if not (name.startswith(".") and name.endswith(".releases")):
+        return None
+    
+    published_root = os.path.join(os.path.dirname(releases), name[1:-len(".releases")])
+    if os.path.exists(published_root) and os.path.realpath(published_root) != os.path.realpath(install_root):
+        return os.path.realpath(published_root)
+    return None
+
+def sync_setup_install(scratch_root, install_root, component):
+    """setup.py install --root 결과를 manifest 기준으로 install_root에 반영 (변경된 파일만 쓰고 stale 파일 삭제)"""
+    staged_root = os.path.join(scratch_root, install_root.lstrip("/"))
+    if not os.path.isdir(staged_root):
+        raise RuntimeError(f"setup.py install produced no files under {staged_root}")
+    
+    manifest = InstallManifest(install_root, component, seed_root=manifest_seed_root(install_root))
+    manifest.install_tree(staged_root, install_root)
+    stats = manifest.commit()
+    print(f"📋 {component}: {format_manifest_stats(stats)}")
+    
+    shutil.rmtree(scratch_root, ignore_errors=True)
+
 def ensure_source(version, source_path):
     """이미 준비된 소스 디렉토리 확인"""
     src = os.path.join(source_path, "source", "pyside-setup")
@@ -441,9 +950,12 @@ def setup_build_environment():
     
     return qt_dir, shiboken_dir
 
+def shiboken_wrapper_dir(build_path):
+    return os.path.join(build_path, "shiboken_wrapper")
+
 def create_shiboken_wrapper(build_path):
     """Shiboken 래퍼 스크립트 생성 (핵심 해결책!)"""
-    wrapper_dir = os.path.join(build_path, "shiboken_wrapper")
+    wrapper_dir = shiboken_wrapper_dir(build_path)
     os.makedirs(wrapper_dir, exist_ok=True)
     
     wrapper_script = os.path.join(wrapper_dir, "shiboken6")
@@ -481,7 +993,9 @@ if [ -z "$ORIGINAL_SHIBOKEN" ]; then
     exit 1
 fi
 
-# Call original shiboken6 with additional arguments
+'''
+    
+    wrapper_content += '''# Call original shiboken6 with additional arguments
 exec "$ORIGINAL_SHIBOKEN" $EXTRA_ARGS "$@"
 '''
     
@@ -491,37 +1005,34 @@ exec "$ORIGINAL_SHIBOKEN" $EXTRA_ARGS "$@"
     os.chmod(wrapper_script, 0o755)
     print(f"🔧 Created shiboken wrapper: {wrapper_script}")
     
-    # PATH 앞에 래퍼 디렉토리 추가
-    os.environ["PATH"] = f"{wrapper_dir}:{os.environ.get('PATH', '')}"
-    
+    # 래퍼 디렉토리는 버전별 빌드 환경의 PATH에만 추가 (동시 빌드끼리 전역 PATH를 공유하지 않도록)
     return wrapper_dir
 
-def build_pyside6_with_buildsh_method(src, build_path, install_root, rez_python_exe):
-    """build.sh 검증된 방법으로 PySide6 빌드"""
-    smart_log("🔨 Building PySide6 using build.sh proven method...")
-    
-    python_exe = rez_python_exe
-    python_version = subprocess.run([
-        python_exe, "-c", 
-        "import sys; print(f'{sys.version_info.major}.{sys.version_info.minor}')"
-    ], capture_output=True, text=True).stdout.strip()
-    
-    smart_log(f"🐍 Using Python: {python_exe}")
-    smart_log(f"🐍 Python version: {python_version}")
-    
-    # build.sh에서 검증된 경로들
-    qt_dir = "/core/Linux/APPZ/packages/qt/6.9.1"
-    shiboken_dir = "/core/Linux/APPZ/packages/shiboken6/6.9.1"
-    
-    # build.sh와 동일한 환경 설정
-    build_env = os.environ.copy()
-    
-    # build.sh에서 성공한 PATH 설정 (GCC toolset 경로 제거)
-    old_path = build_env.get("PATH", "")
-    clean_path_parts = []
-    for part in old_path.split(":"):
-        if "gcc-toolset-14" not in part and "gcc-toolset-13" not in part:
-            clean_path_parts.append(part)
+def shiboken_cache_cmake_defines(build_path):
+    """CMake가 실제로 실행하는 shiboken6 (절대 경로 imported target)를 생성 캐시로 보내는 CMake 정의"""
+    if not _shiboken_generation_cache:
+        return []
+    include = write_shiboken_cache_include(os.path.join(build_path, "shiboken_cache_launcher.cmake"))
+    return [f"-DCMAKE_PROJECT_INCLUDE={include}"]
+
+_LAUNCHER_VARIABLES = [f"CMAKE_{language}_{tool}_LAUNCHER" for language in ("C", "CXX") for tool in ("COMPILER", "LINKER")]
+
+def launcher_cmake_defines(build_env):
+    """compiler/linker launcher (ccache, 작업 throttle) 를 CMake 정의로 명시
+
+    CMake는 launcher 환경 변수를 캐시를 처음 만들 때만 읽으므로 --reuse-build 로 기존 캐시를 쓰면 적용되지 않음
+    """
+    return [f"-D{name}={build_env[name]}" for name in _LAUNCHER_VARIABLES if build_env.get(name)]
+
+def setup_cmake_args(build_path, build_env):
+    """setup.py --cmake-args (여러 번 지정하면 마지막 값만 남으므로 하나로 합침)"""
+    defines = shiboken_cache_cmake_defines(build_path) + launcher_cmake_defines(build_env)
+    return [f"--cmake-args={' '.join(defines)}"] if defines else []
+
+def buildsh_environment_overrides(python_exe, python_version, install_root):
+    """build.sh 검증된 빌드 환경 변수 (PATH 제외)"""
+    qt_dir = _buildsh_qt_dir
+    shiboken_dir = _buildsh_shiboken_dir
     
     # build.sh에서 검증된 헤더 경로
     clang_headers = "/usr/lib/clang/19/include"
@@ -529,10 +1040,7 @@ def build_pyside6_with_buildsh_method(src, build_path, install_root, rez_python_
     system_headers = "/usr/include"
     cpp_headers = "/usr/include/c++/11"
     
-    build_env.update({
-        # build.sh에서 검증된 PATH 설정
-        "PATH": f"{qt_dir}/bin:{shiboken_dir}/bin:" + ":".join(clean_path_parts),
-        
+    return {
         # Qt 환경 (build.sh 방식)
         "QT_DIR": qt_dir,
         "CMAKE_PREFIX_PATH": f"{qt_dir}:{shiboken_dir}",
@@ -556,17 +1064,143 @@ def build_pyside6_with_buildsh_method(src, build_path, install_root, rez_python_
         "PYTHON3": python_exe,
         "PYTHON_EXECUTABLE": python_exe,
         "PYTHONPATH": f"{install_root}/lib/python{python_version}/site-packages",
-    })
-    
-    # build.sh에서 검증된 방법: setup.py 사용
-    os.chdir(src)
-    
-    # build.sh에서 성공한 QMAKE 설정
-    build_env.update({
+        
+        # build.sh에서 성공한 QMAKE 설정
         "QMAKE": f"{qt_dir}/bin/qmake",
         "QT_QMAKE_EXECUTABLE": f"{qt_dir}/bin/qmake",
-    })
+    }
+
+def source_revision(src):
+    """Source tree revision: git HEAD plus a hash of local modifications"""
+    try:
+        head = subprocess.run(["git", "-C", src, "rev-parse", "HEAD"],
+                              capture_output=True, text=True, check=True).stdout.strip()
+        status = subprocess.run(["git", "-C", src, "status", "--porcelain", "--untracked-files=no"],
+                                capture_output=True, text=True, check=True).stdout
+        diff = subprocess.run(["git", "-C", src, "diff", "HEAD"],
+                              capture_output=True, text=True, check=True).stdout
+        if status:
+            return f"{head}+{hashlib.sha256(diff.encode()).hexdigest()[:16]}"
+        return head
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        # git 정보가 없으면 setup.py 수정 시간으로 대체
+        return f"mtime:{os.path.getmtime(os.path.join(src, 'setup.py'))}"
+
+def compiler_identity():
+    """Resolved C/C++ compilers and their version banners"""
+    identity = {}
+    for var, default in (("CC", "gcc"), ("CXX", "g++")):
+        compiler = os.environ.get(var) or shutil.which(default) or default
+        try:
+            banner = subprocess.run([compiler, "--version"], capture_output=True, text=True).stdout.splitlines()
+            identity[var] = f"{compiler}: {banner[0] if banner else ''}"
+        except OSError:
+            identity[var] = f"{compiler}: unavailable"
+    return identity
+
+def compute_build_fingerprint(src, python_exe, install_root):
+    """Fingerprint of every input that invalidates an incremental build tree"""
+    python_info = subprocess.run([
+        python_exe, "-c",
+        "import sys; print(f'{sys.version_info.major}.{sys.version_info.minor}'); print(sys.version)"
+    ], capture_output=True, text=True).stdout.splitlines()
+    python_version = python_info[0] if python_info else ""
+    
+    inputs = {
+        "source_revision": source_revision(src),
+        "qt_dir": _buildsh_qt_dir,
+        "shiboken_dir": _buildsh_shiboken_dir,
+        "compiler": compiler_identity(),
+        "environment": buildsh_environment_overrides(python_exe, python_version, install_root),
+        "python": python_info[1] if len(python_info) > 1 else python_exe,
+    }
+    
+    digest = hashlib.sha256(json.dumps(inputs, sort_keys=True).encode()).hexdigest()
+    return {"digest": digest, "inputs": inputs}
+
+def build_fingerprint_matches(build_path, fingerprint):
+    """True if build_path was last configured with the same fingerprint"""
+    fingerprint_file = os.path.join(build_path, _build_fingerprint_name)
+    if not os.path.exists(fingerprint_file):
+        return False
+    
+    try:
+        with open(fingerprint_file, 'r') as f:
+            previous = json.load(f)
+    except (OSError, ValueError):
+        return False
+    
+    if previous.get("digest") == fingerprint["digest"]:
+        return True
+    
+    changed = [key for key, value in fingerprint["inputs"].items() if previous.get("inputs", {}).get(key) != value]
+    smart_log(f"🔄 Build inputs changed: {', '.join(changed) or 'unknown'}")
+    return False
+
+def write_build_fingerprint(build_path, fingerprint):
+    os.makedirs(build_path, exist_ok=True)
+    with open(os.path.join(build_path, _build_fingerprint_name), 'w') as f:
+        json.dump(fingerprint, f, indent=2, sort_keys=True)
+
+def merge_fix_environment(build_env, fix_env):
+    """자동 수정이 바꾼 변수를 빌드 환경에 반영 (경로 목록은 수정으로 추가된 항목을 앞에 붙임)"""
+    for key, value in fix_env.items():
+        current = build_env.get(key)
+        if "PATH" in key and current:
+            current_parts = current.split(":")
+            added = [part for part in value.split(":") if part and part not in current_parts]
+            build_env[key] = ":".join(added + current_parts)
+        else:
+            build_env[key] = value
+    return build_env
+
+def buildsh_build_env(src, build_path, install_root, python_exe, python_version, fix_env=None):
+    """현재 os.environ 위에 build.sh 검증된 설정을 덮어쓴 빌드 환경
+    
+    fix_env: 이 빌드 중 자동 수정이 바꾼 변수 (build.sh 설정이 덮어쓰지 않도록 마지막에 병합)
+    """
+    qt_dir = _buildsh_qt_dir
+    shiboken_dir = _buildsh_shiboken_dir
+    
+    # build.sh와 동일한 환경 설정
+    with _environment_lock:
+        build_env = os.environ.copy()
+    
+    # build.sh에서 성공한 PATH 설정 (GCC toolset 경로 제거)
+    old_path = build_env.get("PATH", "")
+    clean_path_parts = []
+    for part in old_path.split(":"):
+        if "gcc-toolset-14" not in part and "gcc-toolset-13" not in part:
+            clean_path_parts.append(part)
+    
+    build_env.update(buildsh_environment_overrides(python_exe, python_version, install_root))
+    build_env["PATH"] = f"{qt_dir}/bin:{shiboken_dir}/bin:{shiboken_wrapper_dir(build_path)}:" + ":".join(clean_path_parts)
+    build_env.update(compiler_cache_environment(src))
+    if _job_throttle:
+        build_env.update(_job_throttle.environment(build_env))
+    return merge_fix_environment(build_env, fix_env or {})
+
+def build_pyside6_with_buildsh_method(src, build_path, install_root, rez_python_exe, jobs=None, reuse_build=False):
+    """build.sh 검증된 방법으로 PySide6 빌드"""
+    global _error_count
+    smart_log("🔨 Building PySide6 using build.sh proven method...")
+    
+    jobs = jobs or os.cpu_count()
+    python_exe = rez_python_exe
+    python_version = subprocess.run([
+        python_exe, "-c", 
+        "import sys; print(f'{sys.version_info.major}.{sys.version_info.minor}')"
+    ], capture_output=True, text=True).stdout.strip()
+    
+    smart_log(f"🐍 Using Python: {python_exe}")
+    smart_log(f"🐍 Python version: {python_version}")
+    
+    qt_dir = _buildsh_qt_dir
+    fix_env = {}
+    applied_fingerprints = set()
+    build_env = buildsh_build_env(src, build_path, install_root, python_exe, python_version)
     
+    # build.sh에서 검증된 방법: setup.py 사용 (작업 디렉토리는 stream_cmd의 cwd로 지정)
     smart_log("🔧 Building with setup.py (build.sh proven method)...")
     
     try:
@@ -574,33 +1208,75 @@ def build_pyside6_with_buildsh_method(src, build_path, install_root, rez_python_
         setup_cmd = [
             python_exe, "setup.py", "build",
             "--qmake", f"{qt_dir}/bin/qmake",
-            "--jobs", str(os.cpu_count()),
+            "--jobs", str(jobs),
             "--verbose-build"
         ]
         
+        setup_cmd.extend(setup_cmake_args(build_path, build_env))
+        
+        # 입력이 그대로면 기존 CMake 캐시/ninja 상태/오브젝트 재사용
+        if reuse_build:
+            setup_cmd.append("--reuse-build")
+        
         smart_log(f"🔧 Setup.py command: {' '.join(setup_cmd)}")
-        result = subprocess.run(setup_cmd, cwd=src, env=build_env, check=True)
-        smart_log("✅ Setup.py build successful!")
         
-        return True
+        for attempt in range(_max_retries):
+            timer = output_phase_timer(python_version)
+            restart_build_progress(python_version)
+            try:
+                with source_tree_turn() as release_source_tree:
+                    stream_cmd(setup_cmd, cwd=src, env=build_env,
+                               on_line=build_output_handler(python_version, timer, release_source_tree))
+                timer.close()
+                close_build_progress(python_version, True)
+                smart_log("✅ Setup.py build successful!")
+                return True
+            except subprocess.CalledProcessError as e:
+                timer.close("failed")
+                close_build_progress(python_version, False)
+                _error_count += 1
+                smart_log(f"❌ Setup.py build failed (attempt {attempt + 1}/{_max_retries}): {e}")
+                
+                if attempt == _max_retries - 1:
+                    raise
+                
+                with _environment_lock:
+                    environ_before = dict(os.environ)
+                    fixes_applied = analyze_and_fix_errors(getattr(e, "error_records", []), applied_fingerprints)
+                    fix_env.update({key: value for key, value in os.environ.items() if environ_before.get(key) != value})
+                failed_targets = getattr(e, "failed_targets", [])
+                
+                # 자동 수정은 os.environ에 반영되므로 재시도(ninja edge 재빌드, setup.py 재개) 전에 빌드 환경을 다시 구성
+                if fixes_applied:
+                    build_env = buildsh_build_env(src, build_path, install_root, python_exe, python_version, fix_env)
+                
+                if failed_targets:
+                    # 실패한 edge만 다시 빌드한 뒤 setup.py는 기존 빌드 트리 재사용
+                    if not retry_failed_ninja_targets(src, python_version, failed_targets, build_env, jobs):
+                        raise
+                elif not fixes_applied:
+                    raise
+                
+                if "--reuse-build" not in setup_cmd:
+                    setup_cmd.append("--reuse-build")
+                smart_log("🔄 Resuming setup.py build with --reuse-build...")
         
     except subprocess.CalledProcessError as e:
         smart_log(f"❌ Setup.py build failed: {e}")
         return False
 
-def build_pyside6(src, build_path, install_root, rez_python_exe):
+def build_pyside6(src, build_path, install_root, rez_python_exe, jobs=None, reuse_build=False):
     """PySide6 빌드 실행 - build.sh 검증된 방법 사용"""
     smart_log("🔨 Building PySide6 using build.sh proven patterns...")
     
+    jobs = jobs or os.cpu_count()
+    
     # build.sh 검증된 방법을 우선 시도
-    if build_pyside6_with_buildsh_method(src, build_path, install_root, rez_python_exe):
+    if build_pyside6_with_buildsh_method(src, build_path, install_root, rez_python_exe, jobs, reuse_build):
         return True
     
     smart_log("🔧 build.sh method failed, trying alternative approach...")
     
-    # 소스 디렉토리로 이동
-    os.chdir(src)
-    
     # rez Python 사용!
     python_exe = rez_python_exe
     python_version = subprocess.run([
@@ -619,7 +1295,8 @@ def build_pyside6(src, build_path, install_root, rez_python_exe):
     print(f"🔧 Shiboken directory: {shiboken_dir}")
     
     # build.sh와 동일한 환경 변수 설정
-    build_env = os.environ.copy()
+    with _environment_lock:
+        build_env = os.environ.copy()
     
     # GCC 13 toolset 설정
     gcc13_root = "/opt/rh/gcc-toolset-13/root/usr"
@@ -644,7 +1321,7 @@ def build_pyside6(src, build_path, install_root, rez_python_exe):
         # Qt 환경
         "QT_DIR": qt_dir,
         "CMAKE_PREFIX_PATH": f"{qt_dir}:{shiboken_dir}:{build_env.get('CMAKE_PREFIX_PATH', '')}",
-        "PATH": f"{qt_dir}/bin:{build_env.get('PATH', '')}",
+        "PATH": f"{qt_dir}/bin:{shiboken_wrapper_dir(build_path)}:{build_env.get('PATH', '')}",
         "LD_LIBRARY_PATH": f"{qt_dir}/lib:{':'.join(gcc13_ld_paths + dependency_lib_paths)}:{build_env.get('LD_LIBRARY_PATH', '')}",
         "PKG_CONFIG_PATH": f"{qt_dir}/lib/pkgconfig:{build_env.get('PKG_CONFIG_PATH', '')}",
         
@@ -675,11 +1352,14 @@ def build_pyside6(src, build_path, install_root, rez_python_exe):
         "SHIBOKEN_INCLUDE_PATHS": "/usr/lib/clang/19/include:/usr/lib/gcc/x86_64-redhat-linux/11/include:/usr/include",
         
         # 빌드 환경
-        "MAKEFLAGS": f"-j{os.cpu_count()}",
+        "MAKEFLAGS": f"-j{jobs}",
         "NINJA_STATUS": "[%f/%t] ",
         "PYSIDE_BUILD_DIR": build_path,
         "PYSIDE_INSTALL_DIR": install_root,
     })
+    build_env.update(compiler_cache_environment(src))
+    if _job_throttle:
+        build_env.update(_job_throttle.environment(build_env))
     
     print("✅ Build environment configured using build.sh method")
     print(f"🔧 CC={build_env['CC']}")
@@ -693,20 +1373,28 @@ def build_pyside6(src, build_path, install_root, rez_python_exe):
         pyside_only_cmd = [
             python_exe, "setup.py", "build",
             "--qmake", f"{qt_dir}/bin/qmake",
-            "--parallel", str(os.cpu_count()),
+            "--parallel", str(jobs),
             "--module-subset=PySide6",
             "--skip-modules=shiboken6",
             "--reuse-build",
             f"--shiboken-target-path={shiboken_dir}",
             "--verbose-build"
-        ]
+        ] + setup_cmake_args(build_path, build_env)
         
         print(f"🔧 PySide6 only build command: {' '.join(pyside_only_cmd)}")
-        result = subprocess.run(pyside_only_cmd, cwd=src, env=build_env, check=True)
+        timer = output_phase_timer(python_version)
+        restart_build_progress(python_version)
+        with source_tree_turn() as release_source_tree:
+            stream_cmd(pyside_only_cmd, cwd=src, env=build_env,
+                       on_line=build_output_handler(python_version, timer, release_source_tree))
+        timer.close()
+        close_build_progress(python_version, True)
         print("✅ PySide6 build successful!")
         return True
             
     except subprocess.CalledProcessError as e:
+        timer.close("failed")
+        close_build_progress(python_version, False)
         print(f"❌ PySide6 build failed: {e}")
         return False
 
@@ -724,12 +1412,19 @@ def install_pyside6(src, build_path, install_root, rez_python_exe):
     python_install_path = f"{install_root}/lib/python{python_version}/site-packages"
     
     # 현재 빌드 환경 유지
-    install_env = os.environ.copy()
+    with _environment_lock:
+        install_env = os.environ.copy()
     
     # 설치 명령어 (rezbuild_multi.py 방식)
+    # --root 로 빌드 디렉토리에 먼저 설치한 뒤 manifest 기준으로 변경된 파일만 install_root에 반영
+    scratch_root = os.path.join(build_path, "install_scratch")
+    if os.path.exists(scratch_root):
+        shutil.rmtree(scratch_root)
+    
     install_cmd = [
         python_exe, "setup.py", "install",
         f"--build-base={build_path}",
+        f"--root={scratch_root}",
         f"--prefix={install_root}",
         f"--install-platlib={python_install_path}",
         f"--install-purelib={python_install_path}",
@@ -740,7 +1435,10 @@ def install_pyside6(src, build_path, install_root, rez_python_exe):
     
     # 설치 실행
     try:
-        subprocess.run(install_cmd, cwd=src, env=install_env, check=True)
+        # setup.py install은 소스 트리의 egg-info를 다시 쓰므로 다른 버전과 동시에 실행하지 않음
+        with _source_tree_lock:
+            stream_cmd(install_cmd, cwd=src, env=install_env)
+        sync_setup_install(scratch_root, install_root, f"pyside6-py{python_version}")
         print(f"✅ PySide6 successfully installed")
         return True
     except subprocess.CalledProcessError as e:
@@ -755,7 +1453,7 @@ def build_pyside_tools(python_exe, src, build_path, install_root, env):
     tools_build_cmd = [
         python_exe, "setup.py", "build",
         f"--build-base={build_path}",
-        "--parallel=4",
+        f"--parallel={recommended_jobs()}",
         "--verbose-build",
         "--standalone",
         "--ignore-git",
@@ -769,7 +1467,7 @@ def build_pyside_tools(python_exe, src, build_path, install_root, env):
     print(f"🔧 Tools build command: {' '.join(tools_build_cmd)}")
     
     try:
-        subprocess.run(tools_build_cmd, cwd=src, env=env, check=True)
+        stream_cmd(tools_build_cmd, cwd=src, env=env)
         
         # pyside-tools 설치
         python_version = subprocess.run([
@@ -778,10 +1476,14 @@ def build_pyside_tools(python_exe, src, build_path, install_root, env):
         ], capture_output=True, text=True).stdout.strip()
         
         python_install_path = f"{install_root}/lib/python{python_version}/site-packages"
+        scratch_root = os.path.join(build_path, "tools_install_scratch")
+        if os.path.exists(scratch_root):
+            shutil.rmtree(scratch_root)
         
         tools_install_cmd = [
             python_exe, "setup.py", "install",
             f"--build-base={build_path}",
+            f"--root={scratch_root}",
             f"--prefix={install_root}",
             f"--install-platlib={python_install_path}",
             f"--install-purelib={python_install_path}",
@@ -790,7 +1492,8 @@ def build_pyside_tools(python_exe, src, build_path, install_root, env):
         ]
         
         print(f"📦 Tools install command: {' '.join(tools_install_cmd)}")
-        subprocess.run(tools_install_cmd, cwd=src, env=env, check=True)
+        stream_cmd(tools_install_cmd, cwd=src, env=env)
+        sync_setup_install(scratch_root, install_root, f"pyside-tools-py{python_version}")
         
         print("✅ pyside-tools successfully built and installed")
         return True
@@ -885,72 +1588,59 @@ This package was built from source and includes Qt6 bindings for Python.
     
     print(f"📄 Created license file: {license_path}")
 
-def copy_missing_libraries(src, build_path, install_root):
+def pyside_build_dir(src, python_major_minor):
+    """setup.py가 python_major_minor용 pyside6를 빌드하는 디렉토리"""
+    return os.path.join(src, "..", "build", f"qfp-py{python_major_minor}-qt6.9.1-64bit-release", "build", "pyside6")
+
+def copy_missing_libraries(src, build_path, install_root, python_major_minor="3.13"):
     """빌드된 라이브러리들을 install 경로로 복사"""
     print("📚 Copying missing PySide6 libraries...")
     
-    build_dir = os.path.join(src, "..", "build", "qfp-py3.13-qt6.9.1-64bit-release", "build", "pyside6")
+    build_dir = pyside_build_dir(src, python_major_minor)
     lib_dir = os.path.join(install_root, "lib")
-    pyside_lib_dir = os.path.join(lib_dir, "python3.13", "site-packages", "PySide6")
+    pyside_lib_dir = os.path.join(lib_dir, f"python{python_major_minor}", "site-packages", "PySide6")
+    
+    install_pairs = []
     
     # 1. Core PySide6 libraries
     libpyside_dir = os.path.join(build_dir, "libpyside")
     if os.path.exists(libpyside_dir):
         for lib_file in os.listdir(libpyside_dir):
             if lib_file.startswith("libpyside6") and lib_file.endswith(".so"):
-                src_lib = os.path.join(libpyside_dir, lib_file)
-                dst_lib = os.path.join(lib_dir, lib_file)
-                if os.path.isfile(src_lib):
-                    shutil.copy2(src_lib, dst_lib)
-                    print(f"📚 Copied {lib_file}")
+                install_pairs.append((os.path.join(libpyside_dir, lib_file), os.path.join(lib_dir, lib_file)))
     
     # 2. PySide6 QML libraries
     libpysideqml_dir = os.path.join(build_dir, "libpysideqml")
     if os.path.exists(libpysideqml_dir):
         for lib_file in os.listdir(libpysideqml_dir):
             if lib_file.startswith("libpyside6qml") and lib_file.endswith(".so"):
-                src_lib = os.path.join(libpysideqml_dir, lib_file)
-                dst_lib = os.path.join(lib_dir, lib_file)
-                if os.path.isfile(src_lib):
-                    shutil.copy2(src_lib, dst_lib)
-                    print(f"📚 Copied {lib_file}")
-    
-    # 3. All PySide6 modules (.so files)
-    pyside_build_dir = os.path.join(build_dir, "PySide6")
-    if os.path.exists(pyside_build_dir):
+                install_pairs.append((os.path.join(libpysideqml_dir, lib_file), os.path.join(lib_dir, lib_file)))
+    
+    # 3. All PySide6 modules (.so files), Python files and stubs
+    pyside_module_dir = os.path.join(build_dir, "PySide6")
+    if os.path.exists(pyside_module_dir):
         os.makedirs(pyside_lib_dir, exist_ok=True)
         
-        # Copy .so modules
-        for item in os.listdir(pyside_build_dir):
-            if item.endswith(".abi3.so"):
-                src_file = os.path.join(pyside_build_dir, item)
-                dst_file = os.path.join(pyside_lib_dir, item)
-                if os.path.isfile(src_file):
-                    shutil.copy2(src_file, dst_file)
-                    print(f"📚 Copied module {item}")
-        
-        # Copy Python files and stubs
-        for item in os.listdir(pyside_build_dir):
-            if item.endswith((".py", ".pyi")):
-                src_file = os.path.join(pyside_build_dir, item)
-                dst_file = os.path.join(pyside_lib_dir, item)
-                if os.path.isfile(src_file):
-                    shutil.copy2(src_file, dst_file)
-        
-        # Copy support directory
-        support_src = os.path.join(pyside_build_dir, "support")
+        for item in os.listdir(pyside_module_dir):
+            if item.endswith((".abi3.so", ".py", ".pyi")):
+                install_pairs.append((os.path.join(pyside_module_dir, item), os.path.join(pyside_lib_dir, item)))
+    
+    # manifest에 기록하며 병렬 설치 (변경 없는 파일은 건너뛰고, 이번에 설치하지 않은 이전 파일은 commit 시 삭제)
+    manifest = InstallManifest(install_root, f"libraries-py{python_major_minor}", seed_root=manifest_seed_root(install_root))
+    with ThreadPoolExecutor(max_workers=PARALLEL_INSTALL_WORKERS) as executor:
+        list(executor.map(lambda pair: manifest.install_file(*pair), install_pairs))
+    
+    # Copy support directory
+    if os.path.exists(pyside_module_dir):
+        support_src = os.path.join(pyside_module_dir, "support")
         support_dst = os.path.join(pyside_lib_dir, "support")
         if os.path.exists(support_src):
-            if os.path.exists(support_dst):
-                shutil.rmtree(support_dst)
-            shutil.copytree(support_src, support_dst)
-            print("📚 Copied support directory")
+            manifest.install_tree(support_src, support_dst)
     
-    # 4. Create symbolic links for library versions
-    os.chdir(lib_dir)
+    # 4. Create symbolic links for library versions (동시 빌드 중이므로 chdir 없이 lib_dir 기준 경로 사용)
     for lib_pattern in ["libpyside6.abi3.so", "libpyside6qml.abi3.so"]:
         full_lib = None
-        for f in os.listdir("."):
+        for f in os.listdir(lib_dir):
             if f.startswith(lib_pattern) and f.count(".") >= 3:  # e.g., libpyside6.abi3.so.6.9.1
                 full_lib = f
                 break
@@ -962,13 +1652,44 @@ def copy_missing_libraries(src, build_path, install_root):
                 base_name = ".".join(version_parts[:3])  # libpyside6.abi3.so
                 short_version = ".".join(version_parts[:4])  # libpyside6.abi3.so.6.9
                 
-                # Create links
-                if not os.path.exists(base_name):
-                    os.symlink(full_lib, base_name)
-                    print(f"📚 Created link: {base_name} -> {full_lib}")
-                if not os.path.exists(short_version):
-                    os.symlink(full_lib, short_version)
-                    print(f"📚 Created link: {short_version} -> {full_lib}")
+                # Create links (setup.py가 설치한 실제 파일은 그대로 둠)
+                for link_name in (base_name, short_version):
+                    link_path = os.path.join(lib_dir, link_name)
+                    if (not os.path.exists(link_path) or os.path.islink(link_path)) \
+                            and manifest.install_symlink(full_lib, link_path) == "written":
+                        print(f"📚 Created link: {link_name} -> {full_lib}")
+    
+    stats = manifest.commit()
+    print(f"📚 Installed libraries and modules: {format_manifest_stats(stats)}")
+
+def copy_built_libraries(src, build_path, install_root, successful_builds):
+    """실제로 컴파일한 버전마다 누락된 라이브러리 복사 (stamp된 버전은 빌드 트리가 없으므로 건너뜀)"""
+    for python_major_minor in sorted({".".join(version.split(".")[:2]) for version, _ in successful_builds}):
+        if os.path.isdir(pyside_build_dir(src, python_major_minor)):
+            copy_missing_libraries(src, build_path, install_root, python_major_minor)
+
+def relink_installed_libraries(install_root):
+    """설치된 모듈/라이브러리 RUNPATH를 $ORIGIN 기준으로 재작성하고 찾지 못한 DT_NEEDED 보고"""
+    stats = relink_install_tree(install_root)
+    if not stats["patchelf"]:
+        smart_log("⚠️  patchelf not found, RUNPATH left unchanged (checking DT_NEEDED only)", "WARNING")
+    
+    # 재작성된 파일 해시를 manifest에 반영
+    refresh_manifest_entries(install_root, stats["changed"])
+    smart_log(f"🔗 RUNPATH: {format_relink_stats(stats)}")
+    
+    for path, libs in sorted(stats["unresolved"].items()):
+        smart_log(f"⚠️  Unresolved DT_NEEDED in {os.path.relpath(path, install_root)}: {', '.join(libs)}", "WARNING")
+    return not stats["unresolved"]
+
+def create_support_structure(install_root, published_root):
+    """bin/ 도구 링크, include/, lib/cmake, share/ 등 지원 파일을 설치 루트에 생성 (공개 전에 스테이징 release에 포함)"""
+    import create_tool_wrappers
+    import setup_directory_structure
+    
+    seed_root = manifest_seed_root(install_root)
+    setup_directory_structure.main(install_root, prefix=published_root, seed_root=seed_root)
+    create_tool_wrappers.main(install_root, seed_root=seed_root)
 
 def copy_package_py(source_path, install_path):
     src = os.path.join(source_path, "package.py")
@@ -981,22 +1702,338 @@ def write_build_marker(build_path):
     print(f"📝 Touching build marker: {marker}")
     open(marker, "a").close()
 
+def build_python_version(src, build_path, install_root, python_version, targets, jobs=None):
+    """Build (and optionally install) PySide6 for a single Python version"""
+    smart_log(f"\n{'='*60}")
+    smart_log(f"🐍 Building PySide6 for Python {python_version}")
+    smart_log(f"{'='*60}")
+    
+    try:
+        # Create version-specific build directory
+        python_major_minor = ".".join(python_version.split(".")[:2])
+        version_build_path = os.path.join(build_path, f"py{python_major_minor}")
+        
+        # Find specific Python version
+        rez_python_exe = find_rez_python_version(python_version)
+        if not rez_python_exe:
+            error_msg = f"Python {python_version} not found"
+            smart_log(f"❌ {error_msg}", "ERROR")
+            return False, error_msg
+        
+        smart_log(f"🐍 Using Python executable: {rez_python_exe}")
+        
+        with timed_phase(python_major_minor, "environment"):
+            # 입력 fingerprint가 바뀐 경우에만 빌드 디렉토리 정리
+            fingerprint = compute_build_fingerprint(src, rez_python_exe, install_root)
+            reuse_build = _incremental_builds and build_fingerprint_matches(version_build_path, fingerprint)
+            if reuse_build:
+                smart_log(f"♻️  Build inputs unchanged, reusing build tree: {version_build_path}")
+            else:
+                clean_build_dir(version_build_path)
+                write_build_fingerprint(version_build_path, fingerprint)
+            
+            # 환경 설정
+            with _environment_lock:
+                qt_dir, shiboken_dir = setup_build_environment()
+        
+        # Shiboken 래퍼 생성
+        with timed_phase(python_major_minor, "wrappers"):
+            create_shiboken_wrapper(version_build_path)
+        
+        # PySide6 빌드 (build.sh 방법)
+        if not build_pyside6(src, version_build_path, install_root, rez_python_exe, jobs, reuse_build):
+            error_msg = f"Build failed for Python {python_version}"
+            smart_log(f"❌ {error_msg}", "ERROR")
+            return False, error_msg
+        
+        smart_log(f"✅ Build successful for Python {python_version} (build.sh method)")
+        
+        # ninja 로그 분석 (어떤 모듈을 나누거나 캐시하거나 --module-subset에서 뺄지 판단용)
+        if _ninja_log_analysis:
+            analyze_ninja_logs(src, python_major_minor)
+        
+        if "install" not in targets:
+            return True, version_build_path
+        
+        # 설치 디렉토리 생성
+        os.makedirs(install_root, exist_ok=True)
+        
+        # PySide6 설치
+        with timed_phase(python_major_minor, "install") as phase:
+            installed = install_pyside6(src, version_build_path, install_root, rez_python_exe)
+            phase["status"] = "ok" if installed else "failed"
+        if not installed:
+            error_msg = f"Installation failed for Python {python_version}"
+            smart_log(f"❌ {error_msg}", "ERROR")
+            return False, error_msg
+        
+        smart_log(f"✅ Installation successful for Python {python_version}")
+        return True, os.path.join(install_root, "lib", f"python{python_major_minor}", "site-packages")
+        
+    except BuildLockLost:
+        raise
+    except Exception as e:
+        error_msg = f"Exception for Python {python_version}: {str(e)}"
+        smart_log(f"❌ {error_msg}", "ERROR")
+        return False, error_msg
+
+def available_memory_gb():
+    """Currently available system memory in GiB"""
+    return psutil.virtual_memory().available / (1024 ** 3)
+
+def process_tree_rss_gb():
+    """RSS of every process started by this build (the running setup.py/ninja/compiler trees) in GiB"""
+    rss = 0
+    for child in psutil.Process().children(recursive=True):
+        try:
+            rss += child.memory_info().rss
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            continue
+    return rss / (1024 ** 3)
+
+def build_memory_budget_gb(jobs):
+    """Peak memory one build may use with jobs parallel edges (link pool at link size, the rest at compile size)"""
+    link_jobs = min(jobs, MAX_LINK_JOBS)
+    return link_jobs * LINK_JOB_MEMORY_GB + (jobs - link_jobs) * COMPILE_JOB_MEMORY_GB
+
+def memory_pool_gb():
+    """Memory the scheduler may hand out to builds (available minus the reserve for everything else)"""
+    return max(0.0, available_memory_gb() - MEMORY_RESERVE_GB)
+
+def plan_build_slots(num_versions):
+    """Split the CPU/memory budget into (concurrent builds, jobs per build, memory budget per build)"""
+    cpu_count = os.cpu_count() or 1
+    max_builds = _max_parallel_builds or num_versions
+    concurrent = max(1, min(num_versions, max_builds, cpu_count // _min_jobs_per_build))
+    
+    # job throttle이 켜져 있으면 실행 중에 모든 빌드의 작업 수를 메모리 기준으로 조절하므로
+    # 빌드마다 최소 작업(컴파일 1 + 링크 1)만큼만 예약
+    if _job_throttle:
+        return concurrent, max(1, cpu_count // concurrent), COMPILE_JOB_MEMORY_GB + LINK_JOB_MEMORY_GB
+    
+    # 빌드마다 jobs 개 작업의 최대 메모리를 예약할 수 있을 때까지 동시 빌드 수와 작업 수를 줄임
+    pool = memory_pool_gb()
+    while True:
+        jobs_per_build = max(1, cpu_count // concurrent)
+        while jobs_per_build > 1 and build_memory_budget_gb(jobs_per_build) > pool / concurrent:
+            jobs_per_build -= 1
+        if concurrent == 1 or jobs_per_build >= _min_jobs_per_build:
+            break
+        concurrent -= 1
+    
+    return concurrent, jobs_per_build, build_memory_budget_gb(jobs_per_build)
+
+def schedule_python_builds(src, build_path, install_root, python_versions, targets):
+    """Run several per-Python builds at once with a partitioned job budget"""
+    successful_builds = []
+    failed_builds = []
+    
+    if not python_versions:
+        return successful_builds, failed_builds
+    
+    register_build_progress(python_versions)
+    concurrent, jobs_per_build, budget_gb = plan_build_slots(len(python_versions))
+    smart_log(f"🗓️  Scheduling {len(python_versions)} build(s): {concurrent} concurrent × {jobs_per_build} jobs, "
+              f"{budget_gb:.1f} GiB budget each ({available_memory_gb():.1f} GiB available)")
+    
+    if concurrent == 1:
+        for python_version in python_versions:
+            ok, result = build_python_version(src, build_path, install_root, python_version, targets, jobs_per_build)
+            if ok:
+                successful_builds.append((python_version, result))
+            else:
+                failed_builds.append((python_version, result))
+        return successful_builds, failed_builds
+    
+    pending = list(python_versions)
+    running = {}
+    
+    with ThreadPoolExecutor(max_workers=concurrent) as executor:
+        while pending or running:
+            # 실행 중인 빌드는 예약한 budget을 아직 다 쓰지 않았을 수 있으므로
+            # 여유 메모리에서 남은 예약분을 빼고 새 빌드의 budget이 들어갈 때만 시작
+            while pending and len(running) < concurrent:
+                if running:
+                    reserved = budget_gb * len(running)
+                    unused_reservation = max(0.0, reserved - process_tree_rss_gb())
+                    if memory_pool_gb() - unused_reservation < budget_gb:
+                        smart_log(f"⏸️  Low memory ({available_memory_gb():.1f} GiB available, "
+                                  f"{unused_reservation:.1f} GiB still reserved), holding {len(pending)} build(s)", "WARNING")
+                        break
+                
+                python_version = pending.pop(0)
+                future = executor.submit(build_python_version, src, build_path, install_root,
+                                         python_version, targets, jobs_per_build)
+                running[future] = python_version
+            
+            done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+            for future in done:
+                python_version = running.pop(future)
+                try:
+                    ok, result = future.result()
+                except BuildLockLost:
+                    raise
+                except Exception as e:
+                    ok, result = False, f"Exception for Python {python_version}: {str(e)}"
+                
+                if ok:
+                    successful_builds.append((python_version, result))
+                else:
+                    failed_builds.append((python_version, result))
+    
+    # 결과는 요청한 버전 순서대로 정렬
+    order = {v: i for i, v in enumerate(python_versions)}
+    successful_builds.sort(key=lambda item: order[item[0]])
+    failed_builds.sort(key=lambda item: order[item[0]])
+    return successful_builds, failed_builds
+
+def find_version_specific_extensions(site_packages):
+    """Return extension modules under site_packages that are not limited-API (abi3) builds"""
+    version_specific = []
+    for root, dirs, files in os.walk(os.path.join(site_packages, "PySide6")):
+        for name in files:
+            if name.endswith(".so") and ".cpython-" in name:
+                version_specific.append(os.path.join(root, name))
+    return version_specific
+
+def stamp_abi3_site_packages(install_root, base_site_packages, target_site_packages, python_major_minor):
+    """Install an abi3 site-packages tree built with one interpreter for another one"""
+    os.makedirs(target_site_packages, exist_ok=True)
+    
+    # 같은 설치 루트 안이므로 동일한 abi3 모듈은 hardlink로 공유, manifest에 기록해서 검증/stale 정리 대상에 포함
+    manifest = InstallManifest(install_root, f"abi3-stamp-py{python_major_minor}", seed_root=manifest_seed_root(install_root))
+    manifest.install_tree(base_site_packages, target_site_packages, link_sources=True)
+    stats = manifest.commit()
+    
+    print(f"📦 Stamped {base_site_packages} → {target_site_packages}: {format_manifest_stats(stats)}")
+
+def run_import_test(python_version, python_exe, site_packages):
+    """Import PySide6 from site_packages with the given interpreter"""
+    test_env = os.environ.copy()
+    test_env["PYTHONPATH"] = f"{site_packages}:{test_env.get('PYTHONPATH', '')}"
+    
+    test_cmd = [python_exe, "-c", "import PySide6; print(f'PySide6 {PySide6.__version__} imported successfully')"]
+    result = subprocess.run(test_cmd, env=test_env, capture_output=True, text=True, timeout=30)
+    
+    if result.returncode == 0:
+        smart_log(f"✅ Python {python_version}: {result.stdout.strip()}")
+        return True
+    
+    smart_log(f"❌ Python {python_version} test failed: {result.stderr}", "ERROR")
+    return False
+
+def build_abi3_once(src, build_path, install_root, python_versions, targets):
+    """Compile the abi3 tree once with the oldest interpreter and stamp it for the rest"""
+    successful_builds = []
+    failed_builds = []
+    
+    # Limited API 바이너리는 가장 오래된 Python으로 빌드해야 모든 버전에서 로드 가능
+    base_version = min(python_versions, key=lambda v: tuple(int(p) for p in v.split(".")))
+    base_major_minor = ".".join(base_version.split(".")[:2])
+    other_versions = [v for v in python_versions if v != base_version]
+    
+    smart_log(f"🧱 abi3 build-once mode: compiling with Python {base_version}, stamping {', '.join(other_versions)}")
+    register_build_progress([base_version])
+    
+    ok, result = build_python_version(src, build_path, install_root, base_version, targets)
+    if not ok:
+        smart_log(f"⚠️  abi3 base build failed, falling back to per-version builds", "WARNING")
+        failed_builds.append((base_version, result))
+        successful_builds, other_failed = schedule_python_builds(src, build_path, install_root, other_versions, targets)
+        failed_builds.extend(other_failed)
+        return successful_builds, failed_builds
+    
+    successful_builds.append((base_version, result))
+    
+    if "install" not in targets:
+        # 빌드 트리는 모든 버전이 공유하므로 버전마다 base 트리를 import 해서 확인
+        base_tree = pyside_build_dir(src, base_major_minor)
+        version_specific = find_version_specific_extensions(base_tree)
+        if version_specific:
+            smart_log(f"⚠️  Found {len(version_specific)} non-abi3 extension(s), e.g. {version_specific[0]}", "WARNING")
+            smart_log("🔧 Falling back to full builds for remaining Python versions", "WARNING")
+            other_successful, other_failed = schedule_python_builds(src, build_path, install_root, other_versions, targets)
+            return successful_builds + other_successful, failed_builds + other_failed
+        
+        for python_version in other_versions:
+            python_exe = find_rez_python_version(python_version)
+            if not python_exe:
+                failed_builds.append((python_version, f"Python {python_version} not found"))
+            elif run_import_test(python_version, python_exe, base_tree):
+                successful_builds.append((python_version, result))
+            else:
+                failed_builds.append((python_version, f"Import test failed for shared abi3 build tree with Python {python_version}"))
+        return successful_builds, failed_builds
+    
+    base_site_packages = result
+    with timed_phase(base_major_minor, "post_install"):
+        copy_missing_libraries(src, build_path, install_root, base_major_minor)
+    
+    version_specific = find_version_specific_extensions(base_site_packages)
+    if version_specific:
+        smart_log(f"⚠️  Found {len(version_specific)} non-abi3 extension(s), e.g. {version_specific[0]}", "WARNING")
+        smart_log("🔧 Falling back to full builds for remaining Python versions", "WARNING")
+        other_successful, other_failed = schedule_python_builds(src, build_path, install_root, other_versions, targets)
+        return successful_builds + other_successful, failed_builds + other_failed
+    
+    for python_version in other_versions:
+        smart_log(f"📦 Stamping abi3 install for Python {python_version}")
+        python_major_minor = ".".join(python_version.split(".")[:2])
+        target_site_packages = os.path.join(install_root, "lib", f"python{python_major_minor}", "site-packages")
+        
+        try:
+            python_exe = find_rez_python_version(python_version)
+            if not python_exe:
+                failed_builds.append((python_version, f"Python {python_version} not found"))
+                continue
+            
+            with timed_phase(python_major_minor, "install"):
+                stamp_abi3_site_packages(install_root, base_site_packages, target_site_packages, python_major_minor)
+            
+            if run_import_test(python_version, python_exe, target_site_packages):
+                successful_builds.append((python_version, target_site_packages))
+            else:
+                failed_builds.append((python_version, f"Import test failed for stamped Python {python_version} install"))
+        except BuildLockLost:
+            raise
+        except Exception as e:
+            error_msg = f"Exception for Python {python_version}: {str(e)}"
+            smart_log(f"❌ {error_msg}", "ERROR")
+            failed_builds.append((python_version, error_msg))
+    
+    return successful_builds, failed_builds
+
 def build_multi_python(source_path, build_path, install_path, targets):
     """Multi-Python version build function using build.sh proven patterns"""
-    global _build_log_file
+    global _build_log_file, _build_metrics, _build_progress, _job_throttle
     
     version = os.environ.get("REZ_BUILD_PROJECT_VERSION", "6.9.1")
+    build_start = time.time()
+    _build_metrics = BuildMetrics(version) if _build_metrics_enabled else None
+    _build_progress = ProgressBoard(log=smart_log, history_loader=load_module_history if _build_metrics_enabled else None)
     
     # Python versions from readme.md (build.sh 검증된 순서로 정렬 - 3.13.2 먼저)
     python_versions = ["3.13.2", "3.12.10", "3.11.9", "3.10.6", "3.9.21"]
     
     # Setup smart build logging
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-    _build_log_file = os.path.join(build_path, f"multi_python_pyside6_{timestamp}.log")
+    start_log_writer(os.path.join(build_path, f"multi_python_pyside6_{timestamp}.log"))
+    
+    # 같은 빌드 루트에서 실행 중인 빌드가 있으면 종료하지 않고 기다린 뒤 결과 재사용
+    lock_state = acquire_build_lock(build_path, version, targets)
+    if lock_state == "reused":
+        return True
+    if lock_state != "acquired":
+        return False
     
     # install 타겟인 경우 /core 경로 사용
     install_root = f"/core/Linux/APPZ/packages/pyside6/{version}" if "install" in targets else install_path
     
+    # 사용 중인 설치본 대신 새 release 디렉토리에 설치한 뒤 마지막에 교체
+    published_root = install_root
+    if "install" in targets and _staged_install:
+        install_root = create_staging_dir(published_root)
+    
     smart_log("="*60)
     smart_log("🚀 Multi-Python PySide6 Build Manager Starting")
     smart_log("="*60)
@@ -1004,12 +2041,11 @@ def build_multi_python(source_path, build_path, install_path, targets):
     smart_log(f"🐍 Target Python versions: {', '.join(python_versions)}")
     smart_log(f"📁 Source path: {source_path}")
     smart_log(f"📁 Build path: {build_path}")
-    smart_log(f"📁 Install path: {install_root}")
+    smart_log(f"📁 Install path: {published_root}")
+    if install_root != published_root:
+        smart_log(f"📁 Staging path: {install_root}")
     smart_log(f"📝 Log file: {_build_log_file}")
     
-    # Terminate any running builds
-    detect_and_terminate_builds()
-    
     # Apply pre-build fixes
     smart_log("🔧 Applying pre-build environment fixes...")
     fix_python_environment()
@@ -1017,88 +2053,72 @@ def build_multi_python(source_path, build_path, install_path, targets):
     fix_stdbool_headers()
     fix_shiboken_wrapper()
     
+    # 컴파일러 캐시 통계 초기화 (빌드 요약에서 hit/miss 보고)
+    if reset_compiler_cache_stats():
+        smart_log("🗄️  Compiler cache enabled (ccache)")
+    else:
+        smart_log("ℹ️  ccache not found, building without compiler cache")
+    
     # 소스 확인
     src = ensure_source(version, source_path)
     
+    # 여유 메모리/작업 RSS 기준 컴파일·링크 슬롯 조절 시작 (모든 Python 버전 빌드가 공유)
+    if _job_throttle_enabled:
+        _job_throttle = MemoryThrottle(os.path.join(build_path, ".job_throttle"), log=smart_log).start()
+        smart_log(f"🎚️  Job throttle enabled: compile {_job_throttle.limits['compile']}, link {_job_throttle.limits['link']}")
+    
     successful_builds = []
     failed_builds = []
+    smoke_summary = None
     
-    for python_version in python_versions:
-        smart_log(f"\n{'='*60}")
-        smart_log(f"🐍 Building PySide6 for Python {python_version}")
-        smart_log(f"{'='*60}")
-        
-        try:
-            # Create version-specific build directory
-            python_major_minor = ".".join(python_version.split(".")[:2])
-            version_build_path = os.path.join(build_path, f"py{python_major_minor}")
-            
-            # Clean version-specific build directory
-            clean_build_dir(version_build_path)
-            
-            # Find specific Python version
-            rez_python_exe = find_rez_python_version(python_version)
-            if not rez_python_exe:
-                error_msg = f"Python {python_version} not found"
-                smart_log(f"❌ {error_msg}", "ERROR")
-                failed_builds.append((python_version, error_msg))
-                continue
-            
-            smart_log(f"🐍 Using Python executable: {rez_python_exe}")
-            
-            # 환경 설정
-            qt_dir, shiboken_dir = setup_build_environment()
-            
-            # Shiboken 래퍼 생성
-            create_shiboken_wrapper(version_build_path)
-            
-            # PySide6 빌드 (build.sh 방법)
-            if build_pyside6(src, version_build_path, install_root, rez_python_exe):
-                smart_log(f"✅ Build successful for Python {python_version} (build.sh method)")
-                
-                if "install" in targets:
-                    # 설치 디렉토리 생성
-                    os.makedirs(install_root, exist_ok=True)
-                    
-                    # PySide6 설치
-                    if install_pyside6(src, version_build_path, install_root, rez_python_exe):
-                        smart_log(f"✅ Installation successful for Python {python_version}")
-                        python_site_packages = os.path.join(install_root, "lib", f"python{python_major_minor}", "site-packages")
-                        successful_builds.append((python_version, python_site_packages))
-                    else:
-                        error_msg = f"Installation failed for Python {python_version}"
-                        smart_log(f"❌ {error_msg}", "ERROR")
-                        failed_builds.append((python_version, error_msg))
-                else:
-                    successful_builds.append((python_version, version_build_path))
-            else:
-                error_msg = f"Build failed for Python {python_version}"
-                smart_log(f"❌ {error_msg}", "ERROR")  
-                failed_builds.append((python_version, error_msg))
-                
-        except Exception as e:
-            error_msg = f"Exception for Python {python_version}: {str(e)}"
-            smart_log(f"❌ {error_msg}", "ERROR")
-            failed_builds.append((python_version, error_msg))
-            continue
+    set_build_stage("building")
+    if _abi3_build_once:
+        successful_builds, failed_builds = build_abi3_once(src, build_path, install_root, python_versions, targets)
+    else:
+        successful_builds, failed_builds = schedule_python_builds(src, build_path, install_root, python_versions, targets)
+    
+    stop_job_throttle()
     
     # Post-build tasks for successful builds
     if successful_builds and "install" in targets:
         smart_log("🔧 Performing post-build tasks...")
+        set_build_stage("post-build")
+        
+        # 누락된 라이브러리들 복사 (전체 빌드한 버전마다, 변경 없는 파일은 건너뜀)
+        with timed_phase(ALL_VERSIONS, "post_install"):
+            copy_built_libraries(src, build_path, install_root, successful_builds)
         
-        # 누락된 라이브러리들 복사
-        copy_missing_libraries(src, build_path, install_root)
+        # bin/include/share 지원 파일 (공개 경로가 아니라 이번 release 트리에 생성)
+        with timed_phase(ALL_VERSIONS, "post_install"):
+            create_support_structure(install_root, published_root)
         
-        # 테스트 스크립트 생성
-        test_script = create_test_script(install_root)
+        # RUNPATH 재작성 (LD_LIBRARY_PATH 검색 없이 Qt/shiboken 라이브러리를 바로 찾도록)
+        with timed_phase(ALL_VERSIONS, "relink"):
+            relink_installed_libraries(install_root)
         
-        # 라이선스 및 패키지 파일 복사
-        copy_license(src, install_root)
-        copy_package_py(source_path, install_root)
+        # 바이트코드 미리 컴파일 (읽기 전용 설치본에서 매번 메모리 컴파일하지 않도록)
+        with timed_phase(ALL_VERSIONS, "precompile"):
+            precompile_multi_python_bytecode(successful_builds)
+        
+        with timed_phase(ALL_VERSIONS, "post_install"):
+            # 테스트 스크립트 생성
+            test_script = create_test_script(install_root)
+            
+            # 라이선스 및 패키지 파일 복사
+            copy_license(src, install_root)
+            copy_package_py(source_path, install_root)
         
         # 통합 설치 테스트
         smart_log("🧪 Running multi-Python installation tests...")
-        test_multi_python_installation(install_root, successful_builds)
+        with timed_phase(ALL_VERSIONS, "tests") as phase:
+            smoke_summary = test_multi_python_installation(install_root, successful_builds)
+            phase["status"] = "ok" if smoke_summary["passed"] == smoke_summary["total"] else "failed"
+        
+        # import 시간 벤치마크
+        if _import_benchmark:
+            smart_log("⏱️  Running import time benchmarks...")
+            with timed_phase(ALL_VERSIONS, "benchmark"):
+                benchmark_multi_python_imports(install_root, published_root, successful_builds)
     
     # 빌드 마커 생성
     write_build_marker(build_path)
@@ -1119,34 +2139,78 @@ def build_multi_python(source_path, build_path, install_path, targets):
             smart_log(f"   - Python {version}: {error}")
     
     # Final verification
+    verified = False
+    published = install_root == published_root
     if successful_builds:
         smart_log("🔍 Performing final verification...")
-        if verify_installation(install_root):
+        set_build_stage("verifying")
+        verified = verify_installation(install_root, smoke_summary)
+        if verified:
             smart_log("🎉 Multi-Python PySide6 build completed successfully!")
             smart_log("✅ All required tools are present and functional")
         else:
             smart_log("⚠️  Build completed but verification issues detected")
     
+    # 스테이징된 트리 공개 (검증 + smoke 매트릭스 통과 시에만, 부분 성공은 PYSIDE6_PUBLISH_PARTIAL=1일 때만)
+    if install_root != published_root:
+        smoke_passed = smoke_summary is not None and smoke_summary["total"] and smoke_summary["passed"] == smoke_summary["total"]
+        if successful_builds and verified and smoke_passed and (not failed_builds or _publish_partial):
+            set_build_stage("publishing")
+            published = publish_staged_install(install_root, published_root)
+            if published:
+                prune_releases(published_root)
+        else:
+            smart_log(f"⚠️  Not publishing staged install, current release left untouched: {install_root}", "WARNING")
+    
     smart_log("📊 Build Statistics:")
     smart_log(f"   Total Python versions: {len(python_versions)}")
     smart_log(f"   Successful builds: {len(successful_builds)}")
     smart_log(f"   Failed builds: {len(failed_builds)}")
     smart_log(f"   Total errors encountered: {_error_count}")
+    smart_log(f"   Compiler cache: {format_compiler_cache_stats(compiler_cache_stats())}")
     smart_log(f"   Build efficiency: {int(len(successful_builds)*100/len(python_versions))}%")
-    smart_log(f"   Average time per version: {format_duration(int(build_duration/len(python_versions)))}")
+    build_duration = time.time() - build_start
+    smart_log(f"   Total build time: {format_duration(build_duration)}")
+    smart_log(f"   Average time per version: {format_duration(build_duration / len(python_versions))}")
+    
+    status = "success" if successful_builds and not failed_builds else "partial" if successful_builds else "failed"
+    if not published:
+        # 공개되지 않은 스테이징 결과는 기다리던 빌드가 재사용하면 안 됨
+        status = "unpublished" if successful_builds else "failed"
+    if _build_metrics:
+        report_build_metrics(_build_metrics, status)
+    
+    # 결과 기록 후 잠금 해제 (기다리던 빌드가 성공한 결과를 재사용)
+    release_build_lock(status, install_path=published_root, build_duration=build_duration)
     
     smart_log("="*80)
     
-    if successful_builds and not failed_builds:
+    if status == "success":
         smart_log("🎉 All Python versions built successfully!", "SUCCESS")
         return True
-    elif successful_builds:
+    elif status == "partial":
         smart_log("⚠️  Partial success - some Python versions built successfully", "WARNING")
         return True
     else:
         smart_log("💥 All Python version builds failed!", "ERROR")
         return False
 
+def report_build_metrics(metrics, status):
+    """버전별/단계별 소요 시간을 요약하고 metrics DB에 저장"""
+    for python_version, seconds in sorted(metrics.version_totals().items()):
+        phases = sorted(metrics.totals(python_version).items(), key=lambda item: item[1], reverse=True)
+        smart_log(f"   Python {python_version}: {format_duration(seconds)} "
+                  f"({', '.join(f'{phase} {format_duration(d)}' for phase, d in phases[:4])})")
+    shared = metrics.totals(ALL_VERSIONS)
+    if shared:
+        smart_log(f"   Shared phases: {', '.join(f'{phase} {format_duration(d)}' for phase, d in shared.items())}")
+    
+    try:
+        run_id = metrics.save(status)
+        smart_log(f"   Build metrics: run #{run_id} saved to {metrics.db_path}")
+    except Exception as e:
+        smart_log(f"⚠️  Failed to save build metrics: {e}", "WARNING")
+
 def find_rez_python_version(python_version):
     """Find specific rez Python version executable"""
     python_exe_paths = [
@@ -1162,35 +2226,78 @@ def find_rez_python_version(python_version):
     smart_log(f"⚠️ Python {python_version} not found at expected paths", "WARNING")
     return None
 
+def successful_interpreters(successful_builds):
+    """[(python_version, python_exe, site_packages)] for builds whose rez interpreter exists"""
+    interpreters = []
+    for python_version, site_packages in successful_builds:
+        python_exe = find_rez_python_version(python_version)
+        if python_exe:
+            interpreters.append((python_version, python_exe, site_packages))
+    return interpreters
+
+def precompile_multi_python_bytecode(successful_builds):
+    """각 인터프리터로 site-packages 바이트코드를 병렬로 미리 컴파일"""
+    smart_log("🐍 Precompiling bytecode for each Python version...")
+    results = precompile_interpreters(successful_interpreters(successful_builds))
+    for python_version, stats in results.items():
+        level = "WARNING" if "error" in stats or stats["failed"] else "INFO"
+        smart_log(f"🐍 Python {python_version}: {format_compile_stats(stats)}", level)
+    return results
+
 def test_multi_python_installation(install_root, successful_builds):
-    """Test PySide6 installation for each successful Python version"""
+    """Test PySide6 installation for every (Python version × module) pair in parallel"""
     smart_log("🧪 Testing PySide6 installation for each Python version...")
     
-    for python_version, site_packages in successful_builds:
-        try:
-            python_exe = find_rez_python_version(python_version)
-            if python_exe:
-                smart_log(f"🧪 Testing Python {python_version}...")
-                
-                test_env = os.environ.copy()
-                test_env["PYTHONPATH"] = f"{site_packages}:{test_env.get('PYTHONPATH', '')}"
-                
-                # Test basic import
-                test_cmd = [python_exe, "-c", "import PySide6; print(f'PySide6 {PySide6.__version__} imported successfully')"]
-                result = subprocess.run(test_cmd, env=test_env, capture_output=True, text=True, timeout=30)
-                
-                if result.returncode == 0:
-                    smart_log(f"✅ Python {python_version}: {result.stdout.strip()}")
-                else:
-                    smart_log(f"❌ Python {python_version} test failed: {result.stderr}", "ERROR")
-        except Exception as e:
-            smart_log(f"❌ Python {python_version} test error: {e}", "ERROR")
+    interpreters = successful_interpreters(successful_builds)
+    
+    start = time.time()
+    results = run_matrix(interpreters)
+    summary = summarize_matrix(results)
+    
+    for result in results:
+        if result["status"] != "passed":
+            smart_log(f"❌ Python {result['python']} {result['module']}: {result['message']}", "ERROR")
+    
+    # 결과 파일은 빌드 로그 옆에 저장
+    output_dir = os.path.dirname(_build_log_file) if _build_log_file else install_root
+    json_path, junit_path = write_results(results, output_dir)
+    
+    smart_log(f"🧪 Smoke tests: {summary['passed']}/{summary['total']} passed in {time.time() - start:.1f}s "
+              f"({summary['failed']} failed, {summary['error']} errors)")
+    smart_log(f"📄 Test results: {json_path}, {junit_path}")
+    return summary
+
+def benchmark_multi_python_imports(install_root, published_root, successful_builds):
+    """성공한 Python 버전별 import 시간 측정 후 설치 루트에 저장"""
+    interpreters = successful_interpreters(successful_builds)
+    
+    # 스테이징 설치면 현재 공개된 release, 아니면 같은 경로의 이전 결과와 비교
+    baseline_root = manifest_seed_root(install_root) or published_root
+    _, regressions = run_benchmarks(install_root, interpreters, baseline_root, log=smart_log)
+    
+    if regressions:
+        smart_log(f"⚠️  {len(regressions)} import time regression(s) detected", "WARNING")
+    else:
+        smart_log("✅ No import time regressions")
+    return regressions
+
+def stop_job_throttle():
+    global _job_throttle
+    
+    if _job_throttle:
+        _job_throttle.stop()
+        _job_throttle = None
 
 def build(source_path, build_path, install_path, targets):
     """Main build function - now uses multi-Python approach by default"""
-    return build_multi_python(source_path, build_path, install_path, targets)
+    try:
+        return build_multi_python(source_path, build_path, install_path, targets)
+    finally:
+        stop_job_throttle()
+        release_build_lock("failed")
+        stop_log_writer()
 
-def verify_installation(install_root):
+def verify_installation(install_root, smoke_summary=None):
     """Verify the final PySide6 installation"""
     smart_log("🔍 Verifying PySide6 installation...")
     
@@ -1198,6 +2305,13 @@ def verify_installation(install_root):
         smart_log(f"❌ Installation directory not found: {install_root}")
         return False
     
+    # 설치 manifest 기준 파일 검증 (인터프리터 실행 없이 stat/hash만 비교)
+    problems = verify_manifest(install_root)
+    if problems:
+        smart_log(f"❌ Install manifest mismatches ({len(problems)}): {problems[:5]}")
+        return False
+    smart_log("✅ Install tree matches install manifest")
+    
     # Check for required tools from package.py
     bin_dir = os.path.join(install_root, "bin")
     required_tools = [
@@ -1222,6 +2336,14 @@ def verify_installation(install_root):
     else:
         smart_log(f"✅ All {len(required_tools)} required tools are present")
     
+    # 인터프리터별 매트릭스 테스트 결과가 있으면 PATH의 python3로 다시 테스트하지 않음
+    if smoke_summary is not None:
+        if smoke_summary["total"] and smoke_summary["passed"] == smoke_summary["total"]:
+            smart_log("✅ PySide6 smoke test matrix passed")
+            return True
+        smart_log(f"❌ PySide6 smoke test matrix: {smoke_summary['passed']}/{smoke_summary['total']} passed")
+        return False
+    
     # Test basic import
     try:
         test_script = os.path.join(install_root, "test_pyside6.py")
@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 import os, sys, shutil, subprocess
 
+from compiler_cache import compiler_cache_environment, compiler_cache_stats, format_compiler_cache_stats
+
 def run_cmd(cmd, cwd=None):
     print(f"[RUN] {cmd}")
     subprocess.run(cmd, shell=True, cwd=cwd, check=True)
@@ -214,6 +216,7 @@ def build_pyside6(python_version):
         "PYTHONPATH": python_install_path,
         "PYTHON_EXECUTABLE": python_exe,
     })
+    env.update(compiler_cache_environment(source_dir))
     
     print(f"🐍 Using Python executable: {python_exe}")
     print(f"📦 Python install path: {python_install_path}")
@@ -262,6 +265,7 @@ def build_pyside6(python_version):
     subprocess.run(install_cmd, cwd=source_dir, env=env, check=True)
     
     print(f"✅ PySide6 successfully built and installed for Python {python_version}")
+    print(f"🗄️  Compiler cache: {format_compiler_cache_stats(compiler_cache_stats())}")
     return python_install_path
 
 def copy_missing_libraries(install_path):
@@ -5,12 +5,36 @@ _pyside6 스타일의 완전한 디렉토리 구조를 생성하는 도구
 """
 
 import os
-import shutil
+import sys
 from pathlib import Path
 
+from create_tool_wrappers import built_site_packages
+from install_manifest import InstallManifest, format_manifest_stats
+
 # 기본 경로 설정
 PYSIDE6_ROOT = "/core/Linux/APPZ/packages/pyside6/6.9.1"
-PYTHON3_13_SITE_PACKAGES = f"{PYSIDE6_ROOT}/lib/python3.13/site-packages"
+# 헤더/CMake/문서를 가져오는 site-packages (빌드된 버전에서 선택)
+SITE_PACKAGES = built_site_packages(PYSIDE6_ROOT)[1]
+# pkgconfig 파일에 기록되는 prefix (스테이징 release에 설치해도 공개 경로를 가리키도록)
+INSTALL_PREFIX = PYSIDE6_ROOT
+
+# 이 도구가 설치한 파일 기록 (변경된 파일만 쓰고 더 이상 만들지 않는 파일은 삭제)
+_manifest = None
+
+def get_manifest():
+    """현재 설치 루트의 manifest (모듈을 import해서 함수만 호출해도 동작하도록 처음 사용할 때 생성)"""
+    global _manifest
+    if _manifest is None:
+        _manifest = InstallManifest(PYSIDE6_ROOT, "directory-structure")
+    return _manifest
+
+def set_install_root(install_root, prefix=None):
+    """설치 루트 변경 (rezbuild.py가 스테이징 release 디렉토리에 설치할 때 사용)"""
+    global _manifest, PYSIDE6_ROOT, SITE_PACKAGES, INSTALL_PREFIX
+    PYSIDE6_ROOT = install_root
+    _manifest = None
+    SITE_PACKAGES = built_site_packages(PYSIDE6_ROOT)[1]
+    INSTALL_PREFIX = prefix or install_root
 
 def create_include_structure():
     """include 디렉토리 구조 생성"""
@@ -20,19 +44,17 @@ def create_include_structure():
     os.makedirs(include_dir, exist_ok=True)
     
     # PySide6 헤더 파일들 복사
-    pyside6_include_src = f"{PYTHON3_13_SITE_PACKAGES}/PySide6/include"
+    pyside6_include_src = f"{SITE_PACKAGES}/PySide6/include"
     pyside6_include_dst = f"{include_dir}/PySide6"
     
     if os.path.exists(pyside6_include_src):
-        if os.path.exists(pyside6_include_dst):
-            shutil.rmtree(pyside6_include_dst)
-        shutil.copytree(pyside6_include_src, pyside6_include_dst)
-        print(f"✅ Copied PySide6 headers to {pyside6_include_dst}")
+        get_manifest().install_tree(pyside6_include_src, pyside6_include_dst)
+        print(f"✅ Synced PySide6 headers to {pyside6_include_dst}")
     else:
         print(f"⚠️  PySide6 headers not found at {pyside6_include_src}")
     
     # Shiboken6 헤더 파일들 복사 (만약 있다면)
-    shiboken6_include_src = f"{PYTHON3_13_SITE_PACKAGES}/shiboken6"
+    shiboken6_include_src = f"{SITE_PACKAGES}/shiboken6"
     shiboken6_include_dst = f"{include_dir}/shiboken6"
     
     # shiboken6에서 헤더 파일들 찾기
@@ -47,8 +69,8 @@ def create_include_structure():
         for header in shiboken_headers:
             src_path = f"{shiboken6_include_src}/{header}"
             dst_path = f"{shiboken6_include_dst}/{header}"
-            shutil.copy2(src_path, dst_path)
-        print(f"✅ Copied {len(shiboken_headers)} Shiboken6 headers to {shiboken6_include_dst}")
+            get_manifest().install_file(src_path, dst_path)
+        print(f"✅ Synced {len(shiboken_headers)} Shiboken6 headers to {shiboken6_include_dst}")
     else:
         print(f"⚠️  No Shiboken6 headers found")
 
@@ -60,8 +82,8 @@ def create_lib_structure():
     
     # CMake 설정 파일들 복사
     cmake_src_dirs = [
-        f"{PYTHON3_13_SITE_PACKAGES}/PySide6/Qt/lib/cmake",
-        f"{PYTHON3_13_SITE_PACKAGES}/shiboken6",  # cmake 파일이 있을 수 있음
+        f"{SITE_PACKAGES}/PySide6/Qt/lib/cmake",
+        f"{SITE_PACKAGES}/shiboken6",  # cmake 파일이 있을 수 있음
     ]
     
     cmake_dst = f"{lib_dir}/cmake"
@@ -71,16 +93,14 @@ def create_lib_structure():
     found_cmake = False
     
     # PySide6/Qt/lib/cmake에서 찾기
-    qt_cmake_src = f"{PYTHON3_13_SITE_PACKAGES}/PySide6/Qt/lib/cmake"
+    qt_cmake_src = f"{SITE_PACKAGES}/PySide6/Qt/lib/cmake"
     if os.path.exists(qt_cmake_src):
         for item in os.listdir(qt_cmake_src):
             src_path = os.path.join(qt_cmake_src, item)
             dst_path = os.path.join(cmake_dst, item)
             if os.path.isdir(src_path):
-                if os.path.exists(dst_path):
-                    shutil.rmtree(dst_path)
-                shutil.copytree(src_path, dst_path)
-                print(f"✅ Copied CMake config: {item}")
+                get_manifest().install_tree(src_path, dst_path)
+                print(f"✅ Synced CMake config: {item}")
                 found_cmake = True
     
     if not found_cmake:
@@ -90,14 +110,14 @@ def create_lib_structure():
     lib_files = []
     
     # PySide6 라이브러리들
-    pyside6_lib_src = f"{PYTHON3_13_SITE_PACKAGES}/PySide6"
+    pyside6_lib_src = f"{SITE_PACKAGES}/PySide6"
     if os.path.exists(pyside6_lib_src):
         for item in os.listdir(pyside6_lib_src):
             if item.startswith('lib') and (item.endswith('.so') or item.endswith('.so.6.9')):
                 lib_files.append((os.path.join(pyside6_lib_src, item), os.path.join(lib_dir, item)))
     
     # Shiboken6 라이브러리들
-    shiboken6_lib_src = f"{PYTHON3_13_SITE_PACKAGES}/shiboken6"
+    shiboken6_lib_src = f"{SITE_PACKAGES}/shiboken6"
     if os.path.exists(shiboken6_lib_src):
         for item in os.listdir(shiboken6_lib_src):
             if item.startswith('lib') and (item.endswith('.so') or item.endswith('.so.6.9')):
@@ -106,15 +126,15 @@ def create_lib_structure():
     # 라이브러리 파일들 복사
     for src_path, dst_path in lib_files:
         if os.path.exists(src_path):
-            shutil.copy2(src_path, dst_path)
-            print(f"✅ Copied library: {os.path.basename(dst_path)}")
+            if get_manifest().install_file(src_path, dst_path) != "unchanged":
+                print(f"✅ Copied library: {os.path.basename(dst_path)}")
     
     # pkgconfig 디렉토리 생성 (필요한 경우)
     pkgconfig_dir = f"{lib_dir}/pkgconfig"
     os.makedirs(pkgconfig_dir, exist_ok=True)
     
     # pkgconfig 파일들 생성 (기본적인 것들)
-    pyside6_pc_content = f"""prefix={PYSIDE6_ROOT}
+    pyside6_pc_content = f"""prefix={INSTALL_PREFIX}
 exec_prefix=${{prefix}}
 libdir=${{prefix}}/lib
 includedir=${{prefix}}/include
@@ -127,10 +147,9 @@ Libs: -L${{libdir}} -lpyside6
 Cflags: -I${{includedir}}
 """
     
-    with open(f"{pkgconfig_dir}/pyside6.pc", 'w') as f:
-        f.write(pyside6_pc_content)
+    get_manifest().write_file(f"{pkgconfig_dir}/pyside6.pc", pyside6_pc_content)
     
-    shiboken6_pc_content = f"""prefix={PYSIDE6_ROOT}
+    shiboken6_pc_content = f"""prefix={INSTALL_PREFIX}
 exec_prefix=${{prefix}}
 libdir=${{prefix}}/lib
 includedir=${{prefix}}/include
@@ -142,8 +161,7 @@ Libs: -L${{libdir}} -lshiboken6
 Cflags: -I${{includedir}}/shiboken6
 """
     
-    with open(f"{pkgconfig_dir}/shiboken6.pc", 'w') as f:
-        f.write(shiboken6_pc_content)
+    get_manifest().write_file(f"{pkgconfig_dir}/shiboken6.pc", shiboken6_pc_content)
     
     print(f"✅ Created pkgconfig files")
 
@@ -157,9 +175,9 @@ def create_plugins_structure():
     
     # Qt Designer 플러그인 찾기
     possible_plugin_paths = [
-        f"{PYTHON3_13_SITE_PACKAGES}/PySide6/Qt/plugins/designer",
-        f"{PYTHON3_13_SITE_PACKAGES}/PySide6/plugins/designer",
-        f"{PYTHON3_13_SITE_PACKAGES}/PySide6",  # 플러그인이 여기에 있을 수도
+        f"{SITE_PACKAGES}/PySide6/Qt/plugins/designer",
+        f"{SITE_PACKAGES}/PySide6/plugins/designer",
+        f"{SITE_PACKAGES}/PySide6",  # 플러그인이 여기에 있을 수도
     ]
     
     plugin_found = False
@@ -169,12 +187,12 @@ def create_plugins_structure():
                 # 디렉토리인 경우 안의 .so 파일들 복사
                 for item in os.listdir(src_path):
                     if item.endswith('.so') and 'plugin' in item.lower():
-                        shutil.copy2(os.path.join(src_path, item), os.path.join(designer_dir, item))
+                        get_manifest().install_file(os.path.join(src_path, item), os.path.join(designer_dir, item))
                         print(f"✅ Copied plugin: {item}")
                         plugin_found = True
             elif src_path.endswith('.so') and 'plugin' in src_path.lower():
                 # 파일인 경우 직접 복사
-                shutil.copy2(src_path, designer_dir)
+                get_manifest().install_file(src_path, os.path.join(designer_dir, os.path.basename(src_path)))
                 print(f"✅ Copied plugin: {os.path.basename(src_path)}")
                 plugin_found = True
     
@@ -190,51 +208,54 @@ def create_share_structure():
     os.makedirs(pyside6_share_dir, exist_ok=True)
     
     # 문서 파일들 복사
-    doc_src = f"{PYTHON3_13_SITE_PACKAGES}/PySide6/doc"
+    doc_src = f"{SITE_PACKAGES}/PySide6/doc"
     doc_dst = f"{pyside6_share_dir}/doc"
     
     if os.path.exists(doc_src):
-        if os.path.exists(doc_dst):
-            shutil.rmtree(doc_dst)
-        shutil.copytree(doc_src, doc_dst)
-        print(f"✅ Copied documentation to {doc_dst}")
+        get_manifest().install_tree(doc_src, doc_dst)
+        print(f"✅ Synced documentation to {doc_dst}")
     else:
         print(f"⚠️  Documentation not found at {doc_src}")
     
     # glue 파일들 복사
-    glue_src = f"{PYTHON3_13_SITE_PACKAGES}/PySide6/glue"
+    glue_src = f"{SITE_PACKAGES}/PySide6/glue"
     glue_dst = f"{pyside6_share_dir}/glue"
     
     if os.path.exists(glue_src):
-        if os.path.exists(glue_dst):
-            shutil.rmtree(glue_dst)
-        shutil.copytree(glue_src, glue_dst)
-        print(f"✅ Copied glue files to {glue_dst}")
+        get_manifest().install_tree(glue_src, glue_dst)
+        print(f"✅ Synced glue files to {glue_dst}")
     else:
         print(f"⚠️  Glue files not found at {glue_src}")
     
     # typesystems 파일들 복사
-    typesystems_src = f"{PYTHON3_13_SITE_PACKAGES}/PySide6/typesystems"
+    typesystems_src = f"{SITE_PACKAGES}/PySide6/typesystems"
     typesystems_dst = f"{pyside6_share_dir}/typesystems"
     
     if os.path.exists(typesystems_src):
-        if os.path.exists(typesystems_dst):
-            shutil.rmtree(typesystems_dst)
-        shutil.copytree(typesystems_src, typesystems_dst)
-        print(f"✅ Copied typesystems to {typesystems_dst}")
+        get_manifest().install_tree(typesystems_src, typesystems_dst)
+        print(f"✅ Synced typesystems to {typesystems_dst}")
     else:
         print(f"⚠️  Typesystems not found at {typesystems_src}")
 
-def main():
+def main(install_root=None, prefix=None, seed_root=None):
+    global _manifest
+    if install_root:
+        set_install_root(install_root, prefix)
     print("🏗️  Setting up PySide6 Directory Structure (_pyside6 style)...")
     print(f"📁 Target directory: {PYSIDE6_ROOT}")
     
+    _manifest = InstallManifest(PYSIDE6_ROOT, "directory-structure", seed_root=seed_root)
+    
     # 각 구조 생성
     create_include_structure()
     create_lib_structure()
     create_plugins_structure()
     create_share_structure()
     
+    # manifest 저장 (이번에 만들지 않은 이전 파일은 삭제)
+    stats = get_manifest().commit()
+    print(f"\n📋 Install manifest: {format_manifest_stats(stats)}")
+    
     print(f"\n🎉 Directory structure setup completed!")
     print(f"📊 Structure summary:")
     
@@ -252,4 +273,5 @@ def main():
             print(f"   - {root_item}: missing")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    # Usage: setup_directory_structure.py [install_root [prefix]]
+    main(*sys.argv[1:3])
\ No newline at end of file
@@ -0,0 +1,430 @@
+#!/usr/bin/env python3
+"""
+PySide6 Shiboken Generation Cache
+shiboken6 생성 결과(C++ wrapper 소스)를 입력 해시 기준으로 캐시하는 front-end
+
+setup.py/CMake는 shiboken6를 절대 경로(imported target)로 실행하므로 PATH 래퍼로는 가로챌 수 없음
+→ CMAKE_PROJECT_INCLUDE로 RULE_LAUNCH_CUSTOM launcher를 설정해 모든 custom command가 'launch'를 거치게 하고,
+  그중 shiboken6 실행만 캐시 처리 (나머지는 그대로 exec)
+캐시 키는 검색 경로 트리가 아니라 실제 참조되는 입력(typesystem XML, glue/snippet, 헤더 #include)만 해시
+캐시 크기는 PYSIDE6_SHIBOKEN_CACHE_MAX_GB (기본 5) 를 넘으면 LRU 순으로 정리
+
+Usage: shiboken_cache.py <original_shiboken6> [shiboken args...]
+       shiboken_cache.py launch <custom command...>
+       shiboken_cache.py cmake-include <output.cmake>
+"""
+
+import hashlib
+import json
+import os
+import re
+import shlex
+import shutil
+import subprocess
+import sys
+import tempfile
+
+CACHE_DIR = os.environ.get("PYSIDE6_SHIBOKEN_CACHE_DIR", os.path.expanduser("~/.cache/pyside6-shiboken"))
+
+# 입력 digest 메모 (stat 서명이 그대로면 내용을 다시 해시하지 않음)
+DIGEST_MEMO = os.path.join(CACHE_DIR, "digests.json")
+
+# 캐시가 출력 디렉토리에 쓴 파일 목록 (다음 실행에서 사라진 출력 삭제용)
+OUTPUT_MANIFEST_PREFIX = ".shiboken-cache-"
+
+GENERATOR_NAMES = ("shiboken6", "shiboken6.exe")
+
+# rez 패키지/시스템 헤더는 경로만으로 식별 (내용을 해시하거나 하위 include를 따라가지 않음)
+IMMUTABLE_PREFIXES = ("/core/Linux/APPZ/packages/", "/usr/")
+
+# 캐시 크기 상한 (GiB, 넘으면 가장 오래 사용하지 않은 항목부터 삭제)
+CACHE_MAX_GB = float(os.environ.get("PYSIDE6_SHIBOKEN_CACHE_MAX_GB", "5"))
+ENTRY_SIZE_SUFFIX = ".size"
+
+HEADER_EXTENSIONS = (".h", ".hh", ".hpp", ".hxx")
+
+# Python 버전별 빌드 디렉토리 이름 (qfp-py3.13-...) 은 키에서 정규화
+_BUILD_DIR_PATTERN = re.compile(r"qfp-py3\.\d+-")
+
+# 생성 결과에 영향을 주는 참조: typesystem이 불러오는 typesystem, inject-code/conversion-rule 등의 file=,
+# 헤더의 #include
+_LOAD_TYPESYSTEM_PATTERN = re.compile(r'<load-typesystem\b[^>]*?\bname\s*=\s*"([^"]+)"')
+_FILE_ATTRIBUTE_PATTERN = re.compile(r'\bfile\s*=\s*"([^"]+)"')
+_INCLUDE_PATTERN = re.compile(r'^\s*#\s*include\s*[<"]([^">]+)[">]', re.MULTILINE)
+
+_INCLUDE_LIST_OPTIONS = ("--include-paths=", "--framework-include-paths=", "--system-include-paths=")
+_INCLUDE_SHORT_OPTIONS = ("-I", "-F", "-isystem")
+_PROJECT_INCLUDE_KEYS = ("include-path", "framework-include-path", "system-include-path")
+_PROJECT_FILE_KEYS = ("header-file", "typesystem-file")
+
+def normalize(text):
+    return _BUILD_DIR_PATTERN.sub("qfp-py*-", text)
+
+def hash_file(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def load_digest_memo():
+    try:
+        with open(DIGEST_MEMO, "r") as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+def save_digest_memo(memo):
+    """동시에 실행되는 다른 shiboken과 경쟁해도 잃는 것은 메모뿐이므로 tmp + rename으로 덮어씀"""
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    tmp = f"{DIGEST_MEMO}.tmp-{os.getpid()}"
+    with open(tmp, "w") as f:
+        json.dump(memo, f)
+    os.replace(tmp, DIGEST_MEMO)
+
+def stat_signature(path):
+    """파일 stat 서명 (크기, mtime, inode) - 내용을 읽지 않고 변경 여부 확인"""
+    st = os.stat(path)
+    return f"{st.st_size}:{st.st_mtime_ns}:{st.st_ino}"
+
+def digest_path(path, memo):
+    """입력 파일의 내용 digest (stat 서명이 바뀐 경우에만 다시 해시 → touch만 된 파일은 캐시 hit 유지)"""
+    signature = stat_signature(path)
+    cached = memo.get(path)
+    if cached and cached["signature"] == signature:
+        return cached["digest"]
+    digest = hash_file(path)
+    memo[path] = {"signature": signature, "digest": digest}
+    return digest
+
+def read_project_file(path):
+    """[generator-project] 형식의 project file을 (key, value) 목록으로 읽기"""
+    entries = []
+    with open(path, "r") as f:
+        for line in f:
+            if "=" in line and not line.lstrip().startswith(("#", "[")):
+                key, value = line.split("=", 1)
+                entries.append((key.strip(), value.strip()))
+    return entries
+
+def parse_arguments(args):
+    """{output_dir, project_file, files, include_paths, typesystem_paths}
+
+    files는 명령줄/project file에 직접 지정된 입력 (global header, typesystem XML)
+    """
+    parsed = {"output_dir": None, "project_file": None, "files": [], "include_paths": [], "typesystem_paths": []}
+
+    for arg in args:
+        if arg.startswith("--output-directory="):
+            parsed["output_dir"] = arg.split("=", 1)[1]
+        elif arg.startswith("--project-file="):
+            parsed["project_file"] = arg.split("=", 1)[1]
+        elif arg.startswith(_INCLUDE_LIST_OPTIONS):
+            parsed["include_paths"].extend(p for p in arg.split("=", 1)[1].split(os.pathsep) if p)
+        elif arg.startswith("--typesystem-paths="):
+            parsed["typesystem_paths"].extend(p for p in arg.split("=", 1)[1].split(os.pathsep) if p)
+        elif arg.startswith("-T") and arg[2:]:
+            parsed["typesystem_paths"].append(arg[2:])
+        elif arg.startswith(_INCLUDE_SHORT_OPTIONS):
+            option = next(o for o in _INCLUDE_SHORT_OPTIONS if arg.startswith(o))
+            if arg[len(option):]:
+                parsed["include_paths"].append(arg[len(option):])
+        elif arg.startswith("@") or not arg.startswith("-"):
+            parsed["files"].append(arg.lstrip("@"))
+
+    if parsed["project_file"]:
+        for key, value in read_project_file(parsed["project_file"]):
+            if key == "output-directory":
+                parsed["output_dir"] = value
+            elif key in _PROJECT_INCLUDE_KEYS:
+                parsed["include_paths"].append(value)
+            elif key == "typesystem-path":
+                parsed["typesystem_paths"].append(value)
+            elif key in _PROJECT_FILE_KEYS:
+                parsed["files"].append(value)
+
+    return parsed
+
+def _resolve(name, base_dir, search_paths):
+    """참조 이름을 현재 파일 디렉토리, 검색 경로 순으로 찾기"""
+    if os.path.isabs(name):
+        return name if os.path.isfile(name) else None
+    for directory in ([base_dir] if base_dir else []) + list(search_paths):
+        candidate = os.path.normpath(os.path.join(directory, name))
+        if os.path.isfile(candidate):
+            return candidate
+    return None
+
+def _references(path, include_paths, typesystem_paths):
+    """파일이 참조하는 다른 입력 파일 (찾지 못한 참조는 '<missing>:이름')"""
+    if path.endswith(".xml"):
+        patterns, search_paths = (_LOAD_TYPESYSTEM_PATTERN, _FILE_ATTRIBUTE_PATTERN), typesystem_paths
+    elif path.endswith(HEADER_EXTENSIONS):
+        patterns, search_paths = (_INCLUDE_PATTERN,), include_paths
+    else:
+        return []
+
+    with open(path, "r", errors="replace") as f:
+        text = f.read()
+    references = []
+    for name in (n for pattern in patterns for n in pattern.findall(text)):
+        resolved = _resolve(name, os.path.dirname(path), search_paths)
+        # 헤더의 #include <...>가 검색 경로에 없으면 컴파일러 기본 경로(시스템 헤더)이므로 무시
+        if resolved is None and not path.endswith(HEADER_EXTENSIONS):
+            references.append(f"<missing>:{name}")
+        elif resolved is not None:
+            references.append(resolved)
+    return references
+
+def collect_inputs(parsed, memo):
+    """생성 결과에 영향을 주는 실제 입력 파일들의 [(정규화된 경로, digest)]
+
+    디렉토리 트리를 훑지 않고 typesystem XML, 그 XML이 불러오는 typesystem/glue/snippet 파일,
+    지정된 헤더와 그 #include만 따라감. 출력 디렉토리와 불변 경로(rez 패키지, /usr)는 내용을 보지 않음
+    """
+    output_dir = os.path.abspath(parsed["output_dir"]) + os.sep if parsed["output_dir"] else None
+    pending = [os.path.abspath(f) if os.path.exists(f) else f"<missing>:{f}" for f in parsed["files"]]
+    seen = set()
+    inputs = []
+    while pending:
+        path = pending.pop()
+        if path in seen:
+            continue
+        seen.add(path)
+        if path.startswith("<missing>:"):
+            inputs.append((normalize(path), "missing"))
+        elif path.startswith(IMMUTABLE_PREFIXES):
+            inputs.append((normalize(path), "immutable"))
+        elif output_dir and path.startswith(output_dir):
+            continue
+        else:
+            inputs.append((normalize(path), digest_path(path, memo)))
+            pending.extend(_references(path, parsed["include_paths"], parsed["typesystem_paths"]))
+    return sorted(inputs)
+
+def generator_identity(shiboken):
+    real_path = os.path.realpath(shiboken)
+    st = os.stat(real_path)
+    return f"{real_path}:{st.st_size}:{st.st_mtime_ns}"
+
+def compute_cache_key(shiboken, args, parsed):
+    output_dir = parsed["output_dir"]
+    key_args = [normalize(arg.replace(output_dir, "<output>")) for arg in args]
+    project_entries = []
+    if parsed["project_file"]:
+        project_entries = [(k, normalize(v)) for k, v in read_project_file(parsed["project_file"])
+                           if k != "output-directory"]
+
+    memo = load_digest_memo()
+    before = json.dumps(memo, sort_keys=True)
+    paths = collect_inputs(parsed, memo)
+    if json.dumps(memo, sort_keys=True) != before:
+        save_digest_memo(memo)
+
+    inputs = {
+        "generator": generator_identity(shiboken),
+        "args": key_args,
+        "project": project_entries,
+        "paths": paths,
+    }
+    return hashlib.sha256(json.dumps(inputs, sort_keys=True).encode()).hexdigest()
+
+def directory_size(path):
+    total = 0
+    for root, dirs, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.lstat(os.path.join(root, name)).st_size
+            except FileNotFoundError:
+                pass
+    return total
+
+def record_entry(entry, size=None):
+    """캐시 항목 크기 기록 + 사용 시각 갱신 (sidecar 파일의 mtime이 LRU 기준)"""
+    sidecar = entry + ENTRY_SIZE_SUFFIX
+    if size is None:
+        try:
+            os.utime(sidecar)
+            return
+        except FileNotFoundError:
+            size = directory_size(entry)
+    with open(sidecar, "w") as f:
+        f.write(str(size))
+
+def prune_cache(max_bytes=None):
+    """캐시 크기가 상한을 넘으면 가장 오래 사용하지 않은 항목부터 삭제, 삭제한 항목 수 반환"""
+    max_bytes = CACHE_MAX_GB * 1024 ** 3 if max_bytes is None else max_bytes
+    entries = []
+    try:
+        names = os.listdir(CACHE_DIR)
+    except FileNotFoundError:
+        return 0
+    for name in names:
+        if not name.endswith(ENTRY_SIZE_SUFFIX):
+            continue
+        sidecar = os.path.join(CACHE_DIR, name)
+        try:
+            with open(sidecar, "r") as f:
+                size = int(f.read() or 0)
+            entries.append((os.path.getmtime(sidecar), size, sidecar[:-len(ENTRY_SIZE_SUFFIX)]))
+        except (OSError, ValueError):
+            continue
+
+    total = sum(size for _, size, _ in entries)
+    removed = 0
+    for _, size, entry in sorted(entries):
+        if total <= max_bytes:
+            break
+        shutil.rmtree(entry, ignore_errors=True)
+        try:
+            os.remove(entry + ENTRY_SIZE_SUFFIX)
+        except FileNotFoundError:
+            pass
+        total -= size
+        removed += 1
+    return removed
+
+def output_manifest_path(output_dir, args, project_file):
+    """같은 출력 디렉토리를 쓰는 다른 생성 명령과 구분되도록 인자(내용 제외) 기준 이름 사용"""
+    identity = [normalize(arg.replace(output_dir, "<output>")) for arg in args]
+    if project_file:
+        identity.append(normalize(project_file))
+    name = hashlib.sha256(json.dumps(identity).encode()).hexdigest()[:16]
+    return os.path.join(output_dir, f"{OUTPUT_MANIFEST_PREFIX}{name}.json")
+
+def remove_stale_outputs(output_dir, manifest_path, outputs):
+    """이전 실행에서 생성했지만 이번 결과에는 없는 파일 삭제 후 manifest 갱신"""
+    try:
+        with open(manifest_path, "r") as f:
+            previous = set(json.load(f))
+    except (FileNotFoundError, ValueError):
+        previous = set()
+
+    removed = 0
+    for relpath in sorted(previous - outputs):
+        try:
+            os.remove(os.path.join(output_dir, relpath))
+            removed += 1
+        except FileNotFoundError:
+            pass
+
+    os.makedirs(output_dir, exist_ok=True)
+    tmp = f"{manifest_path}.tmp-{os.getpid()}"
+    with open(tmp, "w") as f:
+        json.dump(sorted(outputs), f)
+    os.replace(tmp, manifest_path)
+    return removed
+
+def tree_files(path):
+    return {os.path.relpath(os.path.join(root, name), path) for root, dirs, files in os.walk(path) for name in files}
+
+def sync_tree(src_dir, dst_dir):
+    """내용이 다른 파일만 복사 (변경 없는 파일은 mtime 유지 → 불필요한 재컴파일 방지)"""
+    copied = 0
+    for root, dirs, files in os.walk(src_dir):
+        for name in files:
+            src_path = os.path.join(root, name)
+            dst_path = os.path.join(dst_dir, os.path.relpath(src_path, src_dir))
+            if os.path.exists(dst_path) and os.path.getsize(dst_path) == os.path.getsize(src_path) \
+                    and hash_file(dst_path) == hash_file(src_path):
+                continue
+            os.makedirs(os.path.dirname(dst_path), exist_ok=True)
+            tmp_path = f"{dst_path}.tmp-{os.getpid()}"
+            shutil.copyfile(src_path, tmp_path)
+            os.replace(tmp_path, dst_path)
+            copied += 1
+    return copied
+
+def redirect_output(args, project_file, tmp_output):
+    """출력 디렉토리를 임시 디렉토리로 바꾼 인자 목록"""
+    new_args = []
+    for arg in args:
+        if arg.startswith("--output-directory="):
+            arg = f"--output-directory={tmp_output}"
+        elif project_file and arg == f"--project-file={project_file}":
+            redirected = os.path.join(tmp_output, ".project.txt")
+            with open(project_file, "r") as src, open(redirected, "w") as dst:
+                for line in src:
+                    if line.split("=", 1)[0].strip() == "output-directory":
+                        line = f"output-directory = {tmp_output}\n"
+                    dst.write(line)
+            arg = f"--project-file={redirected}"
+        new_args.append(arg)
+    return new_args
+
+def run_cached(shiboken, args, prefix=()):
+    """prefix는 CMake가 shiboken 앞에 붙인 명령 (예: cmake -E env LD_LIBRARY_PATH=...)"""
+    command = list(prefix) + [shiboken]
+    parsed = parse_arguments(args)
+    output_dir, project_file = parsed["output_dir"], parsed["project_file"]
+    if not output_dir or os.environ.get("PYSIDE6_SHIBOKEN_CACHE", "1") != "1":
+        return subprocess.call(command + args)
+
+    key = compute_cache_key(shiboken, args, parsed)
+    entry = os.path.join(CACHE_DIR, key)
+    manifest_path = output_manifest_path(output_dir, args, project_file)
+
+    if os.path.isdir(entry):
+        copied = sync_tree(entry, output_dir)
+        removed = remove_stale_outputs(output_dir, manifest_path, tree_files(entry))
+        record_entry(entry)
+        print(f"♻️  shiboken cache hit {key[:12]}: {copied} file(s) updated, {removed} stale removed in {output_dir}")
+        return 0
+
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    tmp_output = tempfile.mkdtemp(prefix=f"{key[:12]}.", dir=CACHE_DIR)
+    try:
+        returncode = subprocess.call(command + redirect_output(args, project_file, tmp_output))
+        if returncode != 0:
+            return returncode
+
+        project_copy = os.path.join(tmp_output, ".project.txt")
+        if os.path.exists(project_copy):
+            os.remove(project_copy)
+
+        copied = sync_tree(tmp_output, output_dir)
+        removed = remove_stale_outputs(output_dir, manifest_path, tree_files(tmp_output))
+        print(f"🗄️  shiboken cache miss {key[:12]}: generated {copied} file(s), {removed} stale removed in {output_dir}")
+
+        # 동시에 같은 키를 만든 경우 먼저 rename 한 쪽이 사용됨
+        try:
+            os.rename(tmp_output, entry)
+            tmp_output = None
+            record_entry(entry, directory_size(entry))
+            prune_cache()
+        except OSError:
+            pass
+        return 0
+    finally:
+        if tmp_output:
+            shutil.rmtree(tmp_output, ignore_errors=True)
+
+def launch(command):
+    """RULE_LAUNCH_CUSTOM launcher: shiboken6 실행이면 캐시를 거치고, 아니면 그대로 실행"""
+    for index, arg in enumerate(command):
+        if os.path.basename(arg) in GENERATOR_NAMES and os.path.isfile(arg):
+            return run_cached(arg, command[index + 1:], command[:index])
+    os.execvp(command[0], command)
+
+def write_cmake_include(path):
+    """setup.py --cmake-args=-DCMAKE_PROJECT_INCLUDE=<path> 로 넘길 CMake 파일 생성"""
+    launcher = " ".join(shlex.quote(part) for part in (sys.executable, os.path.abspath(__file__), "launch"))
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w") as f:
+        f.write("# Generated by shiboken_cache.py - route custom commands (shiboken6) through the generation cache\n")
+        f.write(f'set_property(GLOBAL PROPERTY RULE_LAUNCH_CUSTOM "{launcher}")\n')
+    return path
+
+def main():
+    if len(sys.argv) < 3:
+        print(__doc__.strip())
+        return 1
+    if sys.argv[1] == "launch":
+        return launch(sys.argv[2:])
+    if sys.argv[1] == "cmake-include":
+        print(write_cmake_include(sys.argv[2]))
+        return 0
+    return run_cached(sys.argv[1], sys.argv[2:])
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+PySide6 Smoke Test Matrix
+(Python 버전 × 모듈) 조합마다 별도 인터프리터 프로세스로 import/기능 테스트를 병렬 실행하고
+JUnit XML / JSON 결과 파일을 남기는 도구
+
+Usage: smoke_matrix.py <install_root> <python_version>=<python_exe> [...] [--output <dir>]
+"""
+
+import glob
+import json
+import os
+import subprocess
+import sys
+import time
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+
+# 테스트 하나당 제한 시간 (초)
+TEST_TIMEOUT = float(os.environ.get("PYSIDE6_SMOKE_TIMEOUT", "60"))
+
+# 동시에 실행할 테스트 프로세스 수
+MAX_WORKERS = int(os.environ.get("PYSIDE6_SMOKE_WORKERS", str(os.cpu_count() or 4)))
+
+# import 외에 추가로 실행하는 기능 테스트 (offscreen QPA 기준)
+FEATURE_CHECKS = {
+    "QtCore": """
+from PySide6.QtCore import QCoreApplication, QTimer, QObject, Signal
+app = QCoreApplication([])
+class Emitter(QObject):
+    fired = Signal(int)
+received = []
+emitter = Emitter()
+emitter.fired.connect(received.append)
+emitter.fired.emit(42)
+assert received == [42], received
+QTimer.singleShot(0, app.quit)
+app.exec()
+""",
+    "QtGui": """
+from PySide6.QtGui import QGuiApplication, QImage, QColor
+app = QGuiApplication([])
+image = QImage(16, 16, QImage.Format_ARGB32)
+image.fill(QColor(255, 0, 0))
+assert image.pixelColor(0, 0).red() == 255
+""",
+    "QtWidgets": """
+from PySide6.QtWidgets import QApplication, QWidget, QPushButton
+app = QApplication([])
+widget = QWidget()
+button = QPushButton("ok", widget)
+widget.show()
+app.processEvents()
+assert button.text() == "ok"
+""",
+    "QtQml": """
+from PySide6.QtCore import QCoreApplication
+from PySide6.QtQml import QQmlEngine, QQmlComponent
+app = QCoreApplication([])
+engine = QQmlEngine()
+component = QQmlComponent(engine)
+component.setData(b"import QtQml\\nQtObject { property int value: 7 }", None)
+obj = component.create()
+assert obj is not None and obj.property("value") == 7, component.errors()
+""",
+    "QtNetwork": """
+from PySide6.QtNetwork import QHostAddress
+assert QHostAddress("127.0.0.1").isLoopback()
+""",
+    "QtSvg": """
+from PySide6.QtSvg import QSvgRenderer
+from PySide6.QtCore import QByteArray
+renderer = QSvgRenderer(QByteArray(b'<svg xmlns="http://www.w3.org/2000/svg" width="4" height="4"/>'))
+assert renderer.isValid()
+""",
+}
+
+def discover_modules(site_packages):
+    """설치된 PySide6 바인딩 모듈 이름 목록 (QtCore.abi3.so → QtCore)"""
+    modules = set()
+    for path in glob.glob(os.path.join(site_packages, "PySide6", "Qt*.so")):
+        modules.add(os.path.basename(path).split(".", 1)[0])
+    return sorted(modules)
+
+def test_source(module):
+    return f"import PySide6.{module}\n" + FEATURE_CHECKS.get(module, "")
+
+def run_test(python_version, python_exe, site_packages, module, timeout=None):
+    """하나의 (버전, 모듈) 테스트 실행 결과 딕셔너리"""
+    env = os.environ.copy()
+    env["PYTHONPATH"] = f"{site_packages}:{env.get('PYTHONPATH', '')}"
+    env["QT_QPA_PLATFORM"] = "offscreen"
+    env["PYTHONDONTWRITEBYTECODE"] = "1"
+
+    result = {"python": python_version, "module": module, "status": "passed", "message": "", "output": ""}
+    start = time.perf_counter()
+    try:
+        process = subprocess.run([python_exe, "-c", test_source(module)], env=env,
+                                 capture_output=True, text=True, timeout=timeout or TEST_TIMEOUT)
+        result["output"] = (process.stdout + process.stderr)[-4000:]
+        if process.returncode != 0:
+            lines = process.stderr.strip().splitlines()
+            result["status"] = "failed"
+            result["message"] = lines[-1] if lines else f"exit code {process.returncode}"
+    except subprocess.TimeoutExpired:
+        result["status"] = "error"
+        result["message"] = f"timed out after {timeout or TEST_TIMEOUT:.0f}s"
+    result["time"] = round(time.perf_counter() - start, 3)
+    return result
+
+def run_matrix(interpreters, modules=None, workers=None, timeout=None):
+    """interpreters: [(python_version, python_exe, site_packages)] → 결과 목록
+
+    modules를 지정하지 않으면 각 site-packages에 설치된 모듈을 모두 테스트
+    """
+    cases = []
+    for python_version, python_exe, site_packages in interpreters:
+        for module in modules or discover_modules(site_packages) or ["QtCore"]:
+            cases.append((python_version, python_exe, site_packages, module))
+
+    # 각 테스트는 별도 인터프리터 프로세스이므로 스레드는 대기만 함
+    with ThreadPoolExecutor(max_workers=workers or MAX_WORKERS) as executor:
+        return list(executor.map(lambda case: run_test(*case, timeout=timeout), cases))
+
+def summarize_matrix(results):
+    summary = {"total": len(results), "passed": 0, "failed": 0, "error": 0}
+    for result in results:
+        summary[result["status"]] += 1
+    return summary
+
+def write_junit(results, path):
+    suites = ET.Element("testsuites")
+    by_python = {}
+    for result in results:
+        by_python.setdefault(result["python"], []).append(result)
+
+    for python_version, cases in sorted(by_python.items()):
+        summary = summarize_matrix(cases)
+        suite = ET.SubElement(suites, "testsuite", name=f"pyside6.python{python_version}",
+                              tests=str(summary["total"]), failures=str(summary["failed"]),
+                              errors=str(summary["error"]), time=f"{sum(c['time'] for c in cases):.3f}")
+        for case in cases:
+            element = ET.SubElement(suite, "testcase", classname=f"python{python_version}",
+                                    name=case["module"], time=f"{case['time']:.3f}")
+            if case["status"] != "passed":
+                child = ET.SubElement(element, "failure" if case["status"] == "failed" else "error",
+                                      message=case["message"])
+                child.text = case["output"]
+
+    ET.ElementTree(suites).write(path, encoding="utf-8", xml_declaration=True)
+
+def write_results(results, output_dir, name="smoke_test_results"):
+    """JSON과 JUnit XML 결과 파일을 쓰고 경로 반환"""
+    os.makedirs(output_dir, exist_ok=True)
+    json_path = os.path.join(output_dir, f"{name}.json")
+    junit_path = os.path.join(output_dir, f"{name}.xml")
+    with open(json_path, "w") as f:
+        json.dump({"summary": summarize_matrix(results), "results": results}, f, indent=2)
+    write_junit(results, junit_path)
+    return json_path, junit_path
+
+def main():
+    args = sys.argv[1:]
+    if len(args) < 2:
+        print(__doc__.strip())
+        return 1
+
+    install_root = args.pop(0)
+    output_dir = os.getcwd()
+    interpreters = []
+    while args:
+        item = args.pop(0)
+        if item == "--output" and args:
+            output_dir = args.pop(0)
+        elif "=" in item:
+            python_version, python_exe = item.split("=", 1)
+            major_minor = ".".join(python_version.split(".")[:2])
+            interpreters.append((python_version, python_exe,
+                                 os.path.join(install_root, "lib", f"python{major_minor}", "site-packages")))
+
+    start = time.perf_counter()
+    results = run_matrix(interpreters)
+    for result in results:
+        if result["status"] != "passed":
+            print(f"❌ Python {result['python']} {result['module']}: {result['message']}")
+
+    summary = summarize_matrix(results)
+    json_path, junit_path = write_results(results, output_dir)
+    print(f"🧪 {summary['passed']}/{summary['total']} passed in {time.perf_counter() - start:.1f}s "
+          f"({summary['failed']} failed, {summary['error']} errors)")
+    print(f"📄 Results: {json_path}, {junit_path}")
+    return 0 if summary["passed"] == summary["total"] else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# 빌드 스크립트들은 패키지가 아니라 저장소 루트의 모듈이므로 루트를 import 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
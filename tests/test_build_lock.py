@@ -0,0 +1,42 @@
+import os
+import subprocess
+import sys
+import threading
+
+import build_lock
+
+def _lock(build_root, **kwargs):
+    return build_lock.BuildLock(str(build_root), "6.9.1", ["install"], log=lambda message: None, **kwargs)
+
+def test_lock_file_is_created_with_owner(tmp_path):
+    first, second = _lock(tmp_path), _lock(tmp_path)
+
+    assert first._try_create()
+    assert not second._try_create()
+    assert build_lock.read_owner(str(tmp_path))["id"] == first.owner["id"]
+    assert sorted(os.listdir(tmp_path)) == [build_lock.LOCK_NAME]
+
+def test_break_lock_only_removes_expected_owner(tmp_path):
+    lock = _lock(tmp_path)
+    lock._try_create()
+
+    # 내용을 읽을 수 없는 잠금(None)을 지우려던 프로세스는 새로 만든 잠금을 건드리지 않음
+    assert not build_lock.break_lock(str(tmp_path), None)
+    assert not build_lock.break_lock(str(tmp_path), "other-owner")
+    assert build_lock.break_lock(str(tmp_path), lock.owner["id"])
+    assert build_lock.read_owner(str(tmp_path)) is None
+
+def test_heartbeat_command_aborts_build_when_lock_disappears(tmp_path, monkeypatch):
+    build = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+    try:
+        assert _lock(tmp_path, pid=build.pid).acquire(heartbeat=False)[0] == "acquired"
+        monkeypatch.setattr(build_lock, "HEARTBEAT_INTERVAL", 0.05)
+        monkeypatch.setattr(sys, "argv", ["build_lock.py", "heartbeat", str(tmp_path), "--pid", str(build.pid)])
+        threading.Timer(0.2, os.remove, [build_lock.lock_path(str(tmp_path))]).start()
+
+        assert build_lock.main() == 1
+        assert build.wait(timeout=5) != 0
+    finally:
+        if build.poll() is None:
+            build.kill()
+            build.wait()
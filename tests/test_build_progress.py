@@ -0,0 +1,41 @@
+import rezbuild
+from build_progress import ProgressBoard
+
+
+def make_board(monkeypatch, history=None):
+    board = ProgressBoard(log=lambda message: None, interval=0,
+                          history_loader=(lambda version: history.get(version, {})) if history else None)
+    monkeypatch.setattr(rezbuild, "_build_progress", board)
+    return board
+
+
+def test_registered_full_version_shares_tracker_with_build_key(monkeypatch):
+    board = make_board(monkeypatch)
+    rezbuild.register_build_progress(["3.13.2", "3.12.10"])
+    assert board.status_line() == "3.13 waiting | 3.12 waiting"
+
+    rezbuild.restart_build_progress("3.13")
+    board.feed("3.13", "[1/4] Building CXX object CMakeFiles/QtCore.dir/a.cpp.o\n")
+    rezbuild.close_build_progress("3.13", True)
+
+    assert list(board.trackers) == ["3.13", "3.12"]
+    assert board.status_line().startswith("3.13 ✅ done")
+    assert board.status_line().endswith("| 3.12 waiting")
+
+
+def test_history_is_loaded_with_major_minor_key(monkeypatch):
+    history = {"3.13": {"QtCore": {"seconds": 100.0, "edges": 10}}}
+    board = make_board(monkeypatch, history)
+    rezbuild.register_build_progress(["3.13.2"])
+    assert board.trackers["3.13"].history == history["3.13"]
+
+
+def test_restart_clears_previous_attempt():
+    board = ProgressBoard(log=lambda message: None, interval=0)
+    board.feed("3.13", "[3/10] CMakeFiles/QtCore.dir/a.cpp.o\n")
+    board.close("3.13", ok=False)
+    board.restart("3.13")
+    tracker = board.trackers["3.13"]
+    assert tracker.module_edges == {}
+    assert (tracker.finished, tracker.total, tracker.previous_edges) == (0, 0, 0)
+    assert tracker.status_line() == "3.13 waiting"
@@ -0,0 +1,13 @@
+import os
+
+import compiler_cache
+
+def test_base_dir_covers_source_and_setup_build_tree(tmp_path):
+    source = tmp_path / "source" / "pyside-setup"
+    source.mkdir(parents=True)
+    base_dir = compiler_cache.compiler_cache_base_dir(str(source))
+
+    build_dir = os.path.realpath(source / ".." / "build" / "qfp-py3.13-qt6.9.1-64bit-release")
+    assert base_dir == os.path.realpath(tmp_path / "source")
+    assert os.path.commonpath([base_dir, build_dir]) == base_dir
+    assert os.path.commonpath([base_dir, os.path.realpath(source)]) == base_dir
@@ -0,0 +1,46 @@
+import subprocess
+import sys
+
+import pytest
+
+import rezbuild
+
+def test_match_error_lines_deduplicates_by_fingerprint():
+    fingerprints = {}
+    text = ("[12:00:01] fatal error: stdbool.h: No such file or directory\n"
+            "[12:00:02] fatal error: stdbool.h: No such file or directory\n"
+            "-- Could NOT find Python3 (missing: Python3_INCLUDE_DIRS)\n")
+    records = rezbuild.match_error_lines(text, fingerprints)
+
+    assert [record["rule"] for record in records] == ["stdbool_header", "python_not_found"]
+    assert records[0]["count"] == 2
+    assert rezbuild.match_error_lines(text, fingerprints) == []
+
+def test_match_error_lines_records_location():
+    records = rezbuild.match_error_lines(
+        "qtcore_wrapper.cpp:42:10: fatal error: 'stdbool.h' file not found\n", {})
+    assert (records[0]["file"], records[0]["line"]) == ("qtcore_wrapper.cpp", 42)
+
+def test_stream_cmd_keeps_error_records_per_command(monkeypatch):
+    monkeypatch.setattr(rezbuild, "log_output", lambda line: None)
+    monkeypatch.setattr(rezbuild, "smart_log", lambda *args, **kwargs: None)
+    script = "print('-- Could NOT find Python3'); raise SystemExit(1)"
+    with pytest.raises(subprocess.CalledProcessError) as failed:
+        rezbuild.stream_cmd([sys.executable, "-c", script])
+    ok = rezbuild.stream_cmd([sys.executable, "-c", "print('fatal error: stdbool.h: No such file or directory')"])
+
+    assert [record["rule"] for record in failed.value.error_records] == ["python_not_found"]
+    assert [record["rule"] for record in ok.error_records] == ["stdbool_header"]
+
+def test_fixes_are_applied_once_per_build(monkeypatch):
+    calls = []
+    monkeypatch.setitem(rezbuild._error_fixers, "stdbool_header", lambda: calls.append(1) or 1)
+    monkeypatch.setattr(rezbuild, "smart_log", lambda *args, **kwargs: None)
+    records = rezbuild.match_error_lines("fatal error: stdbool.h: No such file or directory\n", {})
+
+    first_build, second_build = set(), set()
+    assert rezbuild.analyze_and_fix_errors(records, first_build)
+    assert not rezbuild.analyze_and_fix_errors(records, first_build)
+    # 같은 에러라도 다른 빌드는 자기 빌드 환경에 수정을 다시 반영해야 함
+    assert rezbuild.analyze_and_fix_errors(records, second_build)
+    assert len(calls) == 2
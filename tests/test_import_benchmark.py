@@ -0,0 +1,15 @@
+import import_benchmark
+
+def _results(**medians):
+    return {"interpreters": {"3.13": {name: {"warm": {"median": median}} for name, median in medians.items()}}}
+
+def test_find_regressions_reports_slower_modules_only(monkeypatch):
+    monkeypatch.setattr(import_benchmark, "REGRESSION_PERCENT", 20.0)
+    monkeypatch.setattr(import_benchmark, "REGRESSION_MIN_MS", 5.0)
+    baseline = _results(QtCore=50.0, QtGui=100.0, QtWidgets=10.0)
+    current = _results(QtCore=70.0, QtGui=105.0, QtWidgets=14.0, QtQml=30.0)
+
+    assert import_benchmark.find_regressions(current, baseline) == [("3.13", "QtCore", 50.0, 70.0, 40.0)]
+
+def test_find_regressions_without_baseline():
+    assert import_benchmark.find_regressions(_results(QtCore=70.0), None) == []
@@ -0,0 +1,59 @@
+import os
+
+import install_manifest
+import rezbuild
+
+def _fake_build_tree(src):
+    build_dir = rezbuild.pyside_build_dir(str(src), "3.13")
+    for rel, content in (("libpyside/libpyside6.abi3.so.6.9.1", "lib"),
+                         ("PySide6/QtCore.abi3.so", "core"),
+                         ("PySide6/__init__.py", "init"),
+                         ("PySide6/support/signature.py", "sig")):
+        path = os.path.join(build_dir, rel)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            f.write(content)
+    os.rename(os.path.join(build_dir, "libpyside", "libpyside6.abi3.so.6.9.1"),
+              os.path.join(build_dir, "libpyside", "libpyside6.abi3.so"))
+    return build_dir
+
+def test_copy_missing_libraries_records_manifest(tmp_path):
+    src = tmp_path / "source" / "pyside-setup"
+    install_root = tmp_path / "install"
+    (install_root / "lib").mkdir(parents=True)
+    (install_root / "lib" / "libpyside6.abi3.so.6.9.1").write_text("lib")
+    _fake_build_tree(src)
+
+    rezbuild.copy_missing_libraries(str(src), str(tmp_path), str(install_root), "3.13")
+
+    entries = install_manifest.load_manifest(str(install_root))
+    assert {"lib/libpyside6.abi3.so", "lib/libpyside6.abi3.so.6",
+            "lib/python3.13/site-packages/PySide6/QtCore.abi3.so",
+            "lib/python3.13/site-packages/PySide6/support/signature.py"} <= set(entries)
+    assert install_manifest.verify_manifest(str(install_root)) == []
+
+def test_stamped_site_packages_are_recorded_and_linked(tmp_path):
+    install_root = tmp_path / "install"
+    base = install_root / "lib" / "python3.9" / "site-packages"
+    target = install_root / "lib" / "python3.13" / "site-packages"
+    (base / "PySide6").mkdir(parents=True)
+    (base / "PySide6" / "QtCore.abi3.so").write_text("core")
+
+    rezbuild.stamp_abi3_site_packages(str(install_root), str(base), str(target), "3.13")
+
+    stamped = target / "PySide6" / "QtCore.abi3.so"
+    assert os.path.samefile(stamped, base / "PySide6" / "QtCore.abi3.so")
+    entries = install_manifest.load_manifest(str(install_root))
+    assert entries["lib/python3.13/site-packages/PySide6/QtCore.abi3.so"][install_manifest.COMPONENT] == "abi3-stamp-py3.13"
+
+def test_manifest_mismatch_fails_verification(tmp_path, monkeypatch):
+    monkeypatch.setattr(rezbuild, "smart_log", lambda *args, **kwargs: None)
+    install_root = tmp_path / "install"
+    source = tmp_path / "module.py"
+    source.write_text("original")
+    manifest = install_manifest.InstallManifest(str(install_root), "test")
+    manifest.install_file(str(source), str(install_root / "module.py"))
+    manifest.commit()
+
+    (install_root / "module.py").write_text("overwritten outside the manifest")
+    assert rezbuild.verify_installation(str(install_root), {"total": 1, "passed": 1}) is False
@@ -0,0 +1,40 @@
+import job_throttle
+import rezbuild
+
+def test_launchers_are_passed_as_cmake_defines(tmp_path, monkeypatch):
+    monkeypatch.setattr(rezbuild, "_shiboken_generation_cache", False)
+    env = job_throttle.throttle_environment(str(tmp_path), {"CMAKE_CXX_COMPILER_LAUNCHER": "/usr/bin/ccache"})
+
+    args = rezbuild.setup_cmake_args(str(tmp_path), env)
+
+    assert len(args) == 1 and args[0].startswith("--cmake-args=")
+    defines = dict(define[2:].split("=", 1) for define in args[0][len("--cmake-args="):].split())
+    assert set(defines) == {"CMAKE_C_COMPILER_LAUNCHER", "CMAKE_CXX_COMPILER_LAUNCHER",
+                            "CMAKE_C_LINKER_LAUNCHER", "CMAKE_CXX_LINKER_LAUNCHER"}
+    assert defines["CMAKE_CXX_COMPILER_LAUNCHER"].endswith("run;compile;/usr/bin/ccache")
+    assert defines["CMAKE_C_LINKER_LAUNCHER"].endswith("run;link")
+
+def test_no_cmake_args_without_launchers(tmp_path, monkeypatch):
+    monkeypatch.setattr(rezbuild, "_shiboken_generation_cache", False)
+    assert rezbuild.setup_cmake_args(str(tmp_path), {}) == []
+
+def test_compute_limits_prefers_link_jobs_and_scales_up_gradually(tmp_path, monkeypatch):
+    monkeypatch.setattr(job_throttle, "MEMORY_RESERVE_GB", 2.0)
+    throttle = job_throttle.MemoryThrottle(str(tmp_path), max_compile=32, max_link=4, log=lambda message: None)
+    throttle.job_memory = {"compile": 1.0, "link": 4.0}
+
+    limits = throttle.compute_limits(18.0, {"link": (0, None), "compile": (0, None)})
+    assert limits == {"link": 4, "compile": 1}
+
+    throttle.limits = {"link": 4, "compile": 8}
+    limits = throttle.compute_limits(42.0, {"link": (0, None), "compile": (8, None)})
+    assert limits["compile"] == 10
+
+def test_compute_limits_uses_observed_rss(tmp_path, monkeypatch):
+    monkeypatch.setattr(job_throttle, "MEMORY_RESERVE_GB", 0.0)
+    throttle = job_throttle.MemoryThrottle(str(tmp_path), max_compile=64, max_link=1, log=lambda message: None)
+    throttle.job_memory = {"compile": 1.0, "link": 4.0}
+
+    limits = throttle.compute_limits(14.0, {"link": (1, 2.0), "compile": (0, 2.0)})
+    # link: 여유 14 GiB / 2.5 GiB 이지만 최대 1개, compile: 남은 14 GiB / 2.5 GiB
+    assert limits == {"link": 1, "compile": 5}
@@ -0,0 +1,35 @@
+import ninja_log_analyzer
+
+def _write_log(build_dir, *sessions):
+    lines = ["# ninja log v5"]
+    for session in sessions:
+        lines += ["\t".join(str(field) for field in entry) for entry in session]
+    (build_dir / ".ninja_log").write_text("\n".join(lines) + "\n")
+
+def test_read_ninja_log_keeps_last_session(tmp_path):
+    _write_log(tmp_path,
+               [(0, 5000, 0, "old.o", "aa")],
+               [(0, 1000, 0, "a.o", "h1"), (0, 2000, 0, "b.o", "h2"), (2000, 3000, 0, "b.o", "h3")])
+    entries = ninja_log_analyzer.read_ninja_log(str(tmp_path))
+
+    assert [entry["output"] for entry in entries] == ["a.o", "b.o"]
+    assert (entries[1]["start"], entries[1]["end"]) == (2.0, 3.0)
+
+def test_read_ninja_log_merges_multi_output_edges(tmp_path):
+    _write_log(tmp_path, [(0, 4000, 0, "QtCore/qtcore_module_wrapper.cpp", "gen"),
+                          (0, 4000, 0, "QtCore/qobject_wrapper.cpp", "gen")])
+    entries = ninja_log_analyzer.read_ninja_log(str(tmp_path))
+
+    assert len(entries) == 1
+    assert entries[0]["outputs"] == ["QtCore/qtcore_module_wrapper.cpp", "QtCore/qobject_wrapper.cpp"]
+
+def test_peak_parallelism_treats_back_to_back_jobs_as_sequential():
+    entries = [{"start": 0.0, "end": 1.0}, {"start": 1.0, "end": 2.0},
+               {"start": 1.5, "end": 3.0}, {"start": 1.5, "end": 2.5}]
+    assert ninja_log_analyzer.peak_parallelism(entries) == 3
+
+def test_module_of_attributes_objects_and_link_outputs():
+    assert ninja_log_analyzer.module_of("sources/pyside6/PySide6/QtCore/CMakeFiles/QtCore.dir/qobject_wrapper.cpp.o") == "QtCore"
+    assert ninja_log_analyzer.module_of("lib/QtWidgets.abi3.so") == "QtWidgets"
+    assert ninja_log_analyzer.module_of("libpyside/libpyside6.abi3.so.6.9.1") == "pyside6"
+    assert ninja_log_analyzer.module_of("build.ninja") == "other"
@@ -0,0 +1,31 @@
+import os
+
+import relink_rpath
+
+def test_plan_runpath_uses_origin_inside_install_root(tmp_path, monkeypatch):
+    monkeypatch.setattr(relink_rpath, "DEPENDENCY_LIB_DIRS", [str(tmp_path / "qt" / "lib")])
+    monkeypatch.setattr(relink_rpath, "SYSTEM_LIB_DIRS", [])
+    install_root = str(tmp_path / "install")
+    module = os.path.join(install_root, "lib", "python3.13", "site-packages", "PySide6", "QtCore.abi3.so")
+    for path in (os.path.join(install_root, "lib", "libpyside6.abi3.so.6.9"),
+                 str(tmp_path / "qt" / "lib" / "libQt6Core.so.6")):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        open(path, "w").close()
+
+    runpath, unresolved = relink_rpath.plan_runpath(
+        module, ["libpyside6.abi3.so.6.9", "libQt6Core.so.6", "libc.so.6", "libmissing.so"],
+        install_root, {}, {"libc.so.6"})
+
+    assert runpath == f"$ORIGIN/../../..:{tmp_path / 'qt' / 'lib'}"
+    assert unresolved == ["libmissing.so"]
+
+def test_plan_runpath_falls_back_to_install_tree_index(tmp_path, monkeypatch):
+    monkeypatch.setattr(relink_rpath, "DEPENDENCY_LIB_DIRS", [])
+    install_root = str(tmp_path / "install")
+    module = os.path.join(install_root, "lib", "python3.13", "site-packages", "PySide6", "QtQml.abi3.so")
+    qml_dir = os.path.join(install_root, "lib", "python3.13", "site-packages", "PySide6", "Qt", "lib")
+
+    runpath, unresolved = relink_rpath.plan_runpath(
+        module, ["libpyside6qml.abi3.so.6.9"], install_root, {"libpyside6qml.abi3.so.6.9": [qml_dir]}, set())
+
+    assert (runpath, unresolved) == ("$ORIGIN/Qt/lib", [])
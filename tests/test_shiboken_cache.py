@@ -0,0 +1,71 @@
+import os
+
+import shiboken_cache
+
+def _project(tmp_path):
+    """typesystem XML + glue 파일 + 헤더와, 그 옆에 생성된 wrapper가 쌓이는 build 디렉토리"""
+    source = tmp_path / "src"
+    build = tmp_path / "build" / "qfp-py3.13-release"
+    (source / "glue").mkdir(parents=True)
+    build.mkdir(parents=True)
+    (source / "typesystem_core.xml").write_text(
+        '<typesystem package="QtCore"><load-typesystem name="typesystem_common.xml" generate="no"/>'
+        '<inject-code file="glue/qtcore.cpp" snippet="x"/></typesystem>')
+    (source / "typesystem_common.xml").write_text("<typesystem/>")
+    (source / "glue" / "qtcore.cpp").write_text("// snippet x")
+    (source / "global.h").write_text('#include "qobject.h"\n#include <vector>\n')
+    (source / "qobject.h").write_text("class QObject;")
+    generator = tmp_path / "shiboken6"
+    generator.write_text("")
+    args = [
+        f"--output-directory={build}",
+        f"--typesystem-paths={source}{os.pathsep}{build}",
+        f"--include-paths={source}{os.pathsep}{build}",
+        str(source / "global.h"),
+        str(source / "typesystem_core.xml"),
+    ]
+    return source, build, str(generator), args
+
+def _key(generator, args):
+    return shiboken_cache.compute_cache_key(generator, args, shiboken_cache.parse_arguments(args))
+
+def test_generated_files_in_search_paths_do_not_change_key(tmp_path, monkeypatch):
+    monkeypatch.setattr(shiboken_cache, "CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(shiboken_cache, "DIGEST_MEMO", str(tmp_path / "cache" / "memo.json"))
+    source, build, generator, args = _project(tmp_path)
+    before = _key(generator, args)
+
+    (build / "qobject_wrapper.cpp").write_text("// generated")
+    (source / "unrelated.h").write_text("// not referenced")
+    assert _key(generator, args) == before
+
+def test_referenced_inputs_change_key(tmp_path, monkeypatch):
+    monkeypatch.setattr(shiboken_cache, "CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(shiboken_cache, "DIGEST_MEMO", str(tmp_path / "cache" / "memo.json"))
+    source, build, generator, args = _project(tmp_path)
+    keys = {_key(generator, args)}
+
+    for path in ("glue/qtcore.cpp", "typesystem_common.xml", "qobject.h"):
+        (source / path).write_text((source / path).read_text() + "\n// changed")
+        keys.add(_key(generator, args))
+    assert len(keys) == 4
+
+def test_build_directory_name_is_normalized(tmp_path, monkeypatch):
+    monkeypatch.setattr(shiboken_cache, "CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(shiboken_cache, "DIGEST_MEMO", str(tmp_path / "cache" / "memo.json"))
+    source, build, generator, args = _project(tmp_path)
+    other = [arg.replace("qfp-py3.13-", "qfp-py3.9-") for arg in args]
+    assert _key(generator, args) == _key(generator, other)
+
+def test_prune_removes_least_recently_used(tmp_path, monkeypatch):
+    monkeypatch.setattr(shiboken_cache, "CACHE_DIR", str(tmp_path))
+    for index, name in enumerate(("old", "used", "new")):
+        entry = tmp_path / name
+        entry.mkdir()
+        (entry / "wrapper.cpp").write_text("x" * 100)
+        shiboken_cache.record_entry(str(entry), shiboken_cache.directory_size(str(entry)))
+        os.utime(str(entry) + shiboken_cache.ENTRY_SIZE_SUFFIX, (index, index))
+    shiboken_cache.record_entry(str(tmp_path / "old"))   # hit → 가장 최근 사용
+
+    assert shiboken_cache.prune_cache(max_bytes=200) == 1
+    assert sorted(p.name for p in tmp_path.iterdir() if p.is_dir()) == ["new", "old"]